@@ -0,0 +1,130 @@
+"""Benchmark the JSON codecs on `roleData` and `exploreIndex` responses.
+
+The responses are built to match the shape and size of real responses, with the payload nested as a JSON
+string inside the envelope, the same way `request_api` receives it with `need_decrypt=True`.
+
+Usage:
+    python benchmarks/bench_codec.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Dict, List
+
+from kuronet.models.mc.chronicle.explorer import MCExplorer
+from kuronet.models.mc.chronicle.role import MCRoles
+from kuronet.utils.codec import get_json_codec
+
+BACKENDS = ("json", "msgspec", "orjson")
+
+
+def make_role_data(count: int = 40) -> Dict[str, Any]:
+    roles = [
+        {
+            "roleId": 1102 + index,
+            "level": 90,
+            "roleName": f"角色{index}",
+            "roleIconUrl": f"https://web-static.kurobbs.com/adminConfig/{index}/roleIcon/{index:032x}.png",
+            "rolePicUrl": f"https://web-static.kurobbs.com/adminConfig/{index}/rolePic/{index:032x}.png",
+            "starLevel": 4 + index % 2,
+            "attributeId": index % 6 + 1,
+            "attributeName": "衍射",
+            "weaponTypeId": index % 5 + 1,
+            "weaponTypeName": "迅刀",
+            "acronym": f"js{index}",
+        }
+        for index in range(count)
+    ]
+    return {"roleList": roles, "showToGuest": True}
+
+
+def make_explore_index(countries: int = 3, areas: int = 12, items: int = 8) -> Dict[str, Any]:
+    def area(country: int, index: int) -> Dict[str, Any]:
+        return {
+            "areaId": country * 100 + index,
+            "areaName": f"区域{index}",
+            "areaPic": f"https://web-static.kurobbs.com/gamerdata/area/{country}/{index}.png",
+            "areaProgress": 87,
+            "itemList": [
+                {
+                    "type": item,
+                    "name": f"收集品{item}",
+                    "progress": 100 - item,
+                    "icon": f"https://web-static.kurobbs.com/gamerdata/item/{item}.png",
+                }
+                for item in range(items)
+            ],
+        }
+
+    explore_list = [
+        {
+            "areaInfoList": [area(country, index) for index in range(areas)],
+            "country": {
+                "bgColor": "#1D2B38",
+                "countryId": country,
+                "countryName": f"国家{country}",
+                "detailPageAreaMaskColor": "#0B141B",
+                "detailPageAreaPic": f"https://web-static.kurobbs.com/gamerdata/country/{country}/mask.png",
+                "detailPageDarkColor": "#0F1A22",
+                "detailPageFontColor": "#FFFFFF",
+                "detailPageImage": f"https://web-static.kurobbs.com/gamerdata/country/{country}/detail.png",
+                "detailPageLightColor": "#3D5467",
+                "detailPagePic": f"https://web-static.kurobbs.com/gamerdata/country/{country}/pic.png",
+                "detailPageProgressColor": "#E2C479",
+                "homePageIcon": f"https://web-static.kurobbs.com/gamerdata/country/{country}/icon.png",
+                "homePageImage": f"https://web-static.kurobbs.com/gamerdata/country/{country}/home.png",
+            },
+            "countryProgress": "84.3",
+        }
+        for country in range(countries)
+    ]
+    detections: List[Dict[str, Any]] = [
+        {
+            "detectionId": index,
+            "detectionName": f"声骸{index}",
+            "detectionIcon": f"https://web-static.kurobbs.com/gamerdata/detection/{index}.png",
+            "level": index % 4,
+            "levelName": "海啸级",
+            "acronym": f"sh{index}",
+        }
+        for index in range(60)
+    ]
+    return {"detectionInfoList": detections, "exploreList": explore_list, "open": True}
+
+
+def make_response(payload: Dict[str, Any]) -> bytes:
+    envelope = {"code": 200, "msg": "请求成功", "success": True, "data": json.dumps(payload, ensure_ascii=False)}
+    return json.dumps(envelope, ensure_ascii=False).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Number of decodes per measurement.")
+    args = parser.parse_args()
+
+    payloads = {
+        "roleData": (make_response(make_role_data()), MCRoles),
+        "exploreIndex": (make_response(make_explore_index()), MCExplorer),
+    }
+    for endpoint, (response, model) in payloads.items():
+        print(f"{endpoint} ({len(response)} bytes)")
+        baseline = None
+        for backend in BACKENDS:
+            try:
+                codec = get_json_codec(backend)
+            except ImportError:
+                print(f"  {backend:<8} not installed")
+                continue
+
+            def decode(codec=codec, response=response):
+                return codec.loads(codec.loads(response)["data"])
+
+            model(**decode())
+            elapsed = min(timeit.repeat(decode, number=args.number, repeat=5)) / args.number
+            baseline = baseline or elapsed
+            print(f"  {backend:<8} {elapsed * 1e6:8.1f} us/response  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare the memory retained by many `getRoleDetail` responses with and without the flyweight pool.
+
+Each response is decoded from its own JSON document, the way responses of different players arrive.
+
+Usage:
+    python benchmarks/bench_flyweight.py [--number N]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from typing import Any, Dict
+
+from bench_codec import make_role_data
+
+from kuronet.models.base import FlyweightPool, get_type_adapter, set_flyweight_pool
+from kuronet.models.mc.chronicle.role import MCRoleDetail
+
+
+def make_role_detail(index: int) -> Dict[str, Any]:
+    """Build the role detail of a player, sharing its descriptions with every other player."""
+    role = make_role_data()["roleList"][index % 40]
+    return {
+        "role": role,
+        "level": 90,
+        "chainList": [
+            {
+                "name": f"共鸣链{order}",
+                "order": order,
+                "description": f"共鸣链{order}的效果描述。" * 12,
+                "iconUrl": f"https://web-static.kurobbs.com/gamerdata/chain/{role['roleId']}/{order}.png",
+                "unlocked": order <= index % 7,
+            }
+            for order in range(1, 7)
+        ],
+        "weaponData": {
+            "weapon": {
+                "weaponId": 21050000 + index % 20,
+                "weaponName": "武器",
+                "weaponType": role["weaponTypeId"],
+                "weaponStarLevel": 5,
+                "weaponIcon": f"https://web-static.kurobbs.com/gamerdata/weapon/{index % 20}.png",
+                "weaponEffectName": "武器效果",
+                "effectDescription": "武器的效果描述。" * 20,
+            },
+            "level": 90,
+            "resonLevel": 1 + index % 5,
+        },
+        "phantomData": {"cost": 12, "equipPhantomList": None},
+        "skillList": [
+            {
+                "skill": {
+                    "id": role["roleId"] * 10 + skill,
+                    "type": "常态攻击",
+                    "name": f"技能{skill}",
+                    "description": f"技能{skill}的效果描述。" * 30,
+                    "iconUrl": f"https://web-static.kurobbs.com/gamerdata/skill/{role['roleId']}/{skill}.png",
+                },
+                "level": 1 + (index + skill) % 10,
+            }
+            for skill in range(5)
+        ],
+    }
+
+
+def retained(payloads) -> int:
+    adapter = get_type_adapter(MCRoleDetail)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        responses = [adapter.validate_json(payload) for payload in payloads]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        del responses
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000, help="Number of responses retained.")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(make_role_detail(index), ensure_ascii=False) for index in range(args.number)]
+    set_flyweight_pool(FlyweightPool(maxsize=0, string_maxsize=0))
+    disabled = retained(payloads)
+    pool = FlyweightPool()
+    set_flyweight_pool(pool)
+    enabled = retained(payloads)
+    print(f"getRoleDetail x {args.number}")
+    print(f"  without pool {disabled / args.number / 1024:7.1f} KiB/response")
+    print(f"  with pool    {enabled / args.number / 1024:7.1f} KiB/response  {disabled / enabled:4.2f}x")
+    print(f"  models  {pool.models.stats}")
+    print(f"  strings {pool.strings.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure the cold-start cost of importing kuronet.
+
+Every statement runs in a fresh interpreter, so nothing is shared between runs.
+
+Usage:
+    python benchmarks/bench_import.py [--number N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import kuronet": "import kuronet",
+    "from kuronet import Game": "from kuronet import Game",
+    "from kuronet import MCClient": "from kuronet import MCClient",
+    "MCClient()": "from kuronet import MCClient; MCClient()",
+    "import chronicle models": "import kuronet.models.mc.chronicle.role, kuronet.models.mc.chronicle.explorer",
+    "prewarm_models()": "from kuronet.models.base import prewarm_models; prewarm_models()",
+}
+
+_TEMPLATE = """\
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(elapsed, sum(name == "kuronet" or name.startswith("kuronet.") for name in sys.modules), len(sys.modules))
+"""
+
+
+def measure(statement: str) -> tuple:
+    output = subprocess.run(
+        [sys.executable, "-c", _TEMPLATE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1]), int(output[2])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10, help="Number of interpreters per statement.")
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        results = [measure(statement) for _ in range(args.number)]
+        elapsed = statistics.median(result[0] for result in results)
+        _, kuronet_modules, modules = results[-1]
+        print(f"{name:<30} {elapsed * 1e3:7.1f} ms  {kuronet_modules:3} kuronet modules  {modules:4} modules")
+
+
+if __name__ == "__main__":
+    main()
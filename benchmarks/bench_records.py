@@ -0,0 +1,79 @@
+"""Compare the memory held by models and by their compact records.
+
+The strings and times are shared between the models and the records, so only the objects themselves
+are measured. This is the memory retained by the results; the client still builds the models before
+converting them, so the peak memory of a request is not reduced.
+
+Usage:
+    python benchmarks/bench_records.py [--number N]
+"""
+
+import argparse
+import tracemalloc
+
+from bench_codec import make_explore_index, make_role_data
+
+from kuronet.models.mc.character import MCRole
+from kuronet.models.mc.chronicle.explorer import MCExplorerAreaItem
+from kuronet.models.mc.wish import MCBannerType, MCWish
+from kuronet.models.records import MCExplorerAreaItemRecord, MCRoleRecord, MCWishRecord, to_records
+
+
+def make_wishes(count: int):
+    return [
+        MCWish(
+            resourceType="Resonators",
+            resourceId=1102 + index % 40,
+            name=f"角色{index % 40}",
+            qualityLevel=3 + index % 3,
+            count=1,
+            time=f"2024-05-{index % 28 + 1:02} 12:00:00",
+            cardPoolType="角色活动唤取",
+            banner_type=MCBannerType.CHARACTER,
+        )
+        for index in range(count)
+    ]
+
+
+def allocated(func) -> int:
+    tracemalloc.start()
+    try:
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10000, help="Number of objects per measurement.")
+    args = parser.parse_args()
+
+    roles = make_role_data(40)["roleList"]
+    items = make_explore_index()["exploreList"][0]["areaInfoList"][0]["itemList"]
+    payloads = {
+        "MCWish": (make_wishes(args.number), MCWishRecord),
+        "MCRole": ([MCRole(**roles[index % len(roles)]) for index in range(args.number)], MCRoleRecord),
+        "MCExplorerAreaItem": (
+            [MCExplorerAreaItem(**items[index % len(items)]) for index in range(args.number)],
+            MCExplorerAreaItemRecord,
+        ),
+    }
+    for name, (models, record_type) in payloads.items():
+        model_type = type(models[0])
+        model_size = allocated(
+            lambda models=models, model_type=model_type: [
+                model_type.model_construct(**model.__dict__) for model in models
+            ]
+        )
+        record_size = allocated(lambda models=models, record_type=record_type: to_records(record_type, models))
+        print(
+            f"{name:<19} model {model_size / args.number:6.1f} B/object  "
+            f"record {record_size / args.number:6.1f} B/object  {model_size / record_size:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
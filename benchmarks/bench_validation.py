@@ -0,0 +1,72 @@
+"""Compare building models from decoded JSON, straight from the JSON document, lazily and without validation.
+
+The lazy measurement accesses one nested section, the way most commands only use a few fields.
+
+Usage:
+    python benchmarks/bench_validation.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from bench_codec import make_explore_index, make_response, make_role_data
+
+from kuronet.models.base import get_type_adapter
+from kuronet.models.mc.chronicle.explorer import MCExplorer
+from kuronet.models.mc.chronicle.role import MCRoles
+from kuronet.utils.codec import get_json_codec
+
+
+def peak_allocation(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000, help="Number of responses per measurement.")
+    args = parser.parse_args()
+
+    codec = get_json_codec()
+    payloads = {
+        "roleData": (make_response(make_role_data()), MCRoles, lambda roles: roles.roleList[0].level),
+        "exploreIndex": (
+            make_response(make_explore_index()),
+            MCExplorer,
+            lambda explorer: explorer.exploreList[0].countryProgress,
+        ),
+    }
+    for endpoint, (response, model, access) in payloads.items():
+        adapter = get_type_adapter(model)
+        payload = json.loads(response)["data"]
+
+        def from_python(adapter=adapter, payload=payload):
+            return adapter.validate_python(codec.loads(payload))
+
+        def from_json(adapter=adapter, payload=payload):
+            return adapter.validate_json(payload)
+
+        def from_lazy(model=model, payload=payload, access=access):
+            result = model.validate_lazy(codec.loads(payload))
+            access(result)
+            return result
+
+        def from_trusted(model=model, payload=payload):
+            return model.construct_trusted(codec.loads(payload))
+
+        assert from_python() == from_json() == from_lazy() == from_trusted()
+        print(f"{endpoint} ({codec.name})")
+        measurements = (("python", from_python), ("json", from_json), ("lazy", from_lazy), ("trusted", from_trusted))
+        for name, func in measurements:
+            elapsed = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+            print(f"  {name:<7} {elapsed * 1e6:8.1f} us/response  peak {peak_allocation(func) / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
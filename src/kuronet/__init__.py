@@ -1,4 +1,32 @@
-from kuronet.client.mc import MCClient
-from kuronet.utils.enums import Game, Region
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ("MCClient", "Game", "Region")
+if TYPE_CHECKING:
+    from kuronet.client.manager import ClientManager
+    from kuronet.client.mc import MCClient
+    from kuronet.client.transport import SharedTransport
+    from kuronet.utils.enums import Game, Region
+
+__all__ = ("MCClient", "ClientManager", "SharedTransport", "Game", "Region")
+
+# The public API is imported on first access, so that `import kuronet` does not load httpx and pydantic.
+_LAZY_ATTRIBUTES = {
+    "MCClient": "kuronet.client.mc",
+    "ClientManager": "kuronet.client.manager",
+    "SharedTransport": "kuronet.client.transport",
+    "Game": "kuronet.utils.enums",
+    "Region": "kuronet.utils.enums",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
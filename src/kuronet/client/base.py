@@ -1,12 +1,14 @@
 import logging
-import json as jsonlib
+import random
 from types import TracebackType
-from typing import AsyncContextManager, Type, Optional, Any, Union
+from typing import AsyncContextManager, Type, Optional, Any, Union, Generic, TypeVar, Dict, Tuple
 
 from httpx import AsyncClient, TimeoutException, Response, HTTPError, Timeout
+from pydantic import BaseModel, ValidationError
 
 from kuronet.client.cookies import Cookies
 from kuronet.client.headers import Headers
+from kuronet.client.transport import SharedTransport
 from kuronet.errors import (
     TimedOut,
     NetworkError,
@@ -14,7 +16,11 @@ from kuronet.errors import (
     raise_for_ret_code,
     NotSupported,
 )
-from kuronet.utils.enums import Region, Game, Platform
+from kuronet.models.base import APIModel, get_trusted_builder, get_type_adapter
+from kuronet.utils.cache import LRUCache, ResponseCache
+from kuronet.utils.codec import JSONCodec, get_json_codec
+from kuronet.utils.concurrency import SingleFlight
+from kuronet.utils.enums import Region, Game, Platform, ValidationMode
 from kuronet.utils.types import (
     RT,
     HeaderTypes,
@@ -29,6 +35,15 @@ _LOGGER = logging.getLogger("KuroNet.BaseClient")
 
 __all__ = ("BaseClient",)
 
+T = TypeVar("T")
+
+
+class _APIResponse(BaseModel, Generic[T]):
+    """The envelope of an API response, validated together with its data."""
+
+    code: int = -1
+    data: Optional[T] = None
+
 
 class BaseClient(AsyncContextManager["BaseClient"]):
     """
@@ -42,6 +57,18 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         region (Region, optional): The region used for the client.
         lang (str, optional): The language used for the client.
         timeout (Optional[TimeoutTypes], optional): Timeout configuration for the client.
+        transport (Optional[SharedTransport], optional): A connection pool shared with other clients.
+        json_codec (Optional[JSONCodec], optional): The JSON codec used for request bodies and responses.
+            Defaults to the fastest installed backend.
+        validation_mode (ValidationMode, optional): How responses are turned into models.
+            Defaults to `ValidationMode.PYTHON`.
+        validation_sample_rate (float, optional): The fraction of responses that are still validated
+            with `ValidationMode.TRUSTED`, to catch changes to the API schema. Defaults to 0.
+        use_records (bool, optional): Whether the list-returning methods return compact records, such as
+            `MCWishRecord`, instead of models. The records are converted from the models, so this reduces the
+            memory held by the results but not the peak memory of a request. Defaults to False.
+        response_cache (Optional[ResponseCache], optional): The cache of the responses of endpoints given a
+            time to live, which may be shared with other clients. Defaults to None, which does not cache responses.
 
     Attributes:
         headers (HeaderTypes): The headers used for the client.
@@ -50,10 +77,23 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         region (Region): The region used for the client.
         lang (str): The language used for the client.
         game (Optional[Game]): The game used for the client.
+        transport (Optional[SharedTransport]): The connection pool shared with other clients, if any.
+        json_codec (JSONCodec): The JSON codec used for request bodies and responses.
+        validation_mode (ValidationMode): How responses are turned into models.
+        validation_sample_rate (float): The fraction of responses that are still validated
+            with `ValidationMode.TRUSTED`.
+        use_records (bool): Whether the list-returning methods return compact records instead of models.
+        response_cache (Optional[ResponseCache]): The cache of the responses of endpoints, if any.
 
     """
 
     game: Optional[Game] = None
+    b_at_ttl: Optional[float] = 600.0
+    """The number of seconds a b-at is reused before it is requested again."""
+    b_at_maxsize: Optional[int] = 1024
+    """The maximum number of b-at values kept by the client."""
+    lab_headers_maxsize: int = 8
+    """The maximum number of lab API header sets kept by the client, one per token, platform, region and language."""
 
     def __init__(
         self,
@@ -66,6 +106,12 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         region: Region = Region.OVERSEAS,
         lang: str = "en-us",
         timeout: Optional[TimeoutTypes] = None,
+        transport: Optional[SharedTransport] = None,
+        json_codec: Optional[JSONCodec] = None,
+        validation_mode: ValidationMode = ValidationMode.PYTHON,
+        validation_sample_rate: float = 0.0,
+        use_records: bool = False,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """Initialize the client with the given parameters."""
         if timeout is None:
@@ -75,14 +121,28 @@ class BaseClient(AsyncContextManager["BaseClient"]):
                 write=5.0,
                 pool=1.0,
             )
-        cookies = Cookies(cookies)
+        cookies = Cookies(cookies).to_indexed()
         self.headers = Headers(headers)
         self.player_id = player_id
         self.account_id = account_id or cookies.account_id
         self.user_token = user_token or cookies.user_token
-        self._b_at_map = {}
+        self._b_at_map: LRUCache[str, str] = LRUCache(maxsize=self.b_at_maxsize, ttl=self.b_at_ttl)
+        self._b_at_requests = SingleFlight()
+        self._lab_headers: Dict[Tuple[Optional[str], Platform, Region, Optional[str]], Headers] = {}
         self.platform = Platform(platform or cookies.platform or "android")
-        self.client = AsyncClient(cookies=cookies, timeout=timeout)
+        self.transport = transport
+        self.json_codec = json_codec or get_json_codec()
+        self.validation_mode = ValidationMode(validation_mode)
+        self.validation_sample_rate = validation_sample_rate
+        self.use_records = use_records
+        self.response_cache = response_cache
+        self._cookies: Optional[Cookies] = None
+        # The jar is passed as is, so that the HTTP client keeps the indexed jar instead of copying it.
+        self.client = AsyncClient(
+            cookies=cookies.jar,
+            timeout=timeout,
+            transport=transport.attach() if transport is not None else None,
+        )
         self.region = region
         self.lang = lang
 
@@ -94,16 +154,27 @@ class BaseClient(AsyncContextManager["BaseClient"]):
     def set_b_at(self, game: Game, player_id: int, b_at: str) -> None:
         """Set the b-at value for the given game and player id."""
         key = f"{game.value}_{player_id}"
-        self._b_at_map[key] = b_at
+        self._b_at_map.set(key, b_at)
+
+    def clear_b_at(self, game: Game, player_id: int) -> None:
+        """Drop the b-at value for the given game and player id."""
+        key = f"{game.value}_{player_id}"
+        self._b_at_map.pop(key)
 
     @property
     def cookies(self) -> Cookies:
-        """Get the cookies used for the client."""
-        return Cookies(self.client.cookies.jar)
+        """Get the cookies used for the client.
+
+        The cookies are a view of the jar of the HTTP client, which is reused until the jar is replaced.
+        """
+        jar = self.client.cookies.jar
+        if self._cookies is None or self._cookies.jar is not jar:
+            self._cookies = Cookies(jar)
+        return self._cookies
 
     @cookies.setter
     def cookies(self, cookies: CookieTypes) -> None:
-        self.client.cookies = cookies
+        self.client.cookies = Cookies(cookies).to_indexed().jar
 
     @property
     def device_name(self) -> str:
@@ -161,6 +232,62 @@ class BaseClient(AsyncContextManager["BaseClient"]):
     async def initialize(self):
         """Initialize the client."""
 
+    def build_model(self, model: Any, data: Any) -> Any:
+        """Build a model from decoded JSON data.
+
+        With `ValidationMode.LAZY`, the nested models of a model are validated on first access.
+        With `ValidationMode.TRUSTED`, the model is built without validation, except for a sampled
+        fraction of the responses. A sampled response that fails validation is logged and built
+        without validation.
+
+        Args:
+            model (Any): The type to build, such as a model or `List[MCWish]`.
+            data (Any): The decoded JSON data.
+
+        Returns:
+            Any: The model, or None if the data is None.
+        """
+        if data is None:
+            return None
+        if self.validation_mode == ValidationMode.TRUSTED:
+            if self.validation_sample_rate and random.random() < self.validation_sample_rate:  # noqa: S311
+                try:
+                    return get_type_adapter(model).validate_python(data)
+                except ValidationError as exc:
+                    _LOGGER.warning("Response does not match %s:\n%s", getattr(model, "__name__", model), exc)
+            return get_trusted_builder(model)(data)
+        if self.validation_mode == ValidationMode.LAZY and isinstance(model, type) and issubclass(model, APIModel):
+            return model.validate_lazy(data)
+        return get_type_adapter(model).validate_python(data)
+
+    def build_model_json(self, model: Any, data: Union[str, bytes, bytearray]) -> Any:
+        """Build a model straight from a JSON document, without decoding it into Python objects first.
+
+        Args:
+            model (Any): The type to build, such as a model or `List[MCWish]`.
+            data (Union[str, bytes, bytearray]): The JSON document.
+
+        Returns:
+            Any: The model, or None if the document is `null`.
+        """
+        if data in ("null", b"null"):
+            return None
+        return get_type_adapter(model).validate_json(data)
+
+    def _build_response_json(self, model: Any, content: bytes, accept_code: Optional[int]) -> Any:
+        """Validate a whole response envelope together with its data."""
+        try:
+            response = get_type_adapter(_APIResponse[model]).validate_json(content)
+        except ValidationError:
+            # The data of an error response does not match the model, so report the error instead.
+            data = self.json_codec.loads(content)
+            if data.get("code", -1) not in [accept_code, 10902]:
+                raise_for_ret_code(data)
+            raise
+        if response.code not in [accept_code, 10902]:
+            raise_for_ret_code(self.json_codec.loads(content))
+        return response.data
+
     def get_lab_api_header(
         self,
         headers: HeaderTypes,
@@ -174,11 +301,31 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         Returns:
             Headers: The lab API header with added fields.
         """
-        headers = Headers(headers)
+        if self.region != Region.OVERSEAS:
+            lang = None
+        key = (self.user_token, self.platform, self.region, lang)
+        base_headers = self._lab_headers.get(key)
+        if base_headers is None:
+            # Old entries are dropped once the token, platform or region has changed a few times.
+            if len(self._lab_headers) >= self.lab_headers_maxsize:
+                self._lab_headers.clear()
+            base_headers = self._lab_headers[key] = self._build_lab_api_header(lang)
+        merged = Headers(base_headers)
+        if headers:
+            # The lab API fields take precedence over the given headers.
+            if not isinstance(headers, (dict, Headers)):
+                headers = Headers(headers)
+            for name, value in headers.items():
+                if name not in base_headers:
+                    merged[name] = value
+        return merged
+
+    def _build_lab_api_header(self, lang: Optional[str]) -> Headers:
+        """Build the lab API fields of the current token, platform and region, without any other header."""
+        headers = Headers()
         headers["user-agent"] = self.user_agent
-        if self.region == Region.OVERSEAS:
-            if lang:
-                headers["lang"] = lang
+        if lang:
+            headers["lang"] = lang
         if self.user_token:
             headers["token"] = self.user_token
         headers["source"] = self.platform.value
@@ -216,12 +363,17 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             TimedOut: If the request times out.
 
         """
+        content = None
+        if json is not None:
+            content = self.json_codec.dumps(json)
+            headers = Headers(headers)
+            headers.setdefault("content-type", "application/json")
         try:
             return await self.client.request(
                 method,
                 url,
+                content=content,
                 data=data,
-                json=json,
                 params=params,
                 headers=headers,
             )
@@ -240,6 +392,7 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         headers: Optional[HeaderTypes] = None,
         accept_code: Optional[int] = 200,
         need_decrypt: bool = False,
+        model: Optional[Any] = None,
     ):
         """Make an API request and return the data.
 
@@ -247,6 +400,9 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         and returns the data from the response if it is successful.
         If the response contains an error, it raises a `BadRequest` exception.
 
+        If a model is given, the data is returned as that model. With `ValidationMode.JSON`, the model is
+        validated straight from the response bytes.
+
         Args:
             method (str): The HTTP method to use for the request (e.g., "GET", "POST").
             url (URLTypes): The URL to send the request to.
@@ -256,6 +412,7 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             headers (Optional[HeaderTypes]): The headers to include in the request.
             accept_code (Optional[int]): The expected status code for a successful response.
             need_decrypt (bool): Whether to decrypt the data before returning it.
+            model (Optional[Any]): The type to build from the data, such as a model or `List[MCWish]`.
 
         Returns:
             Any: The data returned by the API.
@@ -264,6 +421,7 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             NetworkError: If an HTTP error occurs while making the request.
             TimedOut: If the request times out.
             BadRequest: If the response contains an error.
+            ValidationError: If the data does not match the model.
         """
         response = await self.request(
             method,
@@ -274,16 +432,25 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             headers=headers,
         )
         if not response.is_error:
-            data = response.json()
+            from_json = model is not None and self.validation_mode == ValidationMode.JSON
+            if from_json and not need_decrypt:
+                return self._build_response_json(model, response.content, accept_code)
+            # `response.json()` always decodes with the standard library, so the configured codec is used instead.
+            data = self.json_codec.loads(response.content)
             ret_code = data.get("code", -1)
             if ret_code not in [accept_code, 10902]:
                 raise_for_ret_code(data)
+            data = data["data"]
             if need_decrypt:
+                if from_json and isinstance(data, str):
+                    return self.build_model_json(model, data)
                 try:
-                    return jsonlib.loads(data["data"])
+                    data = self.json_codec.loads(data)
                 except Exception as exc:
                     raise BadRequest(message="Failed to load data.") from exc
-            return data["data"]
+            if model is None:
+                return data
+            return self.build_model(model, data)
         if response.status_code == 404:
             raise NotSupported("API not supported or has been removed.")
         raise BadRequest(status_code=response.status_code, message=response.text)
@@ -297,6 +464,7 @@ class BaseClient(AsyncContextManager["BaseClient"]):
         headers: Optional[HeaderTypes] = None,
         lang: Optional[str] = None,
         need_decrypt: bool = False,
+        model: Optional[Any] = None,
     ):
         """Make a request to the lab API and return the data.
 
@@ -312,6 +480,7 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             headers (Optional[HeaderTypes]): The headers to include in the request.
             lang (Optional[str]): The language of the request (e.g., "en", "zh").
             need_decrypt (bool): Whether to decrypt the data before returning it.
+            model (Optional[Any]): The type to build from the data, such as a model or `List[Account]`.
 
         Returns:
             Any: The data returned by the lab API.
@@ -327,4 +496,5 @@ class BaseClient(AsyncContextManager["BaseClient"]):
             params=params,
             headers=headers,
             need_decrypt=need_decrypt,
+            model=model,
         )
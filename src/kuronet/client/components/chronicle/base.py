@@ -1,13 +1,19 @@
 import datetime
-from typing import Optional, Any
+import time
+from typing import Optional, Any, Awaitable, Callable, Dict, Tuple, TYPE_CHECKING
 
 from kuronet.client.base import BaseClient
-from kuronet.client.routes import BBS_URL
-from kuronet.models.lab.daily import DailyRewardInfo
+from kuronet.client.routes import BBS_URL, ROUTES, URL
+from kuronet.errors import InvalidCookies
+from kuronet.utils.cache import LRUCache, ResponseCache
+from kuronet.utils.concurrency import SingleFlight
 from kuronet.utils.enums import Region, Game
 from kuronet.utils.player import recognize_server
 from kuronet.utils.types import QueryParamTypes
 
+if TYPE_CHECKING:
+    from kuronet.models.lab.daily import DailyRewardInfo
+
 __all__ = ("BaseChronicleClient",)
 
 
@@ -22,6 +28,14 @@ class BaseChronicleClient(BaseClient):
         region (Region): The region associated with the API client.
     """
 
+    refresh_max_staleness: float = 30.0
+    """The number of seconds the data of a player is considered fresh after a refresh."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._refreshed_at: LRUCache[Tuple[Game, int], float] = LRUCache(maxsize=self.b_at_maxsize)
+        self._refresh_requests = SingleFlight()
+
     async def request_game_record(
         self,
         endpoint: str,
@@ -34,9 +48,18 @@ class BaseChronicleClient(BaseClient):
         game: Optional[Game] = None,
         need_decrypt: bool = False,
         need_token: bool = True,
+        model: Optional[Any] = None,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
     ):
         """Make a request towards the game record endpoint.
 
+        The b-at of the player is reused until it expires. If a request made with a cached b-at is rejected
+        with `InvalidCookies`, the b-at is refreshed once and the request is retried. Other errors, such as
+        rate limits, are raised without a retry.
+
+        If the client has a `response_cache` that caches the endpoint, a cached response is returned
+        without acquiring a b-at or making a request.
+
         Args:
             endpoint (str): The endpoint to send the request to.
             endpoint_type (str, optional): The type of endpoint to send the request to.
@@ -48,6 +71,9 @@ class BaseChronicleClient(BaseClient):
             game (Optional[Game], optional): The game associated with the request.
             need_decrypt (bool, optional): Whether the response needs to be decrypted.
             need_token (bool, optional): Whether the request needs a token.
+            model (Optional[Any], optional): The type to build from the response, such as a model.
+            refresh (Optional[Callable[[], Awaitable[Any]]], optional): Awaited before the request is made,
+                but not when the response is cached, such as a refresh of the data of the player.
 
         Returns:
             The response from the server.
@@ -57,9 +83,8 @@ class BaseChronicleClient(BaseClient):
             TimedOut: If the request times out.
             BadRequest: If the response contains an error.
         """
-        base_url = BBS_URL.get_url(region or self.region)
-        base_url = base_url / endpoint_type
-        url = base_url / endpoint
+        region = region or self.region
+        url = ROUTES.get_url(BBS_URL, endpoint_type, endpoint, region=region)
 
         game = game or self.game
         player_id = player_id or self.player_id
@@ -69,17 +94,56 @@ class BaseChronicleClient(BaseClient):
             "roleId": player_id,
             "serverId": server_id,
         }
-        headers = None
+        data = {**base_data, **data} if data else base_data
+
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cached(endpoint):
+            mode = (self.validation_mode, self.use_records)
+            cache_key = ResponseCache.make_key(player_id, url, lang, data, model, mode)
+            cached = self.response_cache.get(endpoint, cache_key, self.account_id)
+            if cached is not None:
+                return cached
+        if refresh is not None:
+            await refresh()
+
+        cached_b_at = None
         if need_token:
-            await self.request_token()
+            cached_b_at = self.get_b_at(game, player_id)
+            if cached_b_at is None:
+                await self.request_token(force_refresh=False, player_id=player_id, lang=lang, game=game)
+        try:
+            result = await self._request_game_record(url, game, player_id, data, params, lang, need_decrypt, model)
+        except InvalidCookies:
+            if cached_b_at is None:
+                raise
+            # The cached b-at may have been rejected, so clear it unless another request already did.
+            # Requests rejected while that refresh is in flight join it, and later ones reuse its b-at.
+            if self.get_b_at(game, player_id) == cached_b_at:
+                self.clear_b_at(game, player_id)
+            await self.request_token(force_refresh=False, player_id=player_id, lang=lang, game=game)
+            result = await self._request_game_record(url, game, player_id, data, params, lang, need_decrypt, model)
+        if cache_key is not None:
+            self.response_cache.set(endpoint, cache_key, result, self.account_id)
+        return result
+
+    async def _request_game_record(
+        self,
+        url: URL,
+        game: Game,
+        player_id: int,
+        data: Dict[str, Any],
+        params: Optional[QueryParamTypes],
+        lang: Optional[str],
+        need_decrypt: bool,
+        model: Optional[Any],
+    ):
+        headers = None
         if b_at := self.get_b_at(game, player_id):
             headers = {
                 "b-at": b_at,
             }
-        data = {**base_data, **data} if data else base_data
-
         return await self.request_lab(
-            url, data=data, params=params, headers=headers, lang=lang, need_decrypt=need_decrypt
+            url, data=data, params=params, headers=headers, lang=lang, need_decrypt=need_decrypt, model=model
         )
 
     async def request_token(
@@ -87,13 +151,38 @@ class BaseChronicleClient(BaseClient):
         force_refresh: bool = True,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
-    ):
+        game: Optional[Game] = None,
+    ) -> str:
+        """Get the b-at access token for the player.
+
+        A cached b-at is reused until it expires unless `force_refresh` is set. Concurrent requests
+        for the same player share a single `requestToken` call.
+
+        Args:
+            force_refresh (bool, optional): Whether to request a new b-at even if one is cached.
+                Defaults to True.
+            player_id (Optional[int], optional): The player id to get the b-at for.
+            lang (Optional[str], optional): The language for the response.
+            game (Optional[Game], optional): The game associated with the player.
+
+        Returns:
+            str: The b-at access token.
+        """
+        game = game or self.game
+        player_id = player_id or self.player_id
         if not force_refresh:
-            if b_at := self.get_b_at(self.game, player_id):
+            if b_at := self.get_b_at(game, player_id):
                 return b_at
+        return await self._b_at_requests.do(
+            (game, player_id),
+            lambda: self._request_token(player_id, lang, game),
+        )
+
+    async def _request_token(self, player_id: int, lang: Optional[str], game: Game) -> str:
         data = await self.request_game_record(
             "requestToken",
             player_id=player_id,
+            game=game,
             lang=lang,
             need_decrypt=True,
             need_token=False,
@@ -101,7 +190,7 @@ class BaseChronicleClient(BaseClient):
         token = data.get("accessToken")
         if not token:
             raise ValueError("No access token found in response.")
-        self.set_b_at(self.game, player_id or self.player_id, token)
+        self.set_b_at(game, player_id, token)
         return token
 
     async def refresh_data(
@@ -109,24 +198,42 @@ class BaseChronicleClient(BaseClient):
         player_id: Optional[int] = None,
         *,
         game: Optional[Game] = None,
+        max_staleness: Optional[float] = None,
     ) -> bool:
         """Refresh the data for the player.
 
+        Concurrent refreshes for the same player share a single `refreshData` call.
+
         Args:
             player_id (Optional[int], optional): The player id to refresh the data for.
             game (Optional[Game], optional): The game associated with the player.
+            max_staleness (Optional[float], optional): Skip the refresh if the data of the player was
+                refreshed within this many seconds. Defaults to None, which always refreshes.
 
         Returns:
             bool: True if the data was refreshed successfully.
         """
+        game = game or self.game
+        player_id = player_id or self.player_id
+        key = (game, player_id)
+        if max_staleness is not None:
+            refreshed_at = self._refreshed_at.get(key)
+            if refreshed_at is not None and time.monotonic() - refreshed_at <= max_staleness:
+                return True
+        return await self._refresh_requests.do(key, lambda: self._refresh_data(player_id, game))
+
+    async def _refresh_data(self, player_id: int, game: Game) -> bool:
+        started_at = time.monotonic()
         path = "akiBox/refreshData"
-        return await self.request_game_record(path, player_id=player_id, game=game)
+        result = await self.request_game_record(path, player_id=player_id, game=game)
+        self._refreshed_at.set((game, player_id), started_at)
+        return result
 
     async def get_reward_info(
         self,
         *,
         lang: Optional[str] = None,
-    ) -> DailyRewardInfo:
+    ) -> "DailyRewardInfo":
         """Gets the daily reward info for the current user.
 
         Args:
@@ -135,12 +242,13 @@ class BaseChronicleClient(BaseClient):
         Returns:
             A DailyRewardInfo object containing information about the user's daily reward status.
         """
+        from kuronet.models.lab.daily import DailyRewardInfo  # noqa: PLC0415
+
         path = "../../encourage/signIn/initSignInV2"
         _data = {
             "userId": self.account_id,
         }
-        data = await self.request_game_record(path, lang=lang, data=_data)
-        return DailyRewardInfo(**data)
+        return await self.request_game_record(path, lang=lang, data=_data, model=DailyRewardInfo)
 
     async def claim_daily_reward(
         self,
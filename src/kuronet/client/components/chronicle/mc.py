@@ -1,47 +1,72 @@
-from typing import Optional
+import asyncio
+from functools import partial
+from typing import Optional, Iterable, AsyncIterator, TYPE_CHECKING
+
+from pydantic import ValidationError
 
 from kuronet.client.components.chronicle.base import BaseChronicleClient
-from kuronet.errors import AccountNotFound
-from kuronet.models.mc.chronicle.calabash import MCCalabash
-from kuronet.models.mc.chronicle.explorer import MCExplorer
-from kuronet.models.mc.chronicle.notes import MCNote, MCNoteWidget
+from kuronet.errors import AccountNotFound, TimedOut
+from kuronet.utils.concurrency import iter_completed
 
-__all__ = ("MCBattleChronicleClient",)
+if TYPE_CHECKING:
+    from kuronet.models.mc.chronicle.calabash import MCCalabash
+    from kuronet.models.mc.chronicle.explorer import MCExplorer
+    from kuronet.models.mc.chronicle.notes import MCNote, MCNoteWidget
+    from kuronet.models.mc.chronicle.snapshot import MCSnapshot
+    from kuronet.models.mc.chronicle.role import MCRoles, MCRoleDetail
 
-from kuronet.models.mc.chronicle.role import MCRoles, MCRoleDetail
+__all__ = ("MCBattleChronicleClient",)
 
 
 class MCBattleChronicleClient(BaseChronicleClient):
+    async def _auto_refresh(
+        self,
+        player_id: Optional[int],
+        auto_refresh: bool,
+        max_staleness: Optional[float],
+    ) -> None:
+        if not auto_refresh:
+            return
+        if max_staleness is None:
+            max_staleness = self.refresh_max_staleness
+        await self.refresh_data(player_id, max_staleness=max_staleness)
+
     async def get_mc_notes(
         self,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCNote:
+        max_staleness: Optional[float] = None,
+    ) -> "MCNote":
         """Get the MC notes for the player.
 
         Args:
             player_id (Optional[int], optional): The player id to get the notes for. Defaults to None.
             lang (Optional[str], optional): The language code to use for the request. Defaults to None.
             auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
 
         Returns:
             MCNote: The MC notes for the player.
         """
-        if auto_refresh:
-            await self.refresh_data(player_id)
+        from kuronet.models.mc.chronicle.notes import MCNote  # noqa: PLC0415
+
+        refresh = partial(self._auto_refresh, player_id, auto_refresh, max_staleness)
         path = "akiBox/baseData"
-        data = await self.request_game_record(path, player_id=player_id, lang=lang, need_decrypt=True)
-        if player_id and data is None:
+        notes = await self.request_game_record(
+            path, player_id=player_id, lang=lang, need_decrypt=True, model=MCNote, refresh=refresh
+        )
+        if player_id and notes is None:
             raise AccountNotFound
-        return MCNote(**data)
+        return notes
 
     async def get_mc_notes_widget(
         self,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCNoteWidget:
+    ) -> "MCNoteWidget":
         """Get the MC notes widget for the player.
 
         Args:
@@ -52,6 +77,8 @@ class MCBattleChronicleClient(BaseChronicleClient):
         Returns:
             MCNoteWidget: The MC notes widget for the player.
         """
+        from kuronet.models.mc.chronicle.notes import MCNoteWidget  # noqa: PLC0415
+
         path = "game3/getData"
         if auto_refresh:
             path = "game3/refresh"
@@ -59,14 +86,14 @@ class MCBattleChronicleClient(BaseChronicleClient):
             "type": "2",
             "sizeType": "1",
         }
-        data = await self.request_game_record(
+        return await self.request_game_record(
             path,
             endpoint_type="gamer/widget",
             player_id=player_id,
             lang=lang,
             data=data_,
+            model=MCNoteWidget,
         )
-        return MCNoteWidget(**data)
 
     async def get_mc_explorer(
         self,
@@ -74,7 +101,8 @@ class MCBattleChronicleClient(BaseChronicleClient):
         country_code: Optional[int] = 1,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCExplorer:
+        max_staleness: Optional[float] = None,
+    ) -> "MCExplorer":
         """Get the MC explorer for the player.
 
         Args:
@@ -82,79 +110,93 @@ class MCBattleChronicleClient(BaseChronicleClient):
             country_code (Optional[int], optional): The country code to use for the request. Defaults to 1.
             lang (Optional[str], optional): The language code to use for the request. Defaults to None.
             auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
 
         Returns:
             MCExplorer: The MC explorer for the player.
         """
-        if auto_refresh:
-            await self.refresh_data(player_id)
+        from kuronet.models.mc.chronicle.explorer import MCExplorer  # noqa: PLC0415
+
+        refresh = partial(self._auto_refresh, player_id, auto_refresh, max_staleness)
         path = "akiBox/exploreIndex"
         data_ = {
             "channelId": "19",
             "countryCode": str(country_code),
         }
-        data = await self.request_game_record(
+        return await self.request_game_record(
             path,
             player_id=player_id,
             lang=lang,
             data=data_,
             need_decrypt=True,
+            model=MCExplorer,
+            refresh=refresh,
         )
-        return MCExplorer(**data)
 
     async def get_mc_roles(
         self,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCRoles:
+        max_staleness: Optional[float] = None,
+    ) -> "MCRoles":
         """Get the MC roles for the player.
 
         Args:
             player_id (Optional[int], optional): The player id to get the roles for. Defaults to None.
             lang (Optional[str], optional): The language code to use for the request. Defaults to None.
             auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
 
         Returns:
             MCRoles: The MC roles for the player.
         """
-        if auto_refresh:
-            await self.refresh_data(player_id)
+        from kuronet.models.mc.chronicle.role import MCRoles  # noqa: PLC0415
+
+        refresh = partial(self._auto_refresh, player_id, auto_refresh, max_staleness)
         path = "akiBox/roleData"
-        data = await self.request_game_record(
+        return await self.request_game_record(
             path,
             player_id=player_id,
             lang=lang,
             need_decrypt=True,
+            model=MCRoles,
+            refresh=refresh,
         )
-        return MCRoles(**data)
 
     async def get_mc_calabash(
         self,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCCalabash:
+        max_staleness: Optional[float] = None,
+    ) -> "MCCalabash":
         """Get the MC calabash for the player.
 
         Args:
             player_id (Optional[int], optional): The player id to get the calabash for. Defaults to None.
             lang (Optional[str], optional): The language code to use for the request. Defaults to None.
             auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
 
         Returns:
             MCCalabash: The MC calabash for the player.
         """
-        if auto_refresh:
-            await self.refresh_data(player_id)
+        from kuronet.models.mc.chronicle.calabash import MCCalabash  # noqa: PLC0415
+
+        refresh = partial(self._auto_refresh, player_id, auto_refresh, max_staleness)
         path = "akiBox/calabashData"
-        data = await self.request_game_record(
+        return await self.request_game_record(
             path,
             player_id=player_id,
             lang=lang,
             need_decrypt=True,
+            model=MCCalabash,
+            refresh=refresh,
         )
-        return MCCalabash(**data)
 
     async def get_mc_role_detail(
         self,
@@ -162,7 +204,8 @@ class MCBattleChronicleClient(BaseChronicleClient):
         role_id: Optional[int] = None,
         lang: Optional[str] = None,
         auto_refresh: bool = True,
-    ) -> MCRoleDetail:
+        max_staleness: Optional[float] = None,
+    ) -> "MCRoleDetail":
         """Get the MC role detail for the player.
 
         Args:
@@ -170,25 +213,132 @@ class MCBattleChronicleClient(BaseChronicleClient):
             role_id (Optional[int], optional): The role id to get the role detail for. Defaults to None.
             lang (Optional[str], optional): The language code to use for the request. Defaults to None.
             auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
 
         Returns:
             MCRoleDetail: The MC role detail for the player.
         """
-        if auto_refresh:
-            await self.refresh_data(player_id)
+        from kuronet.models.mc.chronicle.role import MCRoleDetail  # noqa: PLC0415
+
+        refresh = partial(self._auto_refresh, player_id, auto_refresh, max_staleness)
         path = "akiBox/getRoleDetail"
         data_ = {
             "channelId": "19",
             "countryCode": "1",
             "id": role_id,
         }
-        data = await self.request_game_record(
-            path,
-            player_id=player_id,
-            lang=lang,
-            data=data_,
-            need_decrypt=True,
-        )
-        if data.get("level") is None:
+        try:
+            role_detail = await self.request_game_record(
+                path,
+                player_id=player_id,
+                lang=lang,
+                data=data_,
+                need_decrypt=True,
+                model=MCRoleDetail,
+                refresh=refresh,
+            )
+        except ValidationError as exc:
+            if any(error["loc"][:1] == ("level",) for error in exc.errors()):
+                raise ValueError("Role not found.") from exc
+            raise
+        # Models built without validation may lack the level instead of failing.
+        if getattr(role_detail, "level", None) is None:
             raise ValueError("Role not found.")
-        return MCRoleDetail(**data)
+        return role_detail
+
+    async def iter_mc_role_details(
+        self,
+        role_ids: Optional[Iterable[int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        concurrency: int = 5,
+        auto_refresh: bool = True,
+        max_staleness: Optional[float] = None,
+    ) -> AsyncIterator["MCRoleDetail"]:
+        """Get the MC role details of many roles of the player, as they arrive.
+
+        The b-at is acquired and the data is refreshed once, then the role details are fetched concurrently.
+
+        Args:
+            role_ids (Optional[Iterable[int]], optional): The role ids to get the role details for.
+                Defaults to None, which fetches every role in `MCRoles.roleList`.
+            player_id (Optional[int], optional): The player id to get the role details for. Defaults to None.
+            lang (Optional[str], optional): The language code to use for the request. Defaults to None.
+            concurrency (int, optional): The maximum number of role details fetched at once. Defaults to 5.
+            auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
+
+        Yields:
+            MCRoleDetail: The MC role details, in the order they arrive.
+        """
+        player_id = player_id or self.player_id
+        await self.request_token(force_refresh=False, player_id=player_id, lang=lang)
+        await self._auto_refresh(player_id, auto_refresh, max_staleness)
+        if role_ids is None:
+            roles = await self.get_mc_roles(player_id, lang, auto_refresh=False)
+            role_ids = [role.roleId for role in roles.roleList]
+        calls = (
+            partial(self.get_mc_role_detail, player_id, role_id, lang, auto_refresh=False) for role_id in role_ids
+        )
+        async for role_detail in iter_completed(calls, concurrency):
+            yield role_detail
+
+    async def get_mc_snapshot(
+        self,
+        player_id: Optional[int] = None,
+        include: Optional[Iterable[str]] = None,
+        lang: Optional[str] = None,
+        auto_refresh: bool = True,
+        max_staleness: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> "MCSnapshot":
+        """Get the notes, roles, explorer, calabash and widget data of the player in one call.
+
+        The b-at is acquired and the data is refreshed once, then every requested section is fetched
+        concurrently.
+
+        Args:
+            player_id (Optional[int], optional): The player id to get the snapshot for. Defaults to None.
+            include (Optional[Iterable[str]], optional): The sections to fetch, out of "notes", "roles",
+                "explorer", "calabash" and "widget". Defaults to every section except "widget".
+            lang (Optional[str], optional): The language code to use for the request. Defaults to None.
+            auto_refresh (bool, optional): Whether to refresh the data before making the request. Defaults to True.
+            max_staleness (Optional[float], optional): Skip the refresh if the data was refreshed within this
+                many seconds. Defaults to `refresh_max_staleness`.
+            timeout (Optional[float], optional): The number of seconds the whole snapshot may take.
+                Defaults to None, which waits for every request.
+
+        Returns:
+            MCSnapshot: The snapshot of the player. Sections that were not requested are None.
+
+        Raises:
+            ValueError: If an unknown section is requested.
+            TimedOut: If the snapshot takes longer than `timeout`.
+        """
+        from kuronet.models.mc.chronicle.snapshot import MCSnapshot  # noqa: PLC0415
+
+        sections = set(include) if include is not None else {"notes", "roles", "explorer", "calabash"}
+        if unknown := sections - set(MCSnapshot.model_fields):
+            raise ValueError(f"Unknown snapshot sections: {', '.join(sorted(unknown))}")
+        player_id = player_id or self.player_id
+
+        async def fetch() -> "MCSnapshot":
+            await self.request_token(force_refresh=False, player_id=player_id, lang=lang)
+            await self._auto_refresh(player_id, auto_refresh, max_staleness)
+            requests = {
+                "notes": lambda: self.get_mc_notes(player_id, lang, auto_refresh=False),
+                "roles": lambda: self.get_mc_roles(player_id, lang, auto_refresh=False),
+                "explorer": lambda: self.get_mc_explorer(player_id, lang=lang, auto_refresh=False),
+                "calabash": lambda: self.get_mc_calabash(player_id, lang, auto_refresh=False),
+                "widget": lambda: self.get_mc_notes_widget(player_id, lang, auto_refresh=False),
+            }
+            names = [name for name in requests if name in sections]
+            results = await asyncio.gather(*(requests[name]() for name in names))
+            return MCSnapshot(**dict(zip(names, results)))
+
+        try:
+            return await asyncio.wait_for(fetch(), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimedOut from exc
@@ -1,13 +1,16 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 
 from kuronet.client.base import BaseClient
-from kuronet.client.headers import Headers
-from kuronet.client.routes import BBS_URL
-from kuronet.models.lab.mine import Mine
-from kuronet.models.lab.role import Account
+from kuronet.client.routes import BBS_URL, ROUTES
+from kuronet.utils.cache import ResponseCache
 from kuronet.utils.enums import Region
 from kuronet.utils.types import HeaderTypes
 
+if TYPE_CHECKING:
+    from kuronet.models.lab.mine import Mine
+    from kuronet.models.lab.role import Account
+    from kuronet.models.records import AccountRecord
+
 __all__ = ("LabClient",)
 
 
@@ -24,9 +27,13 @@ class LabClient(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         data: Any = None,
         headers: Optional[HeaderTypes] = None,
+        model: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """Makes a request to a bbs endpoint.
 
+        If the client has a `response_cache` that caches the endpoint, a cached response is returned
+        without making a request.
+
         Args:
             endpoint (str): The URL of the endpoint to make the request to.
             lang (str, optional): The language code used for the request. Defaults to None.
@@ -35,26 +42,36 @@ class LabClient(BaseClient):
             params (dict, optional): The parameters to include in the request. Defaults to None.
             data (any, optional): The data to include in the request. Defaults to None.
             headers (dict, optional): The headers to include in the request. Defaults to None.
+            model (any, optional): The type to build from the response data. Defaults to None.
 
         Returns:
             Dict[str, Any]: The response data from the request.
         """
-        headers = Headers(headers)
-
         lang = lang or self.lang
         region = region or self.region
 
-        url = BBS_URL.get_url(region) / endpoint
+        url = ROUTES.get_url(BBS_URL, endpoint, region=region)
 
-        data = await self.request_lab(
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cached(endpoint):
+            mode = (self.validation_mode, self.use_records)
+            cache_key = ResponseCache.make_key(None, url, lang, (method, params, data), model, mode)
+            cached = self.response_cache.get(endpoint, cache_key, self.account_id)
+            if cached is not None:
+                return cached
+
+        result = await self.request_lab(
             url,
             method=method,
             params=params,
             data=data,
             headers=headers,
             lang=lang,
+            model=model,
         )
-        return data
+        if cache_key is not None:
+            self.response_cache.set(endpoint, cache_key, result, self.account_id)
+        return result
 
     async def find_event_list(
         self,
@@ -87,7 +104,7 @@ class LabClient(BaseClient):
     async def verify_token(
         self,
         user_token: Optional[str] = None,
-    ) -> Optional[Mine]:
+    ) -> Optional["Mine"]:
         """
         Retrieves a user using a user_token .
 
@@ -98,6 +115,8 @@ class LabClient(BaseClient):
         Returns:
             Optional[Mine]: The user.
         """
+        from kuronet.models.lab.mine import Mine  # noqa: PLC0415
+
         path = "user/mine"
         user_token = user_token or self.user_token
         data = {
@@ -113,7 +132,7 @@ class LabClient(BaseClient):
 
     async def verify_token_v2(
         self, user_token: Optional[str] = None, account_id: Optional[int] = None
-    ) -> Optional[Mine]:
+    ) -> Optional["Mine"]:
         """
         Retrieves a user using a login ticket (`login_ticket`) .
 
@@ -130,6 +149,8 @@ class LabClient(BaseClient):
             ValueError: If `user_token` or `account_id` is not provided.
             InvalidCookies: If the user_token is invalid.
         """
+        from kuronet.models.lab.mine import Mine  # noqa: PLC0415
+
         path = "user/mineV2"
         user_token = user_token or self.user_token
         account_id = account_id or self.account_id
@@ -146,15 +167,23 @@ class LabClient(BaseClient):
         data = await self.request_bbs(path, data=data, headers=headers)
         return Mine(**data.get("mine", {}))
 
-    async def get_mc_accounts(self):
+    async def get_mc_accounts(self) -> Union[List["Account"], List["AccountRecord"]]:
         """Get the mc accounts of the currently logged-in user.
 
+        With `use_records` set on the client, the accounts are returned as `AccountRecord` objects.
+
         Returns:
-            List[Account]: A list of account info objects of mc accounts.
+            Union[List[Account], List[AccountRecord]]: A list of account info objects of mc accounts.
         """
+        from kuronet.models.lab.role import Account  # noqa: PLC0415
+
         path = "gamer/role/list"
         data = {
             "gameId": "3",
         }
-        data = await self.request_bbs(path, data=data)
-        return [Account(**_data) for _data in data]
+        accounts = await self.request_bbs(path, data=data, model=List[Account])
+        if self.use_records:
+            from kuronet.models.records import AccountRecord, to_records  # noqa: PLC0415
+
+            return to_records(AccountRecord, accounts)
+        return accounts
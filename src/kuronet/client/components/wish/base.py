@@ -1,7 +1,7 @@
 from typing import Optional, Any, List, Dict
 
 from kuronet.client.base import BaseClient
-from kuronet.client.routes import GACHA_INFO_URL
+from kuronet.client.routes import GACHA_INFO_URL, ROUTES
 from kuronet.utils.enums import Game
 
 __all__ = ("BaseWishClient",)
@@ -16,6 +16,7 @@ class BaseWishClient(BaseClient):
         game: Game,
         lang: Optional[str] = None,
         data: Optional[Dict[str, Any]] = None,
+        model: Optional[Any] = None,
     ) -> List[Any]:
         """
         Make a request towards the gacha info endpoint.
@@ -26,16 +27,16 @@ class BaseWishClient(BaseClient):
             lang (Optional[str] , optional): The language code to use for the request.
                 If not provided, the class default will be used.
             data (Optional[Dict[str, Any]], optional): The query parameters for the request.
+            model (Optional[Any], optional): The type to build from the response data, such as `List[MCWish]`.
 
         Returns:
             Dict[str, Any]
                 The response data as a dictionary.
         """
 
-        base_url = GACHA_INFO_URL.get_url(self.region, game)
-        url = base_url / endpoint
+        url = ROUTES.get_url(GACHA_INFO_URL, endpoint, region=self.region, game=game)
 
         if data and lang:
-            data["languageCode"] = lang
+            data = {**data, "languageCode": lang}
 
-        return await self.request_api("POST", url, json=data, accept_code=0)
+        return await self.request_api("POST", url, json=data, accept_code=0, model=model)
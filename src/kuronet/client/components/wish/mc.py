@@ -1,20 +1,33 @@
-from typing import Optional, List
+import heapq
+from functools import partial
+from typing import Optional, List, Dict, Any, Mapping, Tuple, AsyncIterator, Union, TYPE_CHECKING
 
 from kuronet.client.components.wish.base import BaseWishClient
 from kuronet.errors import BadRequest, InvalidAuthkey
-from kuronet.models.mc.wish import MCWish, MCBannerType
+from kuronet.utils.concurrency import gather_bounded, iter_completed
 from kuronet.utils.enums import Game
 
+if TYPE_CHECKING:
+    from kuronet.models.mc.wish import MCWish, MCWishHighWaterMark, MCWishSyncResult
+    from kuronet.models.mc.wish_store import MCWishStore
+    from kuronet.models.records import MCWishRecord
+
 __all__ = ("MCWishClient",)
 
 from kuronet.utils.player import recognize_mc_server
 
 
+def _wish_timestamp(wish: "MCWish") -> float:
+    return wish.time.timestamp()
+
+
 class MCWishClient(BaseWishClient):
     """The MCWishClient class for making requests towards the Wish API."""
 
     @staticmethod
-    def fix_wish_item_id(data: List[MCWish]) -> List[MCWish]:
+    def fix_wish_item_id(data: List["MCWish"]) -> List["MCWish"]:
+        from kuronet.models.mc.wish import get_wish_id  # noqa: PLC0415
+
         temp = {}
         now_time_stamp = 0
         for i in data:
@@ -25,20 +38,121 @@ class MCWishClient(BaseWishClient):
                 temp[i.item_id] = 1
             else:
                 temp[i.item_id] += 1
-            item_id = "{:08}".format(i.item_id)
-            i.id = int(f"{int(i.time.timestamp())}{item_id}{temp[i.item_id]}")
+            i.id = get_wish_id(int(i.time.timestamp()), i.item_id, temp[i.item_id])
         return data
 
+    async def _get_banner_records(
+        self,
+        data: Dict[str, Any],
+        banner_type: int,
+        lang: Optional[str],
+        model: Optional[Any] = None,
+    ) -> List[Any]:
+        """Get the wish records of a single banner, raw or built as the given model."""
+        path = "gacha/record/query"
+        data_ = {**data, "cardPoolType": banner_type}
+        try:
+            return await self.request_gacha_info(path, Game.MC, data=data_, lang=lang, model=model)
+        except BadRequest:
+            raise InvalidAuthkey
+
+    @staticmethod
+    def _parse_banner_records(items: List[Dict[str, Any]], banner_type: int) -> List["MCWish"]:
+        """Parse the raw wish records of a single banner, ordered by time."""
+        from kuronet.models.mc.wish import MCBannerType, MCWish  # noqa: PLC0415
+
+        banner_type_ = MCBannerType(banner_type)
+        wishes = [MCWish(**i, banner_type=banner_type_) for i in items]
+        # The records of a banner come newest first. The stable sort keeps wishes of the same second in
+        # the order they came in, as the IDs and the merged history depend on it.
+        wishes.sort(key=_wish_timestamp)
+        return wishes
+
+    async def _get_banner_wishes(
+        self,
+        data: Dict[str, Any],
+        banner_type: int,
+        lang: Optional[str],
+    ) -> List["MCWish"]:
+        """Get the wishes of a single banner, ordered by time."""
+        from kuronet.models.mc.wish import MCBannerType, MCWish  # noqa: PLC0415
+
+        wishes = await self._get_banner_records(data, banner_type, lang, model=List[MCWish]) or []
+        banner_type_ = MCBannerType(banner_type)
+        for wish in wishes:
+            wish.banner_type = banner_type_
+        # The records of a banner come newest first. The stable sort keeps wishes of the same second in
+        # the order they came in, as the IDs and the merged history depend on it.
+        wishes.sort(key=_wish_timestamp)
+        return wishes
+
+    async def _sync_banner_wishes(
+        self,
+        data: Dict[str, Any],
+        banner_type: int,
+        lang: Optional[str],
+        high_water_mark: Optional["MCWishHighWaterMark"],
+    ) -> Tuple[List["MCWish"], List["MCWish"], Optional["MCWishHighWaterMark"]]:
+        """Get the wishes of a single banner made after the high-water mark, and the new high-water mark.
+
+        The wishes made in the same second as the mark that have already been synced are returned as well,
+        and separately, since the IDs of the new wishes of that second depend on them.
+        """
+        from kuronet.models.mc.wish import MCWishHighWaterMark  # noqa: PLC0415
+
+        items = await self._get_banner_records(data, banner_type, lang)
+        if not items:
+            return [], [], high_water_mark
+        # Times are compared as raw strings, so records older than the mark are never parsed.
+        newest = max(item["time"] for item in items)
+        new_high_water_mark = MCWishHighWaterMark(time=newest, count=sum(item["time"] == newest for item in items))
+        if high_water_mark is not None:
+            # Records are returned newest first, so new records made in the same second as
+            # the mark come before the ones that have already been synced.
+            skip_same_time = sum(item["time"] == high_water_mark.time for item in items) - high_water_mark.count
+            new_items = []
+            synced_items = []
+            for item in items:
+                if item["time"] > high_water_mark.time:
+                    new_items.append(item)
+                elif item["time"] == high_water_mark.time:
+                    if skip_same_time > 0:
+                        new_items.append(item)
+                        skip_same_time -= 1
+                    else:
+                        synced_items.append(item)
+            synced_wishes = self._parse_banner_records(synced_items, banner_type)
+            wishes = self._parse_banner_records(new_items, banner_type)
+            # The sort is stable, so the synced wishes stay after the new ones made in the same second.
+            wishes.extend(synced_wishes)
+            wishes.sort(key=_wish_timestamp)
+            return wishes, synced_wishes, new_high_water_mark
+        return self._parse_banner_records(items, banner_type), [], new_high_water_mark
+
+    @staticmethod
+    def _get_wish_request_data(record_id: str, player_id: int) -> Dict[str, Any]:
+        return {
+            "playerId": str(player_id),
+            "cardPoolId": "917dfa695d6c6634ee4e972bb9168f6a",
+            "serverId": recognize_mc_server(player_id),
+            "recordId": record_id,
+        }
+
     async def wish_history(
         self,
         record_id: str,
         banner_types: Optional[List[int]] = None,
         player_id: Optional[int] = None,
         lang: Optional[str] = "zh-Hans",
-    ) -> List[MCWish]:
+        concurrency: int = 4,
+    ) -> Union[List["MCWish"], List["MCWishRecord"]]:
         """
         Get the wish history for a list of banner types.
 
+        The banners are fetched concurrently and merged by time. With `use_records` set on the client,
+        the wishes are returned as `MCWishRecord` objects. The records are converted from the built wishes,
+        so this only reduces the memory held once the history is returned, not the peak memory of the call.
+
         Args:
             record_id (str): The record ID to get the wish history for.
             banner_types (Optional[List[int]], optional): The banner types to get the wish history for.
@@ -47,30 +161,174 @@ class MCWishClient(BaseWishClient):
                 Defaults to None.
             lang (Optional[str], optional): The language code to use for the request.
                 Defaults to None.
+            concurrency (int, optional): The maximum number of banners fetched at once. Defaults to 4.
 
         Returns:
-            List[StarRailWish]: A list of StarRailWish objects representing the retrieved wishes.
+            Union[List[MCWish], List[MCWishRecord]]: The retrieved wishes, ordered by time.
         """
         banner_types = banner_types or [1, 2, 3, 4, 5, 6, 7]
         if isinstance(banner_types, int):
             banner_types = [banner_types]
-        wishes = []
-        path = "gacha/record/query"
-        player_id = player_id or self.player_id
-        server_id = recognize_mc_server(player_id)
-        data_ = {
-            "playerId": str(player_id),
-            "cardPoolId": "917dfa695d6c6634ee4e972bb9168f6a",
-            "serverId": server_id,
-            "recordId": record_id,
-        }
-        for banner_type in banner_types:
-            data_["cardPoolType"] = banner_type
-            banner_type_ = MCBannerType(banner_type)
-            try:
-                items = await self.request_gacha_info(path, Game.MC, data=data_, lang=lang)
-            except BadRequest:
-                raise InvalidAuthkey
-            wishes.extend([MCWish(**i, banner_type=banner_type_) for i in items])
-        temp_data = sorted(wishes, key=lambda wish: wish.time.timestamp())
-        return self.fix_wish_item_id(temp_data)
+        data_ = self._get_wish_request_data(record_id, player_id or self.player_id)
+        banners = await gather_bounded(
+            (partial(self._get_banner_wishes, data_, banner_type, lang) for banner_type in banner_types),
+            concurrency,
+        )
+        temp_data = list(heapq.merge(*banners, key=_wish_timestamp))
+        wishes = self.fix_wish_item_id(temp_data)
+        if self.use_records:
+            from kuronet.models.records import MCWishRecord, to_records  # noqa: PLC0415
+
+            return to_records(MCWishRecord, wishes)
+        return wishes
+
+    async def iter_wish_history(
+        self,
+        record_id: str,
+        banner_types: Optional[List[int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = "zh-Hans",
+        concurrency: int = 4,
+        batch: bool = False,
+    ) -> AsyncIterator[Union["MCWish", "MCWishRecord", List["MCWish"], List["MCWishRecord"]]]:
+        """
+        Get the wish history for a list of banner types, as each banner arrives.
+
+        Each banner is ordered by time and its wish IDs are fixed on its own, which gives the same IDs
+        as `wish_history` unless two banners share a wish of the same item made in the same second.
+        With `use_records` set on the client, the wishes are yielded as `MCWishRecord` objects.
+
+        Args:
+            record_id (str): The record ID to get the wish history for.
+            banner_types (Optional[List[int]], optional): The banner types to get the wish history for.
+                Defaults to None.
+            player_id (Optional[int], optional): The player ID to get the wish history for.
+                Defaults to None.
+            lang (Optional[str], optional): The language code to use for the request.
+                Defaults to None.
+            concurrency (int, optional): The maximum number of banners fetched at once. Defaults to 4.
+            batch (bool, optional): Whether to yield the wishes of each banner as a list. Defaults to False.
+
+        Yields:
+            Union[MCWish, MCWishRecord, List[MCWish], List[MCWishRecord]]: The wishes, or the list of wishes
+                of each banner if `batch` is set.
+        """
+        banner_types = banner_types or [1, 2, 3, 4, 5, 6, 7]
+        if isinstance(banner_types, int):
+            banner_types = [banner_types]
+        data_ = self._get_wish_request_data(record_id, player_id or self.player_id)
+        banners = iter_completed(
+            (partial(self._get_banner_wishes, data_, banner_type, lang) for banner_type in banner_types),
+            concurrency,
+        )
+        async for banner_wishes in banners:
+            wishes = self.fix_wish_item_id(banner_wishes)
+            if self.use_records:
+                from kuronet.models.records import MCWishRecord, to_records  # noqa: PLC0415
+
+                wishes = to_records(MCWishRecord, wishes)
+            if batch:
+                yield wishes
+                continue
+            for wish in wishes:
+                yield wish
+
+    async def wish_history_store(
+        self,
+        record_id: str,
+        banner_types: Optional[List[int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = "zh-Hans",
+        concurrency: int = 4,
+    ) -> "MCWishStore":
+        """
+        Get the wish history for a list of banner types as a compact columnar store.
+
+        The store holds the same wishes, in the same order and with the same IDs, as `wish_history`,
+        without creating an `MCWish` object per record.
+
+        Args:
+            record_id (str): The record ID to get the wish history for.
+            banner_types (Optional[List[int]], optional): The banner types to get the wish history for.
+                Defaults to None.
+            player_id (Optional[int], optional): The player ID to get the wish history for.
+                Defaults to None.
+            lang (Optional[str], optional): The language code to use for the request.
+                Defaults to None.
+            concurrency (int, optional): The maximum number of banners fetched at once. Defaults to 4.
+
+        Returns:
+            MCWishStore: The wish history.
+        """
+        from kuronet.models.mc.wish_store import MCWishStore  # noqa: PLC0415
+
+        banner_types = banner_types or [1, 2, 3, 4, 5, 6, 7]
+        if isinstance(banner_types, int):
+            banner_types = [banner_types]
+        data_ = self._get_wish_request_data(record_id, player_id or self.player_id)
+        banners = await gather_bounded(
+            (partial(self._get_banner_records, data_, banner_type, lang) for banner_type in banner_types),
+            concurrency,
+        )
+        store = MCWishStore()
+        for banner_type, items in zip(banner_types, banners):
+            store.extend_records(items, banner_type)
+        store.sort()
+        store.fix_item_ids()
+        return store
+
+    async def sync_wish_history(
+        self,
+        record_id: str,
+        high_water_marks: Optional[Mapping[int, "MCWishHighWaterMark"]] = None,
+        banner_types: Optional[List[int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = "zh-Hans",
+        concurrency: int = 4,
+    ) -> "MCWishSyncResult":
+        """
+        Get the wishes made since the previous sync.
+
+        Only the records newer than the high-water mark of their banner are parsed. The returned
+        high-water marks should be stored and passed to the next sync. New wishes made in the same second
+        as a high-water mark are numbered together with the wishes already synced, so that their IDs match
+        the ones of `wish_history`.
+
+        Args:
+            record_id (str): The record ID to get the wish history for.
+            high_water_marks (Optional[Mapping[int, MCWishHighWaterMark]], optional): The high-water marks
+                returned by the previous sync, keyed by banner type. Defaults to None, which syncs everything.
+            banner_types (Optional[List[int]], optional): The banner types to get the wish history for.
+                Defaults to None.
+            player_id (Optional[int], optional): The player ID to get the wish history for.
+                Defaults to None.
+            lang (Optional[str], optional): The language code to use for the request.
+                Defaults to None.
+            concurrency (int, optional): The maximum number of banners fetched at once. Defaults to 4.
+
+        Returns:
+            MCWishSyncResult: The new wishes ordered by time, and the updated high-water marks.
+        """
+        from kuronet.models.mc.wish import MCBannerType, MCWishSyncResult  # noqa: PLC0415
+
+        banner_types = banner_types or [1, 2, 3, 4, 5, 6, 7]
+        if isinstance(banner_types, int):
+            banner_types = [banner_types]
+        high_water_marks = {MCBannerType(k): v for k, v in (high_water_marks or {}).items()}
+        data_ = self._get_wish_request_data(record_id, player_id or self.player_id)
+        banners = await gather_bounded(
+            (
+                partial(self._sync_banner_wishes, data_, banner_type, lang, high_water_marks.get(banner_type))
+                for banner_type in banner_types
+            ),
+            concurrency,
+        )
+        synced = set()
+        for banner_type, (_, synced_wishes, high_water_mark) in zip(banner_types, banners):
+            synced.update(map(id, synced_wishes))
+            if high_water_mark is not None:
+                high_water_marks[MCBannerType(banner_type)] = high_water_mark
+        # The IDs are fixed before dropping the synced wishes, so that they match the ones of `wish_history`.
+        temp_data = self.fix_wish_item_id(list(heapq.merge(*(wishes for wishes, _, _ in banners), key=_wish_timestamp)))
+        wishes = [wish for wish in temp_data if id(wish) not in synced]
+        return MCWishSyncResult(wishes=wishes, high_water_marks=high_water_marks)
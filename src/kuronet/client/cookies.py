@@ -1,6 +1,6 @@
-from http.cookiejar import CookieJar
+from http.cookiejar import Cookie, CookieJar, CookiePolicy
 from http.cookies import SimpleCookie
-from typing import Optional, TypeVar
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from httpx import Cookies as _Cookies
 
@@ -13,16 +13,63 @@ IntStr = TypeVar("IntStr", int, str)
 __all__ = (
     "Cookies",
     "CookiesModel",
+    "IndexedCookieJar",
 )
 
 
+class IndexedCookieJar(CookieJar):
+    """A cookie jar that also indexes its cookies by name, so that looking up a cookie does not scan the jar.
+
+    The index is kept in sync by `set_cookie()` and `clear()`, which every other method of the jar goes through.
+    """
+
+    def __init__(self, policy: Optional[CookiePolicy] = None) -> None:
+        super().__init__(policy)
+        self._index: Dict[str, Dict[Tuple[str, str], Cookie]] = {}
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        with self._cookies_lock:
+            super().set_cookie(cookie)
+            self._index.setdefault(cookie.name, {})[(cookie.domain, cookie.path)] = cookie
+
+    def clear(self, domain: Optional[str] = None, path: Optional[str] = None, name: Optional[str] = None) -> None:
+        with self._cookies_lock:
+            super().clear(domain, path, name)
+            if domain is None:
+                self._index.clear()
+                return
+            names = [name] if name is not None else list(self._index)
+            for name_ in names:
+                cookies = self._index[name_]
+                for key in [key for key in cookies if key[0] == domain and (path is None or key[1] == path)]:
+                    del cookies[key]
+                if not cookies:
+                    del self._index[name_]
+
+    def get_cookies(self, name: str) -> List[Cookie]:
+        """Get the cookies with the given name, in the order the jar iterates over them.
+
+        Args:
+            name (str): The name of the cookies.
+
+        Returns:
+            List[Cookie]: The cookies.
+        """
+        cookies = self._index.get(name)
+        if not cookies:
+            return []
+        if len(cookies) == 1:
+            return list(cookies.values())
+        return [cookies[key] for key in sorted(cookies)]
+
+
 class Cookies(_Cookies):
     """A wrapper around `httpx.Cookies` that provides additional functionality."""
 
     jar: CookieJar
 
     def __init__(self, cookies: Optional[CookieTypes] = None):  # skipcq: PYL-W0231
-        self.jar = CookieJar()
+        self.jar = IndexedCookieJar()
         if cookies is None or isinstance(cookies, dict):
             if isinstance(cookies, dict):
                 for key, value in cookies.items():
@@ -45,6 +92,16 @@ class Cookies(_Cookies):
 
     COOKIE_USER_ID_NAMES = ["account_id"]
 
+    def to_indexed(self) -> "Cookies":
+        """Get these cookies backed by an `IndexedCookieJar`, copying them if their jar is not one.
+
+        Returns:
+            Cookies: The cookies.
+        """
+        if isinstance(self.jar, IndexedCookieJar):
+            return self
+        return Cookies(self)
+
     @property
     def account_id(self) -> Optional[int]:
         """Return the user account ID if present in the cookies.
@@ -89,16 +146,16 @@ class Cookies(_Cookies):
         """
         Get a cookie by name. May optionally include domain and path
         in order to specify exactly which cookie to retrieve.
+
+        If several cookies match, the value of the last one the jar iterates over is returned.
         """
+        cookies: Iterable[Cookie] = self.jar.get_cookies(name) if isinstance(self.jar, IndexedCookieJar) else self.jar
         value = None
-        for cookie in self.jar:
+        for cookie in cookies:
             if (
                 cookie.name == name
-                and domain is None
-                or cookie.domain == domain
-                and path is None
-                or cookie.path == path
-                and cookie.value
+                and (domain is None or cookie.domain == domain)
+                and (path is None or cookie.path == path)
             ):
                 value = cookie.value
         if value is None:
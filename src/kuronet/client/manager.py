@@ -0,0 +1,284 @@
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from kuronet.client.mc import MCClient
+from kuronet.client.transport import SharedTransport
+from kuronet.errors import InvalidCookies
+from kuronet.utils.cache import CacheStats
+from kuronet.utils.concurrency import SingleFlight
+from kuronet.utils.enums import Game, Region
+from kuronet.utils.player import recognize_region
+from kuronet.utils.types import CookieTypes
+
+_LOGGER = logging.getLogger("KuroNet.ClientManager")
+
+ClientKey = Tuple[int, Optional[int]]
+CookiesLoader = Callable[[int], Awaitable[Optional[Union[str, CookieTypes]]]]
+
+__all__ = ("ClientManager",)
+
+
+class _ManagedClient:
+    """A client held by the manager together with the time it was last handed out and its leases."""
+
+    __slots__ = ("client", "last_used", "leases", "retired")
+
+    def __init__(self, client: MCClient, last_used: float) -> None:
+        self.client = client
+        self.last_used = last_used
+        self.leases = 0
+        self.retired = False
+
+
+class ClientManager(AsyncContextManager["ClientManager"]):
+    """Hands out `MCClient` instances for many accounts and closes the ones that are not used anymore.
+
+    Clients are created lazily from the stored cookies of an account and keyed by `(account_id, player_id)`.
+    A client is shut down once it has not been handed out for `idle_timeout` seconds, or when the manager
+    holds more than `max_clients` clients, in which case the least recently used one goes first. Every client
+    created by the manager shares one `SharedTransport`.
+
+    A client handed out by `lease()` is not shut down while the lease is held, even if it is evicted; its
+    shutdown is deferred until the last lease is released. A client handed out by `get()` is shut down as soon
+    as it is evicted, so callers should not keep it around for longer than a single command.
+
+    Args:
+        cookies_loader (Optional[CookiesLoader], optional): An async function returning the stored cookies
+            of an account that has not been registered with `add_account()`.
+        max_clients (Optional[int], optional): The maximum number of clients kept open. Defaults to 1000.
+        idle_timeout (Optional[float], optional): The number of seconds after which an unused client is
+            shut down. Defaults to 600.0.
+        transport (Optional[SharedTransport], optional): The connection pool shared by the clients.
+            If not provided, the manager creates one and closes it on `shutdown()`.
+        region (Region, optional): The region of clients created without a player id.
+            Defaults to `Region.CHINESE`.
+        **client_kwargs: Extra keyword arguments passed to every `MCClient`, except the cookies, account id,
+            player id and transport, which are set by the manager.
+
+    Raises:
+        TypeError: If `client_kwargs` holds an argument set by the manager.
+    """
+
+    managed_client_kwargs = frozenset(("cookies", "account_id", "player_id", "transport"))
+    """The arguments of `MCClient` set by the manager itself."""
+
+    def __init__(
+        self,
+        cookies_loader: Optional[CookiesLoader] = None,
+        max_clients: Optional[int] = 1000,
+        idle_timeout: Optional[float] = 600.0,
+        transport: Optional[SharedTransport] = None,
+        region: Region = Region.CHINESE,
+        **client_kwargs: Any,
+    ) -> None:
+        if reserved := self.managed_client_kwargs.intersection(client_kwargs):
+            raise TypeError(f"ClientManager sets these MCClient arguments itself: {', '.join(sorted(reserved))}")
+        self.cookies_loader = cookies_loader
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.region = region
+        self.client_kwargs = client_kwargs
+        self._own_transport = transport is None
+        self.transport = transport or SharedTransport()
+        self._accounts: Dict[int, Union[str, CookieTypes]] = {}
+        self._clients: "OrderedDict[ClientKey, _ManagedClient]" = OrderedDict()
+        self._creating = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: ClientKey) -> bool:
+        return key in self._clients
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counts of the manager."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._clients),
+            maxsize=self.max_clients,
+        )
+
+    def add_account(self, account_id: int, cookies: Union[str, CookieTypes]) -> None:
+        """Store the cookies of an account, so that a client can be created for it later.
+
+        Args:
+            account_id (int): The account id.
+            cookies (Union[str, CookieTypes]): The cookies of the account.
+        """
+        self._accounts[account_id] = cookies
+
+    async def remove_account(self, account_id: int) -> None:
+        """Forget the cookies of an account and shut down its clients, once their leases are released.
+
+        Args:
+            account_id (int): The account id.
+        """
+        self._accounts.pop(account_id, None)
+        for key in [key for key in self._clients if key[0] == account_id]:
+            await self._retire(self._clients.pop(key))
+
+    async def get(self, account_id: int, player_id: Optional[int] = None) -> MCClient:
+        """Get the client of an account, creating it from the stored cookies if needed.
+
+        Args:
+            account_id (int): The account id.
+            player_id (Optional[int], optional): The player id the client is bound to. Defaults to None.
+
+        Returns:
+            MCClient: The client of the account.
+
+        Raises:
+            InvalidCookies: If no cookies are stored for the account.
+        """
+        managed = await self._get_managed(account_id, player_id)
+        await self._evict_overflow()
+        return managed.client
+
+    @asynccontextmanager
+    async def lease(self, account_id: int, player_id: Optional[int] = None) -> AsyncIterator[MCClient]:
+        """Get the client of an account, keeping it open until the block exits even if it is evicted.
+
+        Args:
+            account_id (int): The account id.
+            player_id (Optional[int], optional): The player id the client is bound to. Defaults to None.
+
+        Yields:
+            MCClient: The client of the account.
+
+        Raises:
+            InvalidCookies: If no cookies are stored for the account.
+        """
+        managed = await self._get_managed(account_id, player_id)
+        managed.leases += 1
+        try:
+            await self._evict_overflow()
+            yield managed.client
+        finally:
+            managed.leases -= 1
+            if managed.retired and not managed.leases:
+                await self._shutdown_client(managed.client)
+
+    async def _get_managed(self, account_id: int, player_id: Optional[int]) -> _ManagedClient:
+        now = time.monotonic()
+        await self.evict_idle(now)
+        key = (account_id, player_id)
+        managed = self._clients.get(key)
+        if managed is not None and not managed.client.client.is_closed:
+            self._hits += 1
+            managed.last_used = now
+            self._clients.move_to_end(key)
+            return managed
+
+        self._misses += 1
+        client = await self._creating.do(key, lambda: self._create_client(account_id, player_id))
+        managed = self._clients.get(key)
+        if managed is None or managed.client is not client:
+            managed = self._clients[key] = _ManagedClient(client, now)
+        return managed
+
+    async def _create_client(self, account_id: int, player_id: Optional[int]) -> MCClient:
+        cookies = self._accounts.get(account_id)
+        if cookies is None and self.cookies_loader is not None:
+            cookies = await self.cookies_loader(account_id)
+            if cookies is not None:
+                self._accounts[account_id] = cookies
+        if cookies is None:
+            raise InvalidCookies(message=f"No cookies stored for account {account_id}.")
+        region = recognize_region(player_id, Game.MC) if player_id else None
+        kwargs = {
+            "region": region or self.region,
+            **self.client_kwargs,
+            "cookies": cookies,
+            "account_id": account_id,
+            "player_id": player_id,
+            "transport": self.transport,
+        }
+        return MCClient(**kwargs)
+
+    async def evict_idle(self, now: Optional[float] = None) -> int:
+        """Shut down every client that has not been handed out within the idle timeout.
+
+        Args:
+            now (Optional[float], optional): The current monotonic time. Defaults to `time.monotonic()`.
+
+        Returns:
+            int: The number of evicted clients.
+        """
+        if self.idle_timeout is None:
+            return 0
+        deadline = (time.monotonic() if now is None else now) - self.idle_timeout
+        evicted: List[_ManagedClient] = []
+        while self._clients:
+            key, managed = next(iter(self._clients.items()))
+            if managed.last_used > deadline:
+                break
+            del self._clients[key]
+            evicted.append(managed)
+        for managed in evicted:
+            await self._retire(managed)
+        self._evictions += len(evicted)
+        return len(evicted)
+
+    async def _evict_overflow(self) -> None:
+        if self.max_clients is None:
+            return
+        while len(self._clients) > self.max_clients:
+            _, managed = self._clients.popitem(last=False)
+            self._evictions += 1
+            await self._retire(managed)
+
+    async def _retire(self, managed: _ManagedClient) -> None:
+        """Shut down an evicted client, or once its last lease is released if it is leased."""
+        if managed.leases:
+            managed.retired = True
+        else:
+            await self._shutdown_client(managed.client)
+
+    @staticmethod
+    async def _shutdown_client(client: MCClient) -> None:
+        try:
+            await client.shutdown()
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Failed to shut down client: %s", exc)
+
+    async def shutdown(self) -> None:
+        """Shut down every client held by the manager."""
+        clients = [managed.client for managed in self._clients.values()]
+        self._clients.clear()
+        for client in clients:
+            await self._shutdown_client(client)
+        if self._own_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "ClientManager":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.shutdown()
@@ -1,4 +1,5 @@
-from typing import Dict, Union
+import abc
+from typing import Dict, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 from httpx import URL as _URL
@@ -14,8 +15,10 @@ __all__ = (
     "Route",
     "InternationalRoute",
     "GameRoute",
+    "RouteTable",
     "BBS_URL",
     "GACHA_INFO_URL",
+    "ROUTES",
 )
 
 
@@ -72,9 +75,23 @@ class URL(_URL):
         return URL(str(self).replace(old, new))
 
 
-class BaseRoute:
+class BaseRoute(abc.ABC):
     """A base class for defining routes with useful metadata."""
 
+    @abc.abstractmethod
+    def resolve(self, region: Optional[Region] = None, game: Optional[Game] = None) -> URL:
+        """
+        Get the URL of this route for the given region and game, ignoring the ones it does not depend on.
+
+        Args:
+            region (Optional[Region], optional): The region to get the URL for.
+            game (Optional[Game], optional): The game to get the URL for.
+
+        Returns:
+            URL: The URL of this route.
+
+        """
+
 
 class Route(BaseRoute):
     """A standard route with a single URL."""
@@ -101,6 +118,9 @@ class Route(BaseRoute):
         """
         return self.url
 
+    def resolve(self, region: Optional[Region] = None, game: Optional[Game] = None) -> URL:  # noqa: ARG002
+        return self.get_url()
+
     def __truediv__(self, other: str) -> URL:
         """
         Append the given URL to this route using the '/' operator.
@@ -153,6 +173,9 @@ class InternationalRoute(BaseRoute):
 
         return self.urls[region]
 
+    def resolve(self, region: Optional[Region] = None, game: Optional[Game] = None) -> URL:  # noqa: ARG002
+        return self.get_url(region)
+
 
 class GameRoute(BaseRoute):
     """A route with URLs for different games and regions."""
@@ -201,6 +224,66 @@ class GameRoute(BaseRoute):
 
         return self.urls[region][game]
 
+    def resolve(self, region: Optional[Region] = None, game: Optional[Game] = None) -> URL:
+        return self.get_url(region, game)
+
+
+class RouteTable:
+    """A table of the final URLs of endpoints, each resolved once and then looked up.
+
+    Args:
+        maxsize (Optional[int], optional): The maximum number of URLs kept, or `None` for no limit.
+            URLs past the limit are resolved on every call. Defaults to 4096.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 4096) -> None:
+        self.maxsize = maxsize
+        self._urls: Dict[Tuple[BaseRoute, Optional[Region], Optional[Game], Tuple[str, ...]], URL] = {}
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def get_url(
+        self,
+        route: BaseRoute,
+        *paths: str,
+        region: Optional[Region] = None,
+        game: Optional[Game] = None,
+    ) -> URL:
+        """
+        Get the URL of an endpoint of a route.
+
+        The paths are joined the same way as `route.get_url(...) / path / ...`, including relative
+        paths such as `../../encourage/signIn/initSignInV2`.
+
+        Args:
+            route (BaseRoute): The route of the endpoint.
+            *paths (str): The paths appended to the URL of the route, in order.
+            region (Optional[Region], optional): The region of the endpoint.
+            game (Optional[Game], optional): The game of the endpoint.
+
+        Returns:
+            URL: The URL of the endpoint.
+
+        Raises:
+            RegionNotSupported: If the route does not support the region.
+            NotSupported: If the route does not support the game.
+
+        """
+        key = (route, region, game, paths)
+        url = self._urls.get(key)
+        if url is None:
+            url = route.resolve(region, game)
+            for path in paths:
+                url = url / path
+            if self.maxsize is None or len(self._urls) < self.maxsize:
+                self._urls[key] = url
+        return url
+
+    def clear(self) -> None:
+        """Remove every URL."""
+        self._urls.clear()
+
 
 BBS_URL = InternationalRoute(
     overseas="",
@@ -214,3 +297,5 @@ GACHA_INFO_URL = GameRoute(
         mc="https://gmserver-api.aki-game2.com",
     ),
 )
+ROUTES = RouteTable()
+"""The route table shared by every client."""
@@ -0,0 +1,129 @@
+import logging
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
+
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, Limits, Request, Response
+
+_LOGGER = logging.getLogger("KuroNet.SharedTransport")
+
+__all__ = ("SharedTransport",)
+
+
+class SharedTransport(AsyncBaseTransport):
+    """A connection pool that can be shared by many clients.
+
+    Every `BaseClient` normally owns its own `httpx.AsyncClient` and therefore its own connection pool.
+    Passing the same `SharedTransport` to many clients makes them reuse a single pool per host, so that
+    connections, file descriptors and TLS handshakes scale with the number of hosts instead of the number
+    of accounts. Cookies, `user_token` and b-at state stay on each client.
+
+    Clients never close a shared transport when they shut down. Call `aclose()` on the transport itself
+    (or use it as an async context manager) once every client using it is done.
+
+    Args:
+        max_connections_per_host (Optional[int], optional): The maximum number of concurrent connections
+            to a single host. Defaults to 100.
+        max_keepalive_connections_per_host (Optional[int], optional): The maximum number of idle connections
+            kept alive for a single host. Defaults to 20.
+        keepalive_expiry (Optional[float], optional): The time in seconds an idle connection is kept alive.
+            Defaults to 30.0.
+        http2 (bool, optional): Whether to enable HTTP/2. Defaults to False.
+        retries (int, optional): The number of connection retries. Defaults to 0.
+
+    Attributes:
+        limits (Limits): The connection limits applied to every host.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: Optional[int] = 100,
+        max_keepalive_connections_per_host: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+        http2: bool = False,
+        retries: int = 0,
+    ) -> None:
+        self.limits = Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.retries = retries
+        self._transports: Dict[Tuple[bytes, bytes, Optional[int]], AsyncHTTPTransport] = {}
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the transport has been closed."""
+        return self._closed
+
+    @property
+    def hosts(self) -> int:
+        """The number of hosts with an open connection pool."""
+        return len(self._transports)
+
+    def get_transport(self, request: Request) -> AsyncHTTPTransport:
+        """Get the connection pool for the host of the given request, creating it if needed.
+
+        Args:
+            request (Request): The request to get the connection pool for.
+
+        Returns:
+            AsyncHTTPTransport: The connection pool for the host.
+        """
+        url = request.url
+        key = (url.raw_scheme, url.raw_host, url.port)
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = AsyncHTTPTransport(limits=self.limits, http2=self.http2, retries=self.retries)
+            self._transports[key] = transport
+        return transport
+
+    def attach(self) -> AsyncBaseTransport:
+        """Get a transport for a single client that shares the connection pools of this transport.
+
+        Returns:
+            AsyncBaseTransport: A transport whose `aclose()` leaves the shared connection pools open.
+        """
+        return _SharedTransportHandle(self)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        """Send the request over the connection pool of its host."""
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the shared transport has been closed.")
+        return await self.get_transport(request).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close every connection pool held by the transport."""
+        if self._closed:
+            _LOGGER.info("This SharedTransport is already closed. Returning.")
+            return
+        self._closed = True
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+    async def __aenter__(self) -> "SharedTransport":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self.aclose()
+
+
+class _SharedTransportHandle(AsyncBaseTransport):
+    """A view of a `SharedTransport` handed to a single client, which does not close the pool with it."""
+
+    def __init__(self, transport: SharedTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Closing a client must not close the connection pools shared with other clients."""
@@ -1,5 +1,11 @@
+import copy
 import datetime
+import functools
+import gc
+import importlib
+import pkgutil
 import typing
+import weakref
 
 from pydantic import (
     ConfigDict,
@@ -7,19 +13,523 @@ from pydantic import (
     Field as PydanticField,
     AfterValidator,
     BeforeValidator,
+    TypeAdapter,
     WrapSerializer,
+    create_model,
+    model_validator,
 )
 
+from kuronet.utils.cache import LRUCache
+from kuronet.utils.enums import ValidationMode
+
 if typing.TYPE_CHECKING:
-    from pydantic import SerializerFunctionWrapHandler, SerializationInfo
+    from pydantic import SerializerFunctionWrapHandler, SerializationInfo, ModelWrapValidatorHandler
+    from pydantic.fields import FieldInfo
 
 CN_TIMEZONE = datetime.timezone(datetime.timedelta(hours=8))
 
+_NoneType = type(None)
+_SCALAR_TYPES = frozenset((str, int, float, bool))
+_object_setattr = object.__setattr__
+# The models with fields built on first access. Models are only walked for pending fields once there is one.
+_lazy_models: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+
+class _LazyValue:
+    """The raw data of a field that has not been built yet, and the function building it."""
+
+    __slots__ = ("raw", "build")
+
+    def __init__(self, raw: typing.Any, build: typing.Callable[[typing.Any], typing.Any]) -> None:
+        self.raw = raw
+        self.build = build
+
+    def __repr__(self) -> str:
+        # Pending fields are shown as their raw data, so that `repr()` never validates them.
+        return repr(self.raw)
+
+
+class _LazyField:
+    """A descriptor building the raw data of a field of a lazy model on first access."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: typing.Optional["APIModel"], owner: typing.Type["APIModel"]) -> typing.Any:
+        if instance is None:
+            return self
+        values = instance.__dict__
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if type(value) is _LazyValue:
+            value = values[self.name] = value.build(value.raw)
+        return value
+
+    def __set__(self, instance: "APIModel", value: typing.Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+def _unwrap_optional(annotation: typing.Any) -> typing.Any:
+    """Get `X` from an annotation of the form `Optional[X]`, or the annotation itself."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not _NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _get_model_type(annotation: typing.Any) -> typing.Optional[typing.Type["APIModel"]]:
+    """Get the model of an annotation of the form `Model` or `Optional[Model]`."""
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, APIModel):
+        return annotation
+    return None
+
+
+def _get_list_model_type(annotation: typing.Any) -> typing.Optional[typing.Type["APIModel"]]:
+    """Get the model of an annotation of the form `List[Model]`, with optional models or an optional list."""
+    annotation = _unwrap_optional(annotation)
+    if typing.get_origin(annotation) is list:
+        return _get_model_type(typing.get_args(annotation)[0])
+    return None
+
+
+def _contains_model(annotation: typing.Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in typing.get_args(annotation))
+
+
+def _has_nested_models(model: typing.Optional[typing.Type["APIModel"]]) -> bool:
+    return model is not None and any(_contains_model(field.annotation) for field in model.model_fields.values())
+
+
+def _get_field_type(field: "FieldInfo") -> typing.Any:
+    """Get the annotation of a field, with the validators and serializers of `Annotated` types."""
+    return typing.Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+
+
+def _build_lazy_model(model: typing.Type["APIModel"], raw: typing.Any) -> typing.Any:
+    return None if raw is None else model.validate_lazy(raw)
+
+
+def _build_lazy_model_list(model: typing.Type["APIModel"], raw: typing.Any) -> typing.Any:
+    if raw is None:
+        return None
+    if not isinstance(raw, list):
+        raise TypeError(f"Expected a list of {model.__name__}, got {type(raw).__name__}")
+    return [None if item is None else model.validate_lazy(item) for item in raw]
+
+
+def _get_lazy_builder(field: "FieldInfo") -> typing.Callable[[typing.Any], typing.Any]:
+    """Get the function validating the raw data of a field holding other models."""
+    # Models without nested models gain nothing from being validated lazily.
+    if not field.metadata:
+        if _has_nested_models(model := _get_model_type(field.annotation)):
+            return functools.partial(_build_lazy_model, model)
+        if _has_nested_models(model := _get_list_model_type(field.annotation)):
+            return functools.partial(_build_lazy_model_list, model)
+    return get_type_adapter(_get_field_type(field)).validate_python
+
+
+def _construct_model(model: typing.Type["APIModel"], raw: typing.Any) -> typing.Any:
+    return None if raw is None else model.construct_trusted(raw)
+
+
+def _construct_model_list(model: typing.Type["APIModel"], raw: typing.Any) -> typing.Any:
+    if raw is None:
+        return None
+    return [None if item is None else model.construct_trusted(item) for item in raw]
+
+
+def get_trusted_builder(type_: typing.Any) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Get the function building a type from trusted data without validating it.
+
+    Models, optional models and lists of them are built with `APIModel.construct_trusted`.
+    Any other type is validated as usual.
+
+    Args:
+        type_ (typing.Any): The type to build, such as a model or `List[MCWish]`.
+
+    Returns:
+        Callable: The function building the type from decoded JSON data.
+    """
+    if model := _get_model_type(type_):
+        return functools.partial(_construct_model, model)
+    if model := _get_list_model_type(type_):
+        return functools.partial(_construct_model_list, model)
+    return get_type_adapter(type_).validate_python
+
+
+def _materialize(value: typing.Any) -> None:
+    """Build every pending field of lazy models, recursively.
+
+    Every field is walked, since a lazy model may be held by a model that was validated as usual.
+    """
+    if not _lazy_models:
+        return
+    if isinstance(value, APIModel):
+        values = value.__dict__
+        for name, item in values.items():
+            if type(item) is _LazyValue:
+                built = values[name] = item.build(item.raw)
+                _materialize(built)
+            else:
+                _materialize(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _materialize(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _materialize(item)
+
 
 class APIModel(BaseModel):
     """A Pydantic BaseModel class used for modeling JSON data returned by an API."""
 
-    model_config = ConfigDict(coerce_numbers_to_str=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(coerce_numbers_to_str=True, arbitrary_types_allowed=True, defer_build=True)
+    """The validators of models are built on first use, or by `prewarm_models()`."""
+
+    @classmethod
+    def _get_eager_config(cls) -> ConfigDict:
+        """Get the config of this model for the helpers built on first use, which are not deferred again."""
+        return ConfigDict(**{**cls.model_config, "defer_build": False})
+
+    @classmethod
+    def _get_lazy_fields(cls) -> typing.Tuple[str, ...]:
+        """Get the fields of this model that hold other models.
+
+        The fields are replaced with descriptors building their raw data on first access. Models without
+        such fields are left as they are.
+        """
+        lazy_fields = cls.__dict__.get("__lazy_fields__")
+        if lazy_fields is None:
+            lazy_fields = tuple(name for name, field in cls.model_fields.items() if _contains_model(field.annotation))
+            if lazy_fields:
+                for name in lazy_fields:
+                    type.__setattr__(cls, name, _LazyField(name))
+                type.__setattr__(cls, "__lazy_fields__", lazy_fields)
+                _lazy_models.add(cls)
+        return lazy_fields
+
+    @classmethod
+    def _get_lazy_validator(cls) -> typing.Optional[typing.Tuple[typing.Type[BaseModel], typing.Dict[str, typing.Any]]]:
+        """Get the model validating the fields of this model that do not hold other models,
+        and the function validating each of the other fields.
+        """
+        if "__lazy_validator__" in cls.__dict__:
+            return cls.__lazy_validator__
+        lazy_fields = cls._get_lazy_fields()
+        validator = None
+        if lazy_fields and not cls.__pydantic_decorators__.model_validators:
+            fields = {}
+            for name, field in cls.model_fields.items():
+                shallow_field = field
+                if name in lazy_fields:
+                    shallow_field = copy.copy(field)
+                    shallow_field.annotation = typing.Any
+                    shallow_field.metadata = []
+                fields[name] = (shallow_field.annotation, shallow_field)
+            validator = (
+                create_model(f"{cls.__name__}Shallow", __config__=cls._get_eager_config(), **fields),
+                {name: _get_lazy_builder(cls.model_fields[name]) for name in lazy_fields},
+            )
+        type.__setattr__(cls, "__lazy_validator__", validator)
+        return validator
+
+    @classmethod
+    def validate_lazy(cls, obj: typing.Any) -> "APIModel":
+        """Validate the data of a model, deferring the validation of the fields holding other models.
+
+        The fields holding other models, or lists of them, are kept as raw data and validated on first
+        access. Errors in them are raised on access instead of here. Dumping, comparing or pickling the
+        model validates every pending field first.
+
+        Args:
+            obj (typing.Any): The data to validate.
+
+        Returns:
+            The model.
+        """
+        if isinstance(obj, cls):
+            return obj
+        validator = cls._get_lazy_validator()
+        if validator is None or not isinstance(obj, dict):
+            return cls.model_validate(obj)
+        shallow_model, builders = validator
+        shallow = shallow_model.model_validate(obj)
+        values = shallow.__dict__
+        fields_set = shallow.model_fields_set
+        for name, build in builders.items():
+            if name in fields_set and values[name] is not None:
+                values[name] = _LazyValue(values[name], build)
+        return cls.model_construct(fields_set, **values)
+
+    @classmethod
+    def _get_trusted_plan(
+        cls,
+    ) -> typing.Optional[typing.Tuple[typing.Tuple[str, str, bool, typing.Any, typing.Optional[type]], ...]]:
+        """Get the name, input key, laziness, builder and scalar type of each field of this model.
+
+        Values of the scalar type of their field are kept as they are, and other values are built.
+        """
+        if "__trusted_plan__" in cls.__dict__:
+            return cls.__trusted_plan__
+        plan = None
+        if not cls.__private_attributes__ and not cls.__pydantic_post_init__:
+            lazy_fields = cls._get_lazy_fields()
+            plan = []
+            for name, field in cls.model_fields.items():
+                field_type = _get_field_type(field)
+                scalar_type = _unwrap_optional(field.annotation)
+                if field.metadata or scalar_type not in _SCALAR_TYPES:
+                    scalar_type = None
+                if name in lazy_fields:
+                    build = get_trusted_builder(field_type)
+                else:
+                    # Scalars of another type, such as numbers in string fields, are coerced as usual.
+                    build = TypeAdapter(field_type, config=cls._get_eager_config()).validate_python
+                plan.append((name, field.alias or name, name in lazy_fields, build, scalar_type))
+            plan = tuple(plan)
+        type.__setattr__(cls, "__trusted_plan__", plan)
+        return plan
+
+    @classmethod
+    def construct_trusted(cls, obj: typing.Any) -> "APIModel":
+        """Build a model from trusted data without validating it.
+
+        Strings, integers, floats and booleans of the type of their field are kept as they are, and other
+        values of such fields are coerced as usual, such as numbers into strings. Aliases and defaults are
+        applied as usual. Fields such as `DateTimeField` are still converted. The fields holding other models
+        are built the same way on first access. Fields missing from the data are left unset if they have
+        no default.
+
+        Args:
+            obj (typing.Any): The decoded JSON data.
+
+        Returns:
+            The model.
+        """
+        if isinstance(obj, cls):
+            return obj
+        plan = cls._get_trusted_plan()
+        if plan is None or not isinstance(obj, dict):
+            return cls.model_validate(obj)
+        values = {}
+        for name, key, lazy, build, scalar_type in plan:
+            if key in obj:
+                raw = obj[key]
+                if raw is None or type(raw) is scalar_type:
+                    values[name] = raw
+                elif lazy:
+                    values[name] = _LazyValue(raw, build)
+                else:
+                    values[name] = build(raw)
+        fields_set = set(values)
+        if len(values) != len(plan):
+            fields = cls.model_fields
+            if any(fields[name].is_required() for name in fields.keys() - fields_set):
+                return cls.model_construct(fields_set, **values)
+            values = {
+                name: values[name] if name in fields_set else field.get_default(call_default_factory=True)
+                for name, field in fields.items()
+            }
+        # The model is set up the same way as `model_construct` does, without its overhead.
+        model = cls.__new__(cls)
+        _object_setattr(model, "__dict__", values)
+        _object_setattr(model, "__pydantic_fields_set__", fields_set)
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
+
+    def model_dump(self, **kwargs: typing.Any) -> typing.Dict[str, typing.Any]:
+        _materialize(self)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: typing.Any) -> str:
+        _materialize(self)
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        _materialize(self)
+        _materialize(other)
+        return super().__eq__(other)
+
+    def __iter__(self) -> typing.Any:
+        _materialize(self)
+        return super().__iter__()
+
+    def __getstate__(self) -> typing.Dict[typing.Any, typing.Any]:
+        _materialize(self)
+        return super().__getstate__()
+
+
+class FlyweightPool:
+    """A bounded pool sharing equal flyweight models, and their long strings, across responses.
+
+    Both the models and the strings are evicted least recently used first. The hit rates are available
+    from `models.stats` and `strings.stats`.
+
+    Args:
+        maxsize (Optional[int], optional): The maximum number of models, or `None` for no limit.
+            Defaults to 16384.
+        string_maxsize (Optional[int], optional): The maximum number of strings, or `None` for no limit.
+            Defaults to 65536.
+        min_string_length (int, optional): The length under which strings are not pooled. Defaults to 16.
+    """
+
+    def __init__(
+        self,
+        maxsize: typing.Optional[int] = 16384,
+        string_maxsize: typing.Optional[int] = 65536,
+        min_string_length: int = 16,
+    ) -> None:
+        self.models: LRUCache[typing.Tuple[typing.Any, ...], "FlyweightModel"] = LRUCache(maxsize)
+        self.strings: LRUCache[str, str] = LRUCache(string_maxsize)
+        self.min_string_length = min_string_length
+
+    def share_string(self, value: str) -> str:
+        """Get the pooled string equal to a string, pooling it if there is none."""
+        if len(value) < self.min_string_length:
+            return value
+        shared = self.strings.get(value)
+        if shared is None:
+            self.strings.set(value, value)
+            return value
+        return shared
+
+    def share(self, model: "FlyweightModel") -> "FlyweightModel":
+        """Get the pooled model equal to a model, pooling it if there is none.
+
+        Args:
+            model (FlyweightModel): The model.
+
+        Returns:
+            FlyweightModel: The pooled model, or the model itself.
+        """
+        values = model.__dict__
+        for name, value in values.items():
+            if type(value) is str:
+                values[name] = self.share_string(value)
+        key = (type(model), *values.values())
+        try:
+            shared = self.models.get(key)
+        except TypeError:
+            return model
+        if shared is None:
+            self.models.set(key, model)
+            return model
+        return shared
+
+    def clear(self) -> None:
+        """Remove every pooled model and string."""
+        self.models.clear()
+        self.strings.clear()
+
+
+_flyweight_pool = FlyweightPool()
+
+
+def get_flyweight_pool() -> FlyweightPool:
+    """Get the pool shared by every flyweight model."""
+    return _flyweight_pool
+
+
+def set_flyweight_pool(pool: FlyweightPool) -> None:
+    """Set the pool shared by every flyweight model, such as one with other limits.
+
+    Args:
+        pool (FlyweightPool): The pool.
+    """
+    global _flyweight_pool  # noqa: PLW0603
+    _flyweight_pool = pool
+
+
+class FlyweightModel(APIModel, frozen=True):
+    """A model of data that is the same for every player, such as skill or weapon descriptions.
+
+    Equal instances are shared across responses through the flyweight pool, so they are frozen.
+    """
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _share(cls, data: typing.Any, handler: "ModelWrapValidatorHandler[FlyweightModel]") -> "FlyweightModel":
+        return _flyweight_pool.share(handler(data))
+
+    @classmethod
+    def construct_trusted(cls, obj: typing.Any) -> "APIModel":
+        return _flyweight_pool.share(super().construct_trusted(obj))
+
+
+def _iter_subclasses(cls: typing.Type[APIModel]) -> typing.Iterator[typing.Type[APIModel]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_subclasses(subclass)
+
+
+def prewarm_models(
+    models: typing.Optional[typing.Iterable[typing.Type[APIModel]]] = None,
+    mode: ValidationMode = ValidationMode.PYTHON,
+    freeze: bool = False,
+) -> int:
+    """Build the validators of models ahead of their first use.
+
+    Call this in a parent process before forking workers, so that the children share the built validators
+    through copy-on-write instead of each building its own.
+
+    Args:
+        models (Optional[Iterable[Type[APIModel]]], optional): The models to build. Defaults to None, which
+            imports every module of `kuronet.models` and builds all of their models.
+        mode (ValidationMode, optional): The validation mode the workers use, whose helpers are built too.
+            Defaults to `ValidationMode.PYTHON`.
+        freeze (bool, optional): Whether to move every object to the permanent generation of the garbage
+            collector afterwards with `gc.freeze()`, so that collections in the children do not write to
+            the pages shared with the parent. Defaults to False.
+
+    Returns:
+        int: The number of models built.
+    """
+    if models is None:
+        package = importlib.import_module("kuronet.models")
+        for module in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+            importlib.import_module(module.name)
+        models = [model for model in _iter_subclasses(APIModel) if model.__module__.startswith("kuronet.")]
+    mode = ValidationMode(mode)
+    count = 0
+    for model in models:
+        model.model_rebuild()
+        if mode is ValidationMode.JSON:
+            get_type_adapter(model)
+        elif mode is ValidationMode.LAZY:
+            model._get_lazy_validator()
+        elif mode is ValidationMode.TRUSTED:
+            model._get_trusted_plan()
+        count += 1
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return count
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_adapter(type_: typing.Any) -> TypeAdapter:
+    """
+    Get the cached TypeAdapter of a type, such as a model or `List[MCWish]`.
+
+    Building a TypeAdapter compiles its validator, so it is done once per type.
+
+    Args:
+        type_ (typing.Any): The type to validate.
+
+    Returns:
+        TypeAdapter: The TypeAdapter of the type.
+    """
+    return TypeAdapter(type_)
 
 
 def Field(
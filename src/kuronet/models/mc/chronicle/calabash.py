@@ -1,9 +1,9 @@
 from typing import List
 
-from kuronet.models.base import APIModel
+from kuronet.models.base import APIModel, FlyweightModel
 
 
-class MCCalabashPhantomItem(APIModel):
+class MCCalabashPhantomItem(FlyweightModel):
     """MC Calabash Phantom item."""
 
     name: str
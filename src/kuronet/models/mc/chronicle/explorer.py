@@ -1,6 +1,6 @@
 from typing import List
 
-from kuronet.models.base import APIModel
+from kuronet.models.base import APIModel, FlyweightModel
 
 
 class MCExplorerAreaItem(APIModel):
@@ -22,7 +22,7 @@ class MCExplorerAreaInfo(APIModel):
     itemList: List[MCExplorerAreaItem]
 
 
-class MCExplorerCountry(APIModel):
+class MCExplorerCountry(FlyweightModel):
     """Country info list item."""
 
     bgColor: str
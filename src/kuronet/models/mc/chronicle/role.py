@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from kuronet.models.base import APIModel
+from kuronet.models.base import APIModel, FlyweightModel
 from kuronet.models.mc.character import MCRole
 
 
@@ -11,7 +11,7 @@ class MCRoles(APIModel):
     showToGuest: bool
 
 
-class MCRoleChain(APIModel):
+class MCRoleChain(FlyweightModel):
     """Chain list item."""
 
     name: str
@@ -21,7 +21,7 @@ class MCRoleChain(APIModel):
     unlocked: bool
 
 
-class MCRoleWeaponDetail(APIModel):
+class MCRoleWeaponDetail(FlyweightModel):
     """Role weapon detail."""
 
     weaponId: int
@@ -41,7 +41,7 @@ class MCRoleWeaponData(APIModel):
     resonLevel: int
 
 
-class MCRolePhantomPhantomProp(APIModel):
+class MCRolePhantomPhantomProp(FlyweightModel):
     """Role phantom prop."""
 
     phantomPropId: int
@@ -53,7 +53,7 @@ class MCRolePhantomPhantomProp(APIModel):
     skillDescription: str
 
 
-class MCRolePhantomFetterDetail(APIModel):
+class MCRolePhantomFetterDetail(FlyweightModel):
     """Role phantom fetter detail."""
 
     groupId: int
@@ -81,7 +81,7 @@ class MCRolePhantomData(APIModel):
     equipPhantomList: Optional[List[Optional[MCRolePhantomDetail]]] = None
 
 
-class MCRoleSkillDetail(APIModel):
+class MCRoleSkillDetail(FlyweightModel):
     """Role skill detail."""
 
     id: int
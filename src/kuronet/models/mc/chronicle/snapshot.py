@@ -0,0 +1,27 @@
+from typing import Optional
+
+from kuronet.models.base import APIModel
+from kuronet.models.mc.chronicle.calabash import MCCalabash
+from kuronet.models.mc.chronicle.explorer import MCExplorer
+from kuronet.models.mc.chronicle.notes import MCNote, MCNoteWidget
+from kuronet.models.mc.chronicle.role import MCRoles
+
+
+class MCSnapshot(APIModel):
+    """A snapshot of the chronicle data of a player.
+
+    Sections that were not requested are None.
+
+    Attributes:
+        notes: The notes of the player.
+        roles: The roles of the player.
+        explorer: The explorer of the player.
+        calabash: The calabash of the player.
+        widget: The notes widget of the player.
+    """
+
+    notes: Optional[MCNote] = None
+    roles: Optional[MCRoles] = None
+    explorer: Optional[MCExplorer] = None
+    calabash: Optional[MCCalabash] = None
+    widget: Optional[MCNoteWidget] = None
@@ -1,5 +1,5 @@
 from enum import IntEnum
-from typing import Optional
+from typing import Dict, List, Optional
 
 from kuronet.models.base import APIModel, Field, DateTimeField
 
@@ -26,6 +26,32 @@ class MCBannerType(IntEnum):
     """Temporary banner."""
 
 
+def _count_digits(value: int) -> int:
+    digits = 1
+    while value >= 10:
+        value //= 10
+        digits += 1
+    return digits
+
+
+def get_wish_id(timestamp: int, item_id: int, sequence: int) -> int:
+    """Compose the ID of a wish from its time, item ID and position among the same items made at that time.
+
+    This is the arithmetic equivalent of `int(f"{timestamp}{item_id:08}{sequence}")`.
+
+    Args:
+        timestamp (int): The POSIX timestamp of the wish.
+        item_id (int): The ID of the wished item.
+        sequence (int): The position of the wish among the wishes of the same item made at the same time.
+
+    Returns:
+        int: The ID of the wish.
+    """
+    item_digits = 8 if item_id < 100_000_000 else _count_digits(item_id)
+    sequence_digits = 1 if sequence < 10 else _count_digits(sequence)
+    return (timestamp * 10**item_digits + item_id) * 10**sequence_digits + sequence
+
+
 class MCWish(APIModel, frozen=False):
     """Wish made on any banner."""
 
@@ -55,3 +81,23 @@ class MCWish(APIModel, frozen=False):
 
     banner_type: Optional[MCBannerType] = None
     """Type of the banner the wish was made on."""
+
+
+class MCWishHighWaterMark(APIModel):
+    """The newest wish record of a banner that has already been synced."""
+
+    time: str
+    """Time of the newest record, as returned by the API (`YYYY-MM-DD HH:MM:SS`)."""
+
+    count: int = 1
+    """Number of records made at that time."""
+
+
+class MCWishSyncResult(APIModel):
+    """Result of an incremental wish history sync."""
+
+    wishes: List[MCWish]
+    """Wishes made after the previous high-water marks, ordered by time."""
+
+    high_water_marks: Dict[MCBannerType, MCWishHighWaterMark]
+    """Updated high-water marks, to be passed to the next sync."""
@@ -0,0 +1,240 @@
+"""Gacha analytics over whole wish histories, computed with NumPy.
+
+This module requires NumPy, which can be installed with `pip install kuronet[analytics]`.
+"""
+
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Union
+
+from kuronet.models.base import APIModel
+from kuronet.models.mc.wish import MCBannerType, MCWish
+from kuronet.models.mc.wish_store import MCWishStore
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = (
+    "MCWishRarityStats",
+    "MCWishBannerStats",
+    "analyze_wish_history",
+    "analyze_wish_histories",
+)
+
+WishHistory = Union[MCWishStore, Sequence[MCWish]]
+
+
+class MCWishRarityStats(APIModel):
+    """Statistics of the wishes of a rarity on a banner.
+
+    A wish of a higher rarity also resets the counter of a lower rarity.
+    """
+
+    rarity: int
+    """Rarity the statistics are about."""
+
+    count: int
+    """Number of wishes of that rarity."""
+
+    rate: float
+    """Fraction of the wishes on the banner that are of that rarity."""
+
+    intervals: List[int]
+    """Number of wishes it took to get each wish of that rarity or higher."""
+
+    average_interval: Optional[float] = None
+    """Average number of wishes it took to get a wish of that rarity or higher."""
+
+    max_interval: Optional[int] = None
+    """Largest number of wishes it took to get a wish of that rarity or higher."""
+
+    pity: int
+    """Number of wishes made since the last wish of that rarity or higher."""
+
+
+class MCWishBannerStats(APIModel):
+    """Statistics of the wishes on a banner."""
+
+    banner_type: MCBannerType
+    """Type of the banner."""
+
+    total: int
+    """Number of wishes on the banner."""
+
+    rarities: Dict[int, MCWishRarityStats]
+    """Statistics per rarity."""
+
+    wins: Optional[int] = None
+    """Number of 50/50s won, if standard items were given."""
+
+    losses: Optional[int] = None
+    """Number of 50/50s lost, if standard items were given."""
+
+    longest_win_streak: Optional[int] = None
+    """Longest run of 50/50s won in a row, if standard items were given."""
+
+    longest_loss_streak: Optional[int] = None
+    """Longest run of 50/50s lost in a row, if standard items were given."""
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required for wish analytics. Install it with `pip install kuronet[analytics]`.")
+
+
+def _longest_run(values: "np.ndarray") -> int:
+    """Get the length of the longest run of True values."""
+    if not values.size:
+        return 0
+    padded = np.concatenate(([0], values.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[0::2]).max(initial=0))
+
+
+def _to_store(history: WishHistory) -> MCWishStore:
+    if isinstance(history, MCWishStore):
+        return history
+    return MCWishStore.from_wishes(history)
+
+
+def analyze_wish_histories(
+    histories: Iterable[WishHistory],
+    rarities: Collection[int] = (4, 5),
+    standard_item_ids: Optional[Collection[int]] = None,
+    featured_banner_types: Collection[int] = (MCBannerType.CHARACTER,),
+) -> List[Dict[MCBannerType, MCWishBannerStats]]:
+    """Compute pity counters, intervals, rates and 50/50 results for a batch of wish histories.
+
+    Every history must be ordered by time, as returned by `wish_history` or `wish_history_store`.
+    The histories are concatenated and each statistic is computed in one vectorized pass.
+    Wishes without a banner type are ignored.
+
+    Args:
+        histories (Iterable[WishHistory]): The wish histories, as `MCWishStore` objects or lists of `MCWish`.
+        rarities (Collection[int], optional): The rarities to compute statistics for. Defaults to (4, 5).
+        standard_item_ids (Optional[Collection[int]], optional): The IDs of the 5-star items of the standard
+            pool. If given, 50/50 wins and losses are computed for the featured banners. Defaults to None.
+        featured_banner_types (Collection[int], optional): The banners with a 50/50 on their 5-star items.
+            Defaults to the character banner.
+
+    Returns:
+        List[Dict[MCBannerType, MCWishBannerStats]]: The statistics of each history, per banner type.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    _require_numpy()
+    stores = [_to_store(history) for history in histories]
+    sizes = np.array([len(store) for store in stores], dtype=np.int64)
+    empty = np.empty(0, dtype=np.int64)
+    history_ids = np.repeat(np.arange(len(stores)), sizes)
+    banner_types = np.concatenate([np.frombuffer(store.banner_types, dtype=np.int8) for store in stores] or [empty])
+    item_ids = np.concatenate([np.frombuffer(store.item_ids, dtype=np.int64) for store in stores] or [empty])
+    wish_rarities = np.concatenate([np.frombuffer(store.rarities, dtype=np.int8) for store in stores] or [empty])
+
+    # Group the wishes by (history, banner), keeping the order of the wishes within each group.
+    keep = banner_types > 0
+    group_keys = history_ids[keep] * 256 + banner_types[keep]
+    order = np.argsort(group_keys, kind="stable")
+    group_keys = group_keys[order]
+    item_ids = item_ids[keep][order]
+    wish_rarities = wish_rarities[keep][order]
+    keys, starts, totals = np.unique(group_keys, return_index=True, return_counts=True)
+    group_ids = np.repeat(np.arange(keys.size), totals)
+    positions = np.arange(group_keys.size) - starts[group_ids]
+
+    results: List[Dict[MCBannerType, MCWishBannerStats]] = [{} for _ in stores]
+    rarity_stats: Dict[int, List[Dict[str, object]]] = {}
+    for rarity in rarities:
+        hit = wish_rarities >= rarity
+        hit_groups = group_ids[hit]
+        hit_positions = positions[hit]
+        previous = np.empty_like(hit_positions)
+        if hit_positions.size:
+            previous[0] = -1
+            same_group = hit_groups[1:] == hit_groups[:-1]
+            previous[1:] = np.where(same_group, hit_positions[:-1], -1)
+        intervals = hit_positions - previous
+        counts = np.bincount(group_ids[wish_rarities == rarity], minlength=keys.size)
+        bounds = np.searchsorted(hit_groups, np.arange(keys.size + 1))
+        has_hit = bounds[1:] > bounds[:-1]
+        last = np.where(has_hit, hit_positions[np.maximum(bounds[1:] - 1, 0)] if hit_positions.size else -1, -1)
+        pities = totals - 1 - last
+        rarity_stats[rarity] = [
+            {
+                "count": int(counts[group]),
+                "rate": float(counts[group] / totals[group]),
+                "intervals": intervals[bounds[group] : bounds[group + 1]].tolist(),
+                "pity": int(pities[group]),
+            }
+            for group in range(keys.size)
+        ]
+
+    fifty_fifty: Dict[int, Dict[str, int]] = {}
+    if standard_item_ids is not None:
+        featured = np.isin(group_keys % 256, np.fromiter(featured_banner_types, dtype=np.int64))
+        top = featured & (wish_rarities == 5)
+        top_groups = group_ids[top]
+        lost = np.isin(item_ids[top], np.fromiter(standard_item_ids, dtype=np.int64))
+        # The 5-star item following a lost 50/50 is guaranteed to be featured.
+        guaranteed = np.zeros_like(lost)
+        guaranteed[1:] = lost[:-1] & (top_groups[1:] == top_groups[:-1])
+        bounds = np.searchsorted(top_groups, np.arange(keys.size + 1))
+        for group in np.unique(top_groups):
+            group_lost = lost[bounds[group] : bounds[group + 1]]
+            outcomes = group_lost[~guaranteed[bounds[group] : bounds[group + 1]]]
+            fifty_fifty[int(group)] = {
+                "wins": int((~outcomes).sum()),
+                "losses": int(outcomes.sum()),
+                "longest_win_streak": _longest_run(~outcomes),
+                "longest_loss_streak": _longest_run(outcomes),
+            }
+        for group in np.flatnonzero(np.isin(keys % 256, np.fromiter(featured_banner_types, dtype=np.int64))):
+            fifty_fifty.setdefault(
+                int(group), {"wins": 0, "losses": 0, "longest_win_streak": 0, "longest_loss_streak": 0}
+            )
+
+    for group, key in enumerate(keys.tolist()):
+        history, banner_type = divmod(key, 256)
+        stats = {}
+        for rarity in rarities:
+            values = rarity_stats[rarity][group]
+            intervals = values["intervals"]
+            stats[rarity] = MCWishRarityStats(
+                rarity=rarity,
+                average_interval=sum(intervals) / len(intervals) if intervals else None,
+                max_interval=max(intervals) if intervals else None,
+                **values,
+            )
+        banner_type = MCBannerType(banner_type)
+        results[history][banner_type] = MCWishBannerStats(
+            banner_type=banner_type,
+            total=int(totals[group]),
+            rarities=stats,
+            **fifty_fifty.get(group, {}),
+        )
+    return results
+
+
+def analyze_wish_history(
+    history: WishHistory,
+    rarities: Collection[int] = (4, 5),
+    standard_item_ids: Optional[Collection[int]] = None,
+    featured_banner_types: Collection[int] = (MCBannerType.CHARACTER,),
+) -> Dict[MCBannerType, MCWishBannerStats]:
+    """Compute pity counters, intervals, rates and 50/50 results for a wish history.
+
+    See `analyze_wish_histories` for the details.
+
+    Args:
+        history (WishHistory): The wish history, as an `MCWishStore` or a list of `MCWish` ordered by time.
+        rarities (Collection[int], optional): The rarities to compute statistics for. Defaults to (4, 5).
+        standard_item_ids (Optional[Collection[int]], optional): The IDs of the 5-star items of the standard
+            pool. Defaults to None.
+        featured_banner_types (Collection[int], optional): The banners with a 50/50 on their 5-star items.
+            Defaults to the character banner.
+
+    Returns:
+        Dict[MCBannerType, MCWishBannerStats]: The statistics per banner type.
+    """
+    return analyze_wish_histories([history], rarities, standard_item_ids, featured_banner_types)[0]
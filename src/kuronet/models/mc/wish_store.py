@@ -0,0 +1,254 @@
+import datetime
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union, overload
+
+from kuronet.models.base import CN_TIMEZONE
+from kuronet.models.mc.wish import MCBannerType, MCWish, get_wish_id
+
+__all__ = ("MCWishStore",)
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _StringTable:
+    """An interned table of repeated strings, referenced by index."""
+
+    __slots__ = ("values", "_indexes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._indexes: Dict[str, int] = {}
+
+    def index(self, value: str) -> int:
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+class MCWishStore:
+    """A compact, column-oriented container for wish histories.
+
+    Every wish is stored as one row across typed arrays, with names, types and banner names interned in
+    string tables. `MCWish` objects are only created when a row is accessed.
+
+    Attributes:
+        timestamps (array): The POSIX timestamp of each wish.
+        item_ids (array): The ID of each wished item.
+        rarities (array): The rarity of each wished item.
+        banner_types (array): The banner type of each wish, or 0 if it is unknown.
+        counts (array): The count of each wished item.
+        sequences (array): The position of each wish among the wishes of the same item made at the same time,
+            starting at 1, or 0 if `fix_item_ids()` has not been called.
+    """
+
+    __slots__ = (
+        "timestamps",
+        "item_ids",
+        "rarities",
+        "banner_types",
+        "counts",
+        "sequences",
+        "_name_ids",
+        "_type_ids",
+        "_banner_name_ids",
+        "_names",
+        "_types",
+        "_banner_names",
+        "_time_cache",
+    )
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.item_ids = array("q")
+        self.rarities = array("b")
+        self.banner_types = array("b")
+        self.counts = array("l")
+        self.sequences = array("H")
+        self._name_ids = array("L")
+        self._type_ids = array("L")
+        self._banner_name_ids = array("L")
+        self._names = _StringTable()
+        self._types = _StringTable()
+        self._banner_names = _StringTable()
+        self._time_cache: Dict[str, int] = {}
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        banner_type: Optional[int] = None,
+    ) -> "MCWishStore":
+        """Create a store from the records returned by `gacha/record/query`.
+
+        Args:
+            records (Iterable[Mapping[str, Any]]): The raw wish records.
+            banner_type (Optional[int], optional): The banner type the records were requested for.
+
+        Returns:
+            MCWishStore: The store holding the records.
+        """
+        store = cls()
+        store.extend_records(records, banner_type)
+        return store
+
+    @classmethod
+    def from_wishes(cls, wishes: Iterable[MCWish]) -> "MCWishStore":
+        """Create a store from `MCWish` objects, keeping their order.
+
+        Args:
+            wishes (Iterable[MCWish]): The wishes.
+
+        Returns:
+            MCWishStore: The store holding the wishes.
+        """
+        store = cls()
+        for wish in wishes:
+            store.append(wish)
+        return store
+
+    def _parse_time(self, value: str) -> int:
+        timestamp = self._time_cache.get(value)
+        if timestamp is None:
+            # Parsed the same way as `MCWish.time`, as a naive time in the local timezone.
+            timestamp = int(datetime.datetime.strptime(value, _TIME_FORMAT).timestamp())
+            self._time_cache[value] = timestamp
+        return timestamp
+
+    def extend_records(self, records: Iterable[Mapping[str, Any]], banner_type: Optional[int] = None) -> None:
+        """Append the records returned by `gacha/record/query`.
+
+        Args:
+            records (Iterable[Mapping[str, Any]]): The raw wish records.
+            banner_type (Optional[int], optional): The banner type the records were requested for.
+        """
+        banner_type = int(banner_type or 0)
+        for record in records:
+            self.timestamps.append(self._parse_time(record["time"]))
+            self.item_ids.append(int(record["resourceId"]))
+            self.rarities.append(int(record["qualityLevel"]))
+            self.banner_types.append(banner_type)
+            self.counts.append(int(record["count"]))
+            self.sequences.append(0)
+            self._name_ids.append(self._names.index(str(record["name"])))
+            self._type_ids.append(self._types.index(str(record["resourceType"])))
+            self._banner_name_ids.append(self._banner_names.index(str(record["cardPoolType"])))
+
+    def append(self, wish: MCWish) -> None:
+        """Append a wish.
+
+        Args:
+            wish (MCWish): The wish to append.
+        """
+        self.timestamps.append(int(wish.time.timestamp()))
+        self.item_ids.append(wish.item_id)
+        self.rarities.append(wish.rarity)
+        self.banner_types.append(int(wish.banner_type or 0))
+        self.counts.append(wish.count)
+        self.sequences.append(0)
+        self._name_ids.append(self._names.index(wish.name))
+        self._type_ids.append(self._types.index(wish.type))
+        self._banner_name_ids.append(self._banner_names.index(wish.banner_name))
+
+    def sort(self) -> None:
+        """Sort the wishes by time, keeping the order of wishes made at the same time."""
+        timestamps = self.timestamps
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        for name in (
+            "timestamps",
+            "item_ids",
+            "rarities",
+            "banner_types",
+            "counts",
+            "sequences",
+            "_name_ids",
+            "_type_ids",
+            "_banner_name_ids",
+        ):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[i] for i in order]))
+
+    def fix_item_ids(self) -> None:
+        """Assign the wish IDs the same way as `MCWishClient.fix_wish_item_id`.
+
+        The wishes must be sorted by time.
+        """
+        counters: Dict[int, int] = {}
+        current = None
+        sequences = self.sequences
+        for index, (timestamp, item_id) in enumerate(zip(self.timestamps, self.item_ids)):
+            if timestamp != current:
+                current = timestamp
+                counters.clear()
+            sequence = counters.get(item_id, 0) + 1
+            counters[item_id] = sequence
+            sequences[index] = sequence
+
+    def wish_id(self, index: int) -> int:
+        """Get the ID of the wish at the given index, or 0 if `fix_item_ids()` has not been called."""
+        sequence = self.sequences[index]
+        if not sequence:
+            return 0
+        return get_wish_id(self.timestamps[index], self.item_ids[index], sequence)
+
+    @property
+    def names(self) -> Sequence[str]:
+        """The interned names of the wished items."""
+        return self._names.values
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the columns, excluding the string tables."""
+        columns = (
+            self.timestamps,
+            self.item_ids,
+            self.rarities,
+            self.banner_types,
+            self.counts,
+            self.sequences,
+            self._name_ids,
+            self._type_ids,
+            self._banner_name_ids,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _get_wish(self, index: int) -> MCWish:
+        banner_type = self.banner_types[index]
+        return MCWish(
+            id=self.wish_id(index),
+            resourceType=self._types.values[self._type_ids[index]],
+            resourceId=self.item_ids[index],
+            name=self._names.values[self._name_ids[index]],
+            qualityLevel=self.rarities[index],
+            count=self.counts[index],
+            time=datetime.datetime.fromtimestamp(self.timestamps[index], CN_TIMEZONE),
+            cardPoolType=self._banner_names.values[self._banner_name_ids[index]],
+            banner_type=MCBannerType(banner_type) if banner_type else None,
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> MCWish: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[MCWish]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[MCWish, List[MCWish]]:
+        if isinstance(index, slice):
+            return [self._get_wish(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("wish index out of range")
+        return self._get_wish(index)
+
+    def __iter__(self) -> Iterator[MCWish]:
+        for index in range(len(self)):
+            yield self._get_wish(index)
+
+    def to_wishes(self) -> List[MCWish]:
+        """Convert every row to an `MCWish`."""
+        return list(self)
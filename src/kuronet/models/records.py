@@ -0,0 +1,165 @@
+"""Compact, tuple-backed records of the models returned in large lists.
+
+A record holds the same fields as its model under the same names, without the per-instance dictionary and
+bookkeeping of a pydantic model. Records are immutable; use `_replace()` to change a field.
+"""
+
+import datetime
+from typing import Any, Iterable, NamedTuple, Optional, Type, TypeVar
+
+from kuronet.models.base import APIModel
+from kuronet.models.lab.role import Account
+from kuronet.models.mc.character import MCRole
+from kuronet.models.mc.chronicle.calabash import MCCalabashPhantom, MCCalabashPhantomItem
+from kuronet.models.mc.chronicle.explorer import MCExplorerAreaItem
+from kuronet.models.mc.wish import MCBannerType, MCWish
+
+__all__ = (
+    "MCWishRecord",
+    "MCRoleRecord",
+    "MCCalabashPhantomItemRecord",
+    "MCCalabashPhantomRecord",
+    "MCExplorerAreaItemRecord",
+    "AccountRecord",
+    "to_records",
+)
+
+RecordT = TypeVar("RecordT", bound=tuple)
+
+
+def _values(model: APIModel, fields: Iterable[str]) -> Any:
+    return [getattr(model, name) for name in fields]
+
+
+class MCWishRecord(NamedTuple):
+    """A compact record of `MCWish`."""
+
+    id: Optional[int]
+    type: str
+    item_id: int
+    name: str
+    rarity: int
+    count: int
+    time: datetime.datetime
+    banner_name: str
+    banner_type: Optional[MCBannerType]
+
+    @classmethod
+    def from_model(cls, wish: MCWish) -> "MCWishRecord":
+        return cls._make(_values(wish, cls._fields))
+
+    def to_model(self) -> MCWish:
+        return MCWish.model_construct(**self._asdict())
+
+
+class MCRoleRecord(NamedTuple):
+    """A compact record of `MCRole`."""
+
+    roleId: int
+    level: int
+    roleName: str
+    roleIconUrl: str
+    rolePicUrl: str
+    starLevel: int
+    attributeId: int
+    attributeName: str
+    weaponTypeId: int
+    weaponTypeName: str
+    acronym: str
+
+    @classmethod
+    def from_model(cls, role: MCRole) -> "MCRoleRecord":
+        return cls._make(_values(role, cls._fields))
+
+    def to_model(self) -> MCRole:
+        return MCRole.model_construct(**self._asdict())
+
+
+class MCCalabashPhantomItemRecord(NamedTuple):
+    """A compact record of `MCCalabashPhantomItem`."""
+
+    name: str
+    phantomId: int
+    cost: int
+    iconUrl: str
+    acronym: str
+
+    @classmethod
+    def from_model(cls, item: MCCalabashPhantomItem) -> "MCCalabashPhantomItemRecord":
+        return cls._make(_values(item, cls._fields))
+
+    def to_model(self) -> MCCalabashPhantomItem:
+        return MCCalabashPhantomItem.model_construct(**self._asdict())
+
+
+class MCCalabashPhantomRecord(NamedTuple):
+    """A compact record of `MCCalabashPhantom`, holding a record of its phantom."""
+
+    phantom: MCCalabashPhantomItemRecord
+    star: int
+    maxStar: int
+
+    @classmethod
+    def from_model(cls, phantom: MCCalabashPhantom) -> "MCCalabashPhantomRecord":
+        return cls(MCCalabashPhantomItemRecord.from_model(phantom.phantom), phantom.star, phantom.maxStar)
+
+    def to_model(self) -> MCCalabashPhantom:
+        return MCCalabashPhantom.model_construct(phantom=self.phantom.to_model(), star=self.star, maxStar=self.maxStar)
+
+
+class MCExplorerAreaItemRecord(NamedTuple):
+    """A compact record of `MCExplorerAreaItem`."""
+
+    type: int
+    name: str
+    progress: int
+    icon: str
+
+    @classmethod
+    def from_model(cls, item: MCExplorerAreaItem) -> "MCExplorerAreaItemRecord":
+        return cls._make(_values(item, cls._fields))
+
+    def to_model(self) -> MCExplorerAreaItem:
+        return MCExplorerAreaItem.model_construct(**self._asdict())
+
+
+class AccountRecord(NamedTuple):
+    """A compact record of `Account`."""
+
+    userId: int
+    gameId: int
+    server: str
+    server_name: str
+    uid: int
+    level: int
+    nickname: str
+    isDefault: bool
+    gameHeadUrl: Optional[str]
+    roleNum: int
+    fashionCollectionPercent: float
+    phantomPercent: float
+    achievementCount: int
+    actionRecoverSwitch: bool
+
+    @classmethod
+    def from_model(cls, account: Account) -> "AccountRecord":
+        return cls._make(_values(account, cls._fields))
+
+    def to_model(self) -> Account:
+        return Account.model_construct(**self._asdict())
+
+
+def to_records(record_type: Type[RecordT], models: Optional[Iterable[APIModel]]) -> Optional[list]:
+    """Convert a list of models to records, keeping missing items as None.
+
+    Args:
+        record_type (Type[RecordT]): The record type, such as `MCWishRecord`.
+        models (Optional[Iterable[APIModel]]): The models.
+
+    Returns:
+        Optional[List[RecordT]]: The records, or None if `models` is None.
+    """
+    if models is None:
+        return None
+    from_model = record_type.from_model
+    return [None if model is None else from_model(model) for model in models]
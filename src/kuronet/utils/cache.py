@@ -0,0 +1,252 @@
+"""This module contains helpers for bounded in-memory caches."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Mapping, NamedTuple, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+__all__ = ("CacheStats", "LRUCache", "ResponseCache")
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the statistics of a cache.
+
+    Attributes:
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that did not find an entry.
+        evictions (int): The number of entries removed because they expired or the cache was full.
+        size (int): The number of entries currently held.
+        maxsize (Optional[int]): The maximum number of entries, or `None` if the cache is unbounded.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found an entry."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """A size-bounded mapping that evicts the least recently used entry, with an optional time to live.
+
+    Args:
+        maxsize (Optional[int], optional): The maximum number of entries, or `None` for no limit.
+            Defaults to 128.
+        ttl (Optional[float], optional): The default number of seconds an entry stays valid, or `None`
+            if entries never expire. Defaults to None.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self._lookup(key, time.monotonic()) is not _MISSING
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counts of the cache."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._data),
+            maxsize=self.maxsize,
+        )
+
+    def _lookup(self, key: K, now: float) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._data[key]
+            self._evictions += 1
+            return _MISSING
+        return value
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Get the value of a key, or `default` if it is missing or expired.
+
+        Args:
+            key (K): The key to look up.
+            default (Optional[V], optional): The value returned if the key is missing. Defaults to None.
+
+        Returns:
+            Optional[V]: The value of the key.
+        """
+        value = self._lookup(key, time.monotonic())
+        if value is _MISSING:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Set the value of a key, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (K): The key to set.
+            value (V): The value to set.
+            ttl (Optional[float], optional): The number of seconds the entry stays valid.
+                Defaults to the `ttl` of the cache.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove a key and return its value, or `default` if it is missing or expired."""
+        value = self._lookup(key, time.monotonic())
+        if value is _MISSING:
+            return default
+        del self._data[key]
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ResponseCache:
+    """A size-bounded cache of API responses, for the endpoints that are given a time to live.
+
+    Only the endpoints listed in `ttls` are cached. Responses are cached per account, since the account
+    owning a player may see data that is hidden from guests. A response reporting `showToGuest` as true is
+    shared with every account instead, so a cache shared by several clients, for example through the
+    `client_kwargs` of `ClientManager`, serves a public player looked up by any of them.
+
+    The cached responses are handed to every caller and must not be modified.
+
+    Args:
+        ttls (Optional[Mapping[str, float]], optional): The number of seconds the responses of each endpoint
+            stay valid, such as `{"akiBox/roleData": 30.0}`. Defaults to `default_ttls`.
+        maxsize (Optional[int], optional): The maximum number of responses, or `None` for no limit.
+            Defaults to 1024.
+
+    Attributes:
+        ttls (Dict[str, float]): The number of seconds the responses of each endpoint stay valid.
+    """
+
+    default_ttls: Mapping[str, float] = {
+        "akiBox/roleData": 30.0,
+        "akiBox/exploreIndex": 30.0,
+        "akiBox/calabashData": 30.0,
+        "akiBox/getRoleDetail": 30.0,
+        "forum/companyEvent/findEventList": 300.0,
+    }
+    """The endpoints cached by default, which return the data of a player or of the game."""
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, maxsize: Optional[int] = 1024) -> None:
+        self.ttls: Dict[str, float] = dict(self.default_ttls if ttls is None else ttls)
+        self._cache: LRUCache[Tuple[str, Optional[int], Hashable], Any] = LRUCache(maxsize=maxsize)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counts of the cache."""
+        return self._cache.stats
+
+    @staticmethod
+    def make_key(
+        player_id: Optional[int],
+        url: Any,
+        lang: Optional[str],
+        payload: Any,
+        model: Any = None,
+        mode: Hashable = None,
+    ) -> Hashable:
+        """Build the key of a response from the parameters of its request.
+
+        Args:
+            player_id (Optional[int]): The player id of the request.
+            url (Any): The URL of the request, which tells apart the regions and endpoint types of an endpoint.
+            lang (Optional[str]): The language of the request.
+            payload (Any): The data of the request. Dictionaries and lists may be nested.
+            model (Any, optional): The type the response is built into. Defaults to None.
+            mode (Hashable, optional): How the client builds responses, such as its validation mode,
+                so that clients building them differently do not share them. Defaults to None.
+
+        Returns:
+            Hashable: The key.
+        """
+        return player_id, url, lang, _freeze(payload), model, mode
+
+    @staticmethod
+    def _is_public(value: Any) -> bool:
+        if isinstance(value, dict):
+            return value.get("showToGuest") is True
+        return getattr(value, "showToGuest", None) is True
+
+    def is_cached(self, endpoint: str) -> bool:
+        """Check whether the responses of an endpoint are cached."""
+        return endpoint in self.ttls
+
+    def get(self, endpoint: str, key: Hashable, account_id: Optional[int] = None) -> Any:
+        """Get a cached response, either a public one or one cached for the account.
+
+        Args:
+            endpoint (str): The endpoint of the request.
+            key (Hashable): The key built by `make_key()`.
+            account_id (Optional[int], optional): The account making the request. Defaults to None.
+
+        Returns:
+            Any: The response, or None if it is not cached or has expired.
+        """
+        if endpoint not in self.ttls:
+            return None
+        public_key = (endpoint, None, key)
+        if public_key in self._cache:
+            return self._cache.get(public_key)
+        return self._cache.get((endpoint, account_id, key))
+
+    def set(self, endpoint: str, key: Hashable, value: Any, account_id: Optional[int] = None) -> None:
+        """Cache a response, if its endpoint has a time to live and the response is not None.
+
+        Args:
+            endpoint (str): The endpoint of the request.
+            key (Hashable): The key built by `make_key()`.
+            value (Any): The response.
+            account_id (Optional[int], optional): The account that made the request. The response is
+                only served to this account, unless it reports `showToGuest` as true. Defaults to None.
+        """
+        ttl = self.ttls.get(endpoint)
+        if ttl is None or value is None:
+            return
+        self._cache.set((endpoint, None if self._is_public(value) else account_id, key), value, ttl)
+
+    def clear(self) -> None:
+        """Remove every response."""
+        self._cache.clear()
@@ -0,0 +1,129 @@
+"""This module contains the JSON codecs used to encode request bodies and decode API responses.
+
+The fastest installed backend is picked automatically: orjson, then msgspec, then the standard library.
+"""
+
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+__all__ = (
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonJSONCodec",
+    "MsgspecJSONCodec",
+    "get_json_codec",
+    "set_default_json_codec",
+)
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONCodec:
+    """The base class for JSON codecs."""
+
+    name: str = ""
+
+    def loads(self, data: JSONInput) -> Any:
+        """Decode a JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as a compact, UTF-8 encoded JSON document."""
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """A JSON codec using the standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """A JSON codec using `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # noqa: PLC0415
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class MsgspecJSONCodec(JSONCodec):
+    """A JSON codec using `msgspec`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # noqa: PLC0415
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_BACKENDS: Dict[str, Type[JSONCodec]] = {
+    OrjsonJSONCodec.name: OrjsonJSONCodec,
+    MsgspecJSONCodec.name: MsgspecJSONCodec,
+    StdlibJSONCodec.name: StdlibJSONCodec,
+}
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """Get a JSON codec.
+
+    Args:
+        name (Optional[str], optional): The name of the backend, one of "orjson", "msgspec" and "json".
+            Defaults to None, which returns the default codec.
+
+    Returns:
+        JSONCodec: The JSON codec.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+    """
+    global _default_codec  # noqa: PLW0603
+    if name is not None:
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        return _BACKENDS[name]()
+    if _default_codec is None:
+        for backend in _BACKENDS.values():
+            try:
+                _default_codec = backend()
+                break
+            except ImportError:
+                continue
+    return _default_codec
+
+
+def set_default_json_codec(codec: Union[str, JSONCodec]) -> None:
+    """Set the JSON codec used by clients that are not given one.
+
+    Args:
+        codec (Union[str, JSONCodec]): The codec, or the name of its backend.
+    """
+    global _default_codec  # noqa: PLW0603
+    _default_codec = get_json_codec(codec) if isinstance(codec, str) else codec
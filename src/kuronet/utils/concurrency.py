@@ -0,0 +1,114 @@
+"""This module contains helpers for coordinating concurrent requests."""
+
+import asyncio
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, List, Set, TypeVar
+
+T = TypeVar("T")
+
+__all__ = ("SingleFlight", "gather_bounded", "iter_completed")
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into a single in-flight call.
+
+    The first caller for a key starts the call, and every caller arriving while it is still running awaits
+    the same result instead of starting its own. Cancelling one caller does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, "asyncio.Future"] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run `func` for the given key, or join the call that is already running for it.
+
+        Args:
+            key (Hashable): The key identifying the call.
+            func (Callable[[], Awaitable[T]]): The function starting the call.
+
+        Returns:
+            T: The result of the call.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(partial(self._on_done, key))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller has been cancelled.
+            task.exception()
+
+
+async def iter_completed(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int,
+) -> AsyncIterator[T]:
+    """Run the calls with at most `concurrency` of them in flight, yielding results in completion order.
+
+    A new call is started as soon as one finishes, before its result is yielded. If a call fails or the
+    iteration is stopped early, the calls still in flight are cancelled.
+
+    Args:
+        calls (Iterable[Callable[[], Awaitable[T]]]): The functions starting each call.
+        concurrency (int): The maximum number of calls in flight.
+
+    Yields:
+        T: The result of each call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    calls = iter(calls)
+    pending: Set["asyncio.Future[T]"] = {asyncio.ensure_future(call()) for call in islice(calls, concurrency)}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.update(asyncio.ensure_future(call()) for call in islice(calls, len(done)))
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def gather_bounded(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int,
+) -> List[T]:
+    """Run the calls with at most `concurrency` of them in flight, returning results in call order.
+
+    If a call fails, the other calls are cancelled and the error is raised.
+
+    Args:
+        calls (Iterable[Callable[[], Awaitable[T]]]): The functions starting each call.
+        concurrency (int): The maximum number of calls in flight.
+
+    Returns:
+        List[T]: The result of each call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
@@ -1,24 +1,22 @@
 import base64
+
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import unpad
 
+# JavaScript代码中的Base64编码密钥，只在导入时解码一次
+_KEY = base64.b64decode("XSNLFgNCth8j8oJI3cNIdw==")
 
-def decrypt(value):
-    # JavaScript代码中的Base64编码密钥
-    key_base64 = "XSNLFgNCth8j8oJI3cNIdw=="
+# ECB模式没有状态，同一个密码对象可以在所有调用中复用
+_CIPHER = AES.new(_KEY, AES.MODE_ECB)
 
-    # 将Base64编码的密钥解码为字节
-    key = base64.b64decode(key_base64)
 
+def decrypt(value):
     # 输入的'value'应该是Base64编码的加密字符串
     # 将其解码为字节
     encrypted_data = base64.b64decode(value)
 
-    # 使用解码后的密钥创建一个AES密码对象，使用ECB模式
-    cipher = AES.new(key, AES.MODE_ECB)
-
     # 解密加密的数据
-    decrypted_data = cipher.decrypt(encrypted_data)
+    decrypted_data = _CIPHER.decrypt(encrypted_data)
 
     # 使用PKCS7填充方式去除填充
     plaintext = unpad(decrypted_data, AES.block_size, style="pkcs7")
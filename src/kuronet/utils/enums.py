@@ -1,6 +1,6 @@
 import enum as _enum
 
-__all__ = ("Region", "Game", "Platform")
+__all__ = ("Region", "Game", "Platform", "ValidationMode")
 
 
 class Region(str, _enum.Enum):
@@ -44,3 +44,23 @@ class Platform(str, _enum.Enum):
     H5 = "h5"
     ANDROID = "android"
     IOS = "ios"
+
+
+class ValidationMode(str, _enum.Enum):
+    """
+    Represents how API responses are turned into models.
+
+    Attributes:
+        PYTHON (ValidationMode): Decode the response into Python objects, then validate them.
+        JSON (ValidationMode): Validate the response straight from its JSON bytes, without building
+            the intermediate Python objects.
+        LAZY (ValidationMode): Decode the response into Python objects, then validate the nested models
+            of a model only when they are first accessed.
+        TRUSTED (ValidationMode): Decode the response into Python objects, then build the models
+            without validating them. Nested models are built on first access.
+    """
+
+    PYTHON = "python"
+    JSON = "json"
+    LAZY = "lazy"
+    TRUSTED = "trusted"
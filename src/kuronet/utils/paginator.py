@@ -1,52 +1,114 @@
 import asyncio
-from typing import List, Dict, Callable, Any, Awaitable
+from typing import List, Dict, Callable, Any, Awaitable, AsyncIterator, Optional
+
+from kuronet.errors import BadRequest, TooManyRequests, VisitsTooFrequently
+
+
+def is_rate_limited(exc: BadRequest) -> bool:
+    """Check whether an error was caused by making requests too frequently."""
+    return isinstance(exc, (VisitsTooFrequently, TooManyRequests)) or exc.status_code == 429
 
 
 class WishPaginator:
     """
     A paginator for fetching and processing wish data.
 
+    Pages are fetched one ahead of the items being consumed. There is no delay between pages until the API
+    reports a rate limit, after which the delay doubles on every rate-limited response and halves on every
+    successful one. A page that is still rate limited after `max_retries` retries raises the error.
+
     Attributes:
         end_id (int): The ID of the item to stop fetching at.
         fetch_data (Callable[..., Awaitable[Dict[str, Any]]]): An asynchronous function to fetch the raw data.
+        min_delay (float): The smallest delay in seconds between pages.
+        max_delay (float): The largest delay in seconds between pages.
+        max_retries (int): The number of times a rate-limited page is retried.
+        delay (float): The current delay in seconds between pages.
     """
 
+    backoff_delay: float = 0.5
+    """The delay in seconds after the first rate-limited response."""
+
     def __init__(
         self,
         end_id: int,
         fetch_data: Callable[..., Awaitable[Dict[str, Any]]],
+        min_delay: float = 0.0,
+        max_delay: float = 8.0,
+        max_retries: int = 5,
     ):
         self.end_id = end_id
         self.fetch_data = fetch_data
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.delay = min_delay
 
-    async def get(self, limit: int) -> List[Dict]:
+    async def _fetch_page(self, end_id: int) -> List[Dict]:
+        """Fetch the page after `end_id`, backing off while the API reports a rate limit."""
+        retries = 0
+        while True:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            try:
+                raw_data = await self.fetch_data(end_id=end_id)
+            except BadRequest as exc:
+                if not is_rate_limited(exc) or retries >= self.max_retries:
+                    raise
+                retries += 1
+                self.delay = min(max(self.delay * 2, self.backoff_delay), self.max_delay)
+                continue
+            # Halve the delay after a success, dropping it entirely once it is below the backoff delay.
+            self.delay = max(self.delay / 2 if self.delay > self.backoff_delay else 0.0, self.min_delay)
+            return raw_data["list"]
+
+    async def iterate(self, limit: Optional[int] = None) -> AsyncIterator[Dict]:
         """
-        Fetches and returns the items up to the specified limit.
+        Yields the items until the page holding `end_id` or the specified limit is reached.
+
+        The items of that page other than `end_id` are still yielded, including the ones after it.
 
         Args:
-            limit (int): The maximum number of items to return.
+            limit (Optional[int]): The maximum number of items to yield. Defaults to None, which yields every item.
 
-        Returns:
-            List[Dict]: The list of fetched items.
+        Yields:
+            Dict: The fetched items.
         """
-        all_items = []
-        current_end_id = 0
+        count = 0
+        next_page: Optional["asyncio.Future[List[Dict]]"] = asyncio.ensure_future(self._fetch_page(0))
+        try:
+            while next_page is not None:
+                items = await next_page
+                next_page = None
+                if not items:
+                    return
 
-        while True:
-            raw_data = await self.fetch_data(end_id=current_end_id)
-            items = raw_data["list"]
-            if not items:
-                break
+                reached_end = any(item["id"] == self.end_id for item in items)
+                if not reached_end and not (limit and count + len(items) >= limit):
+                    next_page = asyncio.ensure_future(self._fetch_page(items[-1]["id"]))
 
-            current_end_id = items[-1]["id"]
+                for item in items:
+                    if item["id"] == self.end_id:
+                        continue
+                    yield item
+                    count += 1
+                    if limit and count >= limit:
+                        return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
-            filtered_items = [item for item in items if item["id"] != self.end_id]
-            if len(filtered_items) < len(items):
-                all_items.extend(filtered_items)
-                break
+    def __aiter__(self) -> AsyncIterator[Dict]:
+        return self.iterate()
 
-            all_items.extend(filtered_items)
-            await asyncio.sleep(0.5)
+    async def get(self, limit: int) -> List[Dict]:
+        """
+        Fetches and returns the items up to the specified limit.
 
-        # Return up to the specified limit.
-        return all_items[: min(len(all_items), limit)] if limit else all_items
+        Args:
+            limit (int): The maximum number of items to return.
+
+        Returns:
+            List[Dict]: The list of fetched items.
+        """
+        return [item async for item in self.iterate(limit)]
@@ -1,20 +1,66 @@
 import asyncio
+import json
 import os
 import warnings
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 
+from kuronet.client.components.chronicle.base import BaseChronicleClient
 from kuronet.client.cookies import Cookies
 from kuronet.utils.cookies import parse_cookie
-from kuronet.utils.enums import Region
+from kuronet.utils.enums import Game, Region
 
 env_path = Path(".env")
 if env_path.exists():
     load_dotenv()
 
+PLAYER_ID = 100000001
+
+
+class FakeGameRecord:
+    """Answers game record requests, rejecting the b-at values in `rejected` with `reject_code`."""
+
+    def __init__(self, reject_code: int = 220, delay: float = 0.0) -> None:
+        self.calls: Counter = Counter()
+        self.rejected = set()
+        self.reject_code = reject_code
+        self.delay = delay
+        self.tokens = 0
+        self.payloads: Dict[str, object] = {"refreshData": True}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        self.calls[endpoint] += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if endpoint == "requestToken":
+            self.tokens += 1
+            return self.respond(json.dumps({"accessToken": f"b-at-{self.tokens}"}))
+        if request.headers.get("b-at") in self.rejected:
+            return self.respond(None, code=self.reject_code)
+        if endpoint in self.payloads:
+            return self.respond(self.payloads[endpoint])
+        return self.respond({"path": request.url.path, "b-at": request.headers.get("b-at")})
+
+    @staticmethod
+    def respond(data: Optional[object], code: int = 200) -> httpx.Response:
+        return httpx.Response(200, json={"code": code, "msg": "msg", "data": data})
+
+
+def make_client(
+    server: FakeGameRecord, client_type: type = BaseChronicleClient, **kwargs: Any
+) -> BaseChronicleClient:
+    """Make a chronicle client of the given type sending its requests to the fake server."""
+    client = client_type(player_id=PLAYER_ID, region=Region.CHINESE, **kwargs)
+    client.game = Game.MC
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return client
+
 
 @pytest.fixture(scope="session")
 def event_loop():  # skipcq: PY-D0003
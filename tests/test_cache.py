@@ -0,0 +1,41 @@
+import time
+
+from kuronet.utils.cache import CacheStats, LRUCache
+
+
+class TestLRUCache:
+    @staticmethod
+    def test_evicts_least_recently_used():
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert "a" in cache
+        assert cache.stats == CacheStats(hits=1, misses=0, evictions=1, size=2, maxsize=2)
+
+    @staticmethod
+    def test_ttl():
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60.0)
+        time.sleep(0.02)
+        assert cache.get("a", "default") == "default"
+        assert cache.get("b") == 2
+        assert cache.stats.evictions == 1
+
+    @staticmethod
+    def test_pop_and_clear():
+        cache = LRUCache()
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "default") == "default"
+        cache.set("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_hit_rate():
+        assert CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=None).hit_rate == 0.0
+        assert CacheStats(hits=3, misses=1, evictions=0, size=1, maxsize=None).hit_rate == 0.75
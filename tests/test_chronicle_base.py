@@ -0,0 +1,150 @@
+import asyncio
+import json
+from typing import Dict
+
+import pytest
+
+from kuronet.client.components.chronicle.base import BaseChronicleClient
+from kuronet.client.components.chronicle.mc import MCBattleChronicleClient
+from kuronet.errors import AccountNotFound, BadRequest
+from kuronet.utils.enums import Game
+from tests.conftest import PLAYER_ID, FakeGameRecord, make_client
+
+
+class TestGameRecordToken:
+    @staticmethod
+    async def test_b_at_reused():
+        server = FakeGameRecord()
+        client = make_client(server)
+        await client.request_game_record("akiBox/roleData")
+        data: Dict[str, str] = await client.request_game_record("akiBox/roleData")
+        assert data["b-at"] == "b-at-1"
+        assert server.calls["requestToken"] == 1
+
+    @staticmethod
+    async def test_b_at_expires():
+        class Client(BaseChronicleClient):
+            b_at_ttl = 0.05
+
+        server = FakeGameRecord()
+        client = make_client(server, Client)
+        data = await client.request_game_record("akiBox/roleData")
+        assert data["b-at"] == "b-at-1"
+        await asyncio.sleep(0.06)
+        assert client.get_b_at(Game.MC, PLAYER_ID) is None
+        data = await client.request_game_record("akiBox/roleData")
+        assert data["b-at"] == "b-at-2"
+
+    @staticmethod
+    async def test_single_flight_token():
+        server = FakeGameRecord(delay=0.01)
+        client = make_client(server)
+        results = await asyncio.gather(*(client.request_game_record("akiBox/roleData") for _ in range(5)))
+        assert {result["b-at"] for result in results} == {"b-at-1"}
+        assert server.calls["requestToken"] == 1
+
+    @staticmethod
+    async def test_retry_rejected_b_at():
+        server = FakeGameRecord()
+        client = make_client(server)
+        await client.request_token()
+        server.rejected.add("b-at-1")
+        data = await client.request_game_record("akiBox/roleData")
+        assert data["b-at"] == "b-at-2"
+        assert server.calls == {"requestToken": 2, "roleData": 2}
+
+    @staticmethod
+    async def test_retry_concurrent_rejections():
+        server = FakeGameRecord(delay=0.01)
+        client = make_client(server)
+        await client.request_token()
+        server.rejected.update({"b-at-1", None})
+        results = await asyncio.gather(*(client.request_game_record("akiBox/roleData") for _ in range(3)))
+        assert [result["b-at"] for result in results] == ["b-at-2"] * 3
+        assert server.calls == {"requestToken": 2, "roleData": 6}
+
+    @staticmethod
+    async def test_no_retry_on_other_errors():
+        server = FakeGameRecord(reject_code=-110)
+        client = make_client(server)
+        await client.request_token()
+        server.rejected.add("b-at-1")
+        with pytest.raises(BadRequest) as exc_info:
+            await client.request_game_record("akiBox/roleData")
+        assert exc_info.value.ret_code == -110
+        assert server.calls == {"requestToken": 1, "roleData": 1}
+        assert client.get_b_at(Game.MC, PLAYER_ID) == "b-at-1"
+
+
+class TestRefreshData:
+    @staticmethod
+    async def test_max_staleness():
+        server = FakeGameRecord()
+        client = make_client(server)
+        assert await client.refresh_data(max_staleness=30)
+        assert await client.refresh_data(max_staleness=30)
+        assert server.calls["refreshData"] == 1
+        await asyncio.sleep(0.02)
+        assert await client.refresh_data(max_staleness=0.01)
+        assert server.calls["refreshData"] == 2
+        assert await client.refresh_data()
+        assert server.calls["refreshData"] == 3
+
+    @staticmethod
+    async def test_max_staleness_per_player():
+        server = FakeGameRecord()
+        client = make_client(server)
+        await client.refresh_data(max_staleness=30)
+        await client.refresh_data(PLAYER_ID + 1, max_staleness=30)
+        await client.refresh_data(PLAYER_ID + 1, max_staleness=30)
+        assert server.calls["refreshData"] == 2
+
+    @staticmethod
+    async def test_single_flight_refresh():
+        server = FakeGameRecord(delay=0.01)
+        client = make_client(server)
+        results = await asyncio.gather(*(client.refresh_data() for _ in range(5)))
+        assert results == [True] * 5
+        assert server.calls["refreshData"] == 1
+        await client.refresh_data()
+        assert server.calls["refreshData"] == 2
+
+    @staticmethod
+    async def test_auto_refresh_within_staleness():
+        server = FakeGameRecord()
+        server.payloads["roleData"] = json.dumps({"roleList": [], "showToGuest": False})
+        client = make_client(server, MCBattleChronicleClient)
+        roles = await client.get_mc_roles()
+        assert roles.roleList == []
+        await client.get_mc_roles()
+        await client.get_mc_roles(auto_refresh=False)
+        assert server.calls["refreshData"] == 1
+        assert server.calls["roleData"] == 3
+
+        await asyncio.sleep(0.02)
+        await client.get_mc_roles(max_staleness=0.01)
+        assert server.calls["refreshData"] == 2
+        client.refresh_max_staleness = 0
+        await asyncio.sleep(0.01)
+        await client.get_mc_roles()
+        assert server.calls["refreshData"] == 3
+
+    @staticmethod
+    async def test_auto_refresh_single_flight():
+        server = FakeGameRecord(delay=0.01)
+        server.payloads["roleData"] = json.dumps({"roleList": [], "showToGuest": False})
+        client = make_client(server, MCBattleChronicleClient)
+        await asyncio.gather(*(client.get_mc_roles() for _ in range(5)))
+        assert server.calls["refreshData"] == 1
+        assert server.calls["roleData"] == 5
+
+
+class TestMCNotes:
+    @staticmethod
+    async def test_account_not_found():
+        server = FakeGameRecord()
+        server.payloads["baseData"] = "null"
+        client = make_client(server, MCBattleChronicleClient)
+        assert await client.get_mc_notes(auto_refresh=False) is None
+        with pytest.raises(AccountNotFound):
+            await client.get_mc_notes(PLAYER_ID + 1, auto_refresh=False)
@@ -0,0 +1,28 @@
+from kuronet.client.base import BaseClient
+from kuronet.utils.enums import Platform, Region
+
+
+class TestLabAPIHeader:
+    @staticmethod
+    def test_precedence():
+        client = BaseClient(region=Region.OVERSEAS, user_token="token")
+        headers = client.get_lab_api_header({"b-at": "b-at", "Token": "other", "lang": "ja"}, lang="en")
+        assert headers["b-at"] == "b-at"
+        assert headers["token"] == "token"
+        assert headers["lang"] == "en"
+        assert headers["countryCode"] == "CN"
+        assert client.get_lab_api_header({"lang": "ja"})["lang"] == "ja"
+
+    @staticmethod
+    def test_rebuild_on_change():
+        client = BaseClient(region=Region.CHINESE, user_token="token")
+        headers = client.get_lab_api_header(None)
+        headers["b-at"] = "b-at"
+        assert "b-at" not in client.get_lab_api_header(None)
+
+        client.user_token = "other"
+        assert client.get_lab_api_header(None)["token"] == "other"
+        client.platform = Platform.IOS
+        assert client.get_lab_api_header(None)["source"] == "ios"
+        client.region = Region.OVERSEAS
+        assert client.get_lab_api_header(None, lang="en")["lang"] == "en"
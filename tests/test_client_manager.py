@@ -0,0 +1,118 @@
+import pytest
+
+from kuronet.client.manager import ClientManager
+from kuronet.client.transport import SharedTransport
+from kuronet.errors import InvalidCookies
+from kuronet.utils.enums import Region
+
+COOKIES = {"user_token": "token", "account_id": "1"}
+
+
+class TestClientManager:
+    @staticmethod
+    async def test_get_reuses_client():
+        async with ClientManager() as manager:
+            manager.add_account(1, COOKIES)
+            client = await manager.get(1)
+            assert await manager.get(1) is client
+            assert await manager.get(1, 100000001) is not client
+            assert client.account_id == 1
+            assert client.region == Region.CHINESE
+            assert client.transport is manager.transport
+            assert manager.stats.hits == 1
+            assert manager.stats.misses == 2
+            assert manager.stats.hit_rate == pytest.approx(1 / 3)
+        assert client.client.is_closed
+
+    @staticmethod
+    async def test_cookies_loader():
+        loaded = []
+
+        async def load(account_id: int):
+            loaded.append(account_id)
+            return COOKIES if account_id == 1 else None
+
+        async with ClientManager(load) as manager:
+            assert (await manager.get(1)).user_token == "token"
+            with pytest.raises(InvalidCookies):
+                await manager.get(2)
+        assert loaded == [1, 2]
+
+    @staticmethod
+    async def test_evict_overflow():
+        async with ClientManager(max_clients=1) as manager:
+            manager.add_account(1, COOKIES)
+            manager.add_account(2, COOKIES)
+            first = await manager.get(1)
+            await manager.get(2)
+            assert first.client.is_closed
+            assert len(manager) == 1
+            assert manager.stats.evictions == 1
+
+    @staticmethod
+    async def test_evict_idle():
+        async with ClientManager(idle_timeout=0.0) as manager:
+            manager.add_account(1, COOKIES)
+            client = await manager.get(1)
+            assert await manager.evict_idle() == 1
+            assert client.client.is_closed
+            assert (1, None) not in manager
+
+    @staticmethod
+    async def test_lease_defers_shutdown():
+        async with ClientManager(max_clients=1) as manager:
+            manager.add_account(1, COOKIES)
+            manager.add_account(2, COOKIES)
+            async with manager.lease(1) as client:
+                await manager.get(2)
+                assert (1, None) not in manager
+                assert not client.client.is_closed
+            assert client.client.is_closed
+
+            async with manager.lease(2) as client:
+                pass
+            assert not client.client.is_closed
+
+    @staticmethod
+    async def test_remove_account():
+        async with ClientManager() as manager:
+            manager.add_account(1, COOKIES)
+            client = await manager.get(1)
+            await manager.remove_account(1)
+            assert client.client.is_closed
+            with pytest.raises(InvalidCookies):
+                await manager.get(1)
+
+    @staticmethod
+    async def test_remove_leased_account():
+        async with ClientManager() as manager:
+            manager.add_account(1, COOKIES)
+            async with manager.lease(1) as client:
+                await manager.remove_account(1)
+                assert (1, None) not in manager
+                assert not client.client.is_closed
+            assert client.client.is_closed
+
+    @staticmethod
+    async def test_shared_transport_kept():
+        transport = SharedTransport()
+        async with ClientManager(transport=transport) as manager:
+            manager.add_account(1, COOKIES)
+            await manager.get(1)
+        assert not transport.is_closed
+        await transport.aclose()
+
+    @staticmethod
+    @pytest.mark.parametrize("name", ["cookies", "account_id", "player_id"])
+    def test_reserved_client_kwargs(name: str):
+        with pytest.raises(TypeError, match=name):
+            ClientManager(**{name: None})
+
+    @staticmethod
+    async def test_client_kwargs_do_not_override():
+        async with ClientManager(lang="zh-cn") as manager:
+            manager.add_account(1, COOKIES)
+            manager.client_kwargs["transport"] = None
+            client = await manager.get(1)
+            assert client.lang == "zh-cn"
+            assert client.transport is manager.transport
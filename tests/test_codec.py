@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from kuronet.utils.codec import get_json_codec
+
+
+class TestJSONCodec:
+    @staticmethod
+    @pytest.mark.parametrize("backend", ["json", "msgspec", "orjson"])
+    def test_round_trip(backend: str):
+        try:
+            codec = get_json_codec(backend)
+        except ImportError:
+            pytest.skip(f"{backend} is not installed")
+        payload = {"code": 200, "msg": "请求成功", "data": {"roleList": [{"roleId": 1102, "level": 90}], "open": True}}
+        encoded = codec.dumps(payload)
+        assert json.loads(encoded) == payload
+        assert codec.loads(encoded) == payload
+        assert codec.loads(bytearray(encoded)) == payload
+        assert codec.loads(encoded.decode("utf-8")) == payload
+
+    @staticmethod
+    def test_unknown_backend():
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_json_codec("ujson")
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from kuronet.utils.concurrency import SingleFlight
+
+
+class TestSingleFlight:
+    @staticmethod
+    async def test_shares_call():
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert "key" not in flight
+        assert await flight.do("key", fetch) is not results[0]
+
+    @staticmethod
+    async def test_shares_error():
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("error")
+
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    @staticmethod
+    async def test_cancel_one_caller():
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == "value"
@@ -0,0 +1,65 @@
+from http.cookiejar import CookieJar
+
+import httpx
+
+from kuronet.client.base import BaseClient
+from kuronet.client.cookies import Cookies, IndexedCookieJar
+
+
+class TestCookies:
+    @staticmethod
+    def test_get_by_domain_and_path():
+        cookies = Cookies()
+        cookies.set("token", "a", domain="kurobbs.com", path="/")
+        cookies.set("token", "b", domain="kurobbs.com", path="/gamer")
+        cookies.set("token", "c", domain="example.com", path="/")
+        assert cookies.get("token", domain="kurobbs.com", path="/") == "a"
+        assert cookies.get("token", domain="kurobbs.com", path="/gamer") == "b"
+        assert cookies.get("token", domain="example.com") == "c"
+        assert cookies.get("token", path="/gamer") == "b"
+        assert cookies.get("missing", "default") == "default"
+        assert Cookies(CookieJar()).get("token") is None
+
+    @staticmethod
+    def test_index_stays_in_sync():
+        cookies = Cookies({"token": "a", "account_id": "10001"})
+        cookies.set("token", "b", domain="kurobbs.com")
+        assert isinstance(cookies.jar, IndexedCookieJar)
+        assert cookies.account_id == 10001
+
+        cookies.delete("token", domain="kurobbs.com")
+        assert [cookie.value for cookie in cookies.jar.get_cookies("token")] == ["a"]
+        cookies.clear(domain="")
+        assert cookies.jar.get_cookies("token") == []
+        assert cookies.get("account_id") is None
+
+        cookies.set("token", "c")
+        cookies.clear()
+        assert cookies.jar.get_cookies("token") == []
+
+    @staticmethod
+    def test_client_cookies_view():
+        client = BaseClient(cookies={"token": "a", "account_id": "10001"})
+        assert client.cookies is client.cookies
+        assert client.cookies.jar is client.client.cookies.jar
+        assert isinstance(client.client.cookies.jar, IndexedCookieJar)
+        assert client.account_id == 10001
+
+        client.cookies = {"token": "b"}
+        assert client.cookies.get("token") == "b"
+        assert isinstance(client.client.cookies.jar, IndexedCookieJar)
+
+    @staticmethod
+    def test_client_cookies_copy_plain_jar():
+        jar = CookieJar()
+        client = BaseClient(cookies=jar)
+        client.cookies.set("token", "a")
+        assert not list(jar)
+
+    @staticmethod
+    def test_response_cookies_are_indexed():
+        client = BaseClient()
+        request = httpx.Request("GET", "https://api.kurobbs.com/user/mineV2")
+        response = httpx.Response(200, headers={"Set-Cookie": "token=a; Path=/"}, request=request)
+        client.client.cookies.extract_cookies(response)
+        assert client.cookies.get("token") == "a"
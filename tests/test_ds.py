@@ -0,0 +1,32 @@
+import base64
+
+import pytest
+
+pytest.importorskip("Crypto")
+
+from Crypto.Cipher import AES  # noqa: E402
+from Crypto.Util.Padding import pad  # noqa: E402
+
+from kuronet.utils.ds import decrypt  # noqa: E402
+
+KEY = base64.b64decode("XSNLFgNCth8j8oJI3cNIdw==")
+
+
+def encrypt(plaintext: str) -> str:
+    cipher = AES.new(KEY, AES.MODE_ECB)
+    return base64.b64encode(cipher.encrypt(pad(plaintext.encode("utf-8"), AES.block_size))).decode()
+
+
+class TestDecrypt:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "plaintext", ["", "0123456789abcdef", '{"roleList": [], "showToGuest": true, "name": "漂泊者"}']
+    )
+    def test_round_trip(plaintext: str):
+        assert decrypt(encrypt(plaintext)) == plaintext
+        assert decrypt(encrypt(plaintext).encode()) == plaintext
+
+    @staticmethod
+    def test_bad_padding():
+        with pytest.raises(ValueError):
+            decrypt(base64.b64encode(AES.new(KEY, AES.MODE_ECB).encrypt(b"\x00" * 16)))
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from kuronet.models.base import FlyweightPool, get_flyweight_pool, get_type_adapter, set_flyweight_pool
+from kuronet.models.mc.chronicle.role import MCRoleSkill, MCRoleSkillDetail
+
+
+@pytest.fixture
+def pool():
+    previous = get_flyweight_pool()
+    pool = FlyweightPool(maxsize=2, string_maxsize=8)
+    set_flyweight_pool(pool)
+    yield pool
+    set_flyweight_pool(previous)
+
+
+def make_skill(skill_id: int = 1, level: int = 10):
+    return {
+        "skill": {
+            "id": skill_id,
+            "type": "Normal Attack",
+            "name": "Cloudweaver",
+            "description": "Perform up to 4 consecutive attacks, dealing Spectro DMG.",
+            "iconUrl": "https://example.com/skill.png",
+        },
+        "level": level,
+    }
+
+
+class TestFlyweight:
+    @staticmethod
+    def test_share(pool):
+        first = MCRoleSkill.model_validate(make_skill(level=1))
+        second = get_type_adapter(MCRoleSkill).validate_json(json.dumps(make_skill()))
+        third = MCRoleSkill.construct_trusted(make_skill())
+        assert first.skill is second.skill is third.skill
+        assert first.level != second.level
+        assert pool.models.stats.hits == 2
+
+    @staticmethod
+    def test_share_strings(pool):
+        first = MCRoleSkillDetail.model_validate(make_skill(1)["skill"])
+        second = MCRoleSkillDetail.model_validate(make_skill(2)["skill"])
+        assert first is not second
+        assert first.description is second.description
+
+    @staticmethod
+    def test_evict(pool):
+        skills = [MCRoleSkillDetail.model_validate(make_skill(skill_id)["skill"]) for skill_id in range(3)]
+        assert len(pool.models) == 2
+        assert pool.models.stats.evictions == 1
+        assert MCRoleSkillDetail.model_validate(make_skill(0)["skill"]) is not skills[0]
+        pool.clear()
+        assert len(pool.models) == len(pool.strings) == 0
+
+    @staticmethod
+    def test_frozen(pool):
+        skill = MCRoleSkillDetail.model_validate(make_skill()["skill"])
+        with pytest.raises(ValidationError):
+            skill.name = "Verina"
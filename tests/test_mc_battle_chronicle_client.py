@@ -65,3 +65,18 @@ class TestMCBattleChronicleClient:
     @pytest.mark.xfail
     async def test_get_mc_role_detail_failed(mc_client: "MCBattleChronicleClient"):
         await mc_client.get_mc_role_detail(role_id=1000, auto_refresh=False)
+
+    @staticmethod
+    async def test_get_mc_snapshot(mc_client: "MCBattleChronicleClient"):
+        snapshot = await mc_client.get_mc_snapshot(auto_refresh=False)
+        assert snapshot.notes
+        assert snapshot.roles
+        assert snapshot.explorer
+        assert snapshot.calabash
+        assert snapshot.widget is None
+
+    @staticmethod
+    async def test_iter_mc_role_details(mc_client: "MCBattleChronicleClient"):
+        role_ids = {role_detail.role.roleId async for role_detail in mc_client.iter_mc_role_details(auto_refresh=False)}
+        roles = await mc_client.get_mc_roles(auto_refresh=False)
+        assert role_ids == {role.roleId for role in roles.roleList}
@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+
+from kuronet.models.mc.wish import MCWish, MCBannerType
+
+pytest.importorskip("numpy")
+
+from kuronet.models.mc.wish_analytics import analyze_wish_history, analyze_wish_histories  # noqa: E402
+
+STANDARD_ITEM_IDS = {1405}
+
+
+def make_history(items):
+    start = datetime.datetime(2024, 5, 23, 12)
+    return [
+        MCWish(
+            resourceType="Resonators",
+            resourceId=item_id,
+            name=str(item_id),
+            qualityLevel=rarity,
+            count=1,
+            time=start + datetime.timedelta(minutes=index),
+            cardPoolType="Featured Resonator Convene",
+            banner_type=MCBannerType.CHARACTER,
+        )
+        for index, (item_id, rarity) in enumerate(items)
+    ]
+
+
+class TestMCWishAnalytics:
+    @staticmethod
+    def test_analyze_wish_history():
+        history = make_history(
+            [(1, 3), (2, 4), (1, 3), (1405, 5), (1, 3), (1102, 5), (2, 4), (1102, 5), (1, 3)]
+        )
+        stats = analyze_wish_history(history, standard_item_ids=STANDARD_ITEM_IDS)[MCBannerType.CHARACTER]
+        assert stats.total == 9
+        assert stats.rarities[5].count == 3
+        assert stats.rarities[5].intervals == [4, 2, 2]
+        assert stats.rarities[5].pity == 1
+        assert stats.rarities[4].intervals == [2, 2, 2, 1, 1]
+        assert (stats.wins, stats.losses) == (1, 1)
+
+    @staticmethod
+    def test_analyze_wish_histories():
+        histories = [make_history([(1, 3), (1102, 5)]), [], make_history([(1, 3)] * 3)]
+        results = analyze_wish_histories(histories)
+        assert results[0][MCBannerType.CHARACTER].rarities[5].intervals == [2]
+        assert results[1] == {}
+        assert results[2][MCBannerType.CHARACTER].rarities[5].pity == 3
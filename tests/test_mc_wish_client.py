@@ -0,0 +1,136 @@
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from kuronet.client.components.wish.mc import MCWishClient
+from kuronet.models.mc.wish import MCBannerType, MCWish
+from kuronet.models.records import MCWishRecord
+
+PLAYER_ID = 100000001
+
+
+def record(time: str, item_id: int, name: str = "Item") -> Dict[str, Any]:
+    return {
+        "cardPoolType": "Featured Resonator Convene",
+        "resourceId": item_id,
+        "qualityLevel": 4,
+        "resourceType": "Resonators",
+        "name": name,
+        "count": 1,
+        "time": time,
+    }
+
+
+def make_client(banners: Dict[int, List[Dict[str, Any]]]) -> MCWishClient:
+    """Make a client answering with the records of each banner, newest first."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        data = banners.get(json.loads(request.content)["cardPoolType"], [])
+        return httpx.Response(200, json={"code": 0, "message": "success", "data": data})
+
+    client = MCWishClient(player_id=PLAYER_ID)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def old_records():
+    return [
+        record("2024-05-23 12:01:00", 1102),
+        record("2024-05-23 12:01:00", 1103),
+        record("2024-05-23 12:00:00", 1102),
+    ]
+
+
+class TestSyncWishHistory:
+    @staticmethod
+    async def test_first_sync(old_records):
+        client = make_client({1: old_records})
+        result = await client.sync_wish_history("record", banner_types=[1])
+        assert result.wishes == await client.wish_history("record", banner_types=[1])
+        assert result.high_water_marks[MCBannerType(1)].time == "2024-05-23 12:01:00"
+        assert result.high_water_marks[MCBannerType(1)].count == 2
+
+    @staticmethod
+    async def test_same_second(old_records):
+        client = make_client({1: old_records})
+        first = await client.sync_wish_history("record", banner_types=[1])
+        new_records = [record("2024-05-23 12:02:00", 1102), record("2024-05-23 12:01:00", 1102)]
+        client = make_client({1: new_records + old_records})
+        second = await client.sync_wish_history("record", first.high_water_marks, banner_types=[1])
+        history = await client.wish_history("record", banner_types=[1])
+
+        assert [wish.time.minute for wish in second.wishes] == [1, 2]
+        assert [wish.id for wish in second.wishes] == [history[1].id, history[4].id]
+        assert len({wish.id for wish in history}) == len(history)
+        assert second.high_water_marks[MCBannerType(1)].time == "2024-05-23 12:02:00"
+
+    @staticmethod
+    async def test_same_second_other_banner():
+        old_records = {1: [record("2024-05-23 12:01:00", 1102)], 2: [record("2024-05-23 12:00:00", 21010011)]}
+        client = make_client(old_records)
+        first = await client.sync_wish_history("record", banner_types=[1, 2])
+        client = make_client({**old_records, 2: [record("2024-05-23 12:01:00", 1102), *old_records[2]]})
+        second = await client.sync_wish_history("record", first.high_water_marks, banner_types=[1, 2])
+        history = await client.wish_history("record", banner_types=[1, 2])
+
+        assert [wish.banner_type for wish in second.wishes] == [MCBannerType(2)]
+        assert second.wishes[0].id == history[2].id
+        assert second.wishes[0].id not in {wish.id for wish in first.wishes}
+
+    @staticmethod
+    async def test_no_new_wishes(old_records):
+        client = make_client({1: old_records})
+        first = await client.sync_wish_history("record", banner_types=[1, 2])
+        second = await client.sync_wish_history("record", first.high_water_marks, banner_types=[1, 2])
+        assert second.wishes == []
+        assert second.high_water_marks == first.high_water_marks
+
+
+@pytest.fixture
+def banner_records(old_records):
+    return {
+        1: old_records,
+        2: [record("2024-05-23 12:03:00", 21010011), record("2024-05-23 11:59:00", 21010011)],
+        3: [],
+    }
+
+
+class TestIterWishHistory:
+    @staticmethod
+    async def test_per_banner_order(banner_records):
+        client = make_client(banner_records)
+        wishes = [wish async for wish in client.iter_wish_history("record", banner_types=[1, 2, 3])]
+        history = await client.wish_history("record", banner_types=[1, 2, 3])
+
+        assert all(isinstance(wish, MCWish) for wish in wishes)
+        assert sorted(wish.id for wish in wishes) == sorted(wish.id for wish in history)
+        for banner_type in (1, 2):
+            banner_wishes = [wish for wish in wishes if wish.banner_type == MCBannerType(banner_type)]
+            assert len(banner_wishes) == len(banner_records[banner_type])
+            assert banner_wishes == sorted(banner_wishes, key=lambda wish: wish.time)
+            start = wishes.index(banner_wishes[0])
+            assert wishes[start : start + len(banner_wishes)] == banner_wishes
+
+    @staticmethod
+    async def test_batch(banner_records):
+        client = make_client(banner_records)
+        banners = [wishes async for wishes in client.iter_wish_history("record", banner_types=[1, 2, 3], batch=True)]
+
+        assert sorted(len(wishes) for wishes in banners) == [0, 2, 3]
+        for wishes in banners:
+            assert len({wish.banner_type for wish in wishes}) <= 1
+            assert [wish.time for wish in wishes] == sorted(wish.time for wish in wishes)
+
+    @staticmethod
+    async def test_batch_records(banner_records):
+        client = make_client(banner_records)
+        client.use_records = True
+        banners = [wishes async for wishes in client.iter_wish_history("record", banner_types=[1, 2], batch=True)]
+        client.use_records = False
+        history = await client.wish_history("record", banner_types=[1, 2])
+
+        assert all(isinstance(wish, MCWishRecord) for wishes in banners for wish in wishes)
+        assert sorted(wish.id for wishes in banners for wish in wishes) == sorted(wish.id for wish in history)
@@ -0,0 +1,45 @@
+import pytest
+
+from kuronet.client.components.wish.mc import MCWishClient
+from kuronet.models.mc.wish import MCWish, MCBannerType, get_wish_id
+from kuronet.models.mc.wish_store import MCWishStore
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "cardPoolType": "Featured Resonator Convene",
+            "resourceId": 1102 + index % 2,
+            "qualityLevel": 5 if index == 0 else 3,
+            "resourceType": "Resonators",
+            "name": f"Item {index % 2}",
+            "count": 1,
+            "time": f"2024-05-23 12:0{index // 4}:00",
+        }
+        for index in range(8)
+    ]
+
+
+class TestMCWishStore:
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("timestamp", "item_id", "sequence"),
+        [(1716436800, 1102, 1), (1716436800, 21010011, 12), (1716436800, 123456789, 3)],
+    )
+    def test_get_wish_id(timestamp: int, item_id: int, sequence: int):
+        assert get_wish_id(timestamp, item_id, sequence) == int(f"{timestamp}{item_id:08}{sequence}")
+
+    @staticmethod
+    def test_from_records(records):
+        wishes = [MCWish(**record, banner_type=MCBannerType.CHARACTER) for record in records]
+        wishes = MCWishClient.fix_wish_item_id(sorted(wishes, key=lambda wish: wish.time.timestamp()))
+
+        store = MCWishStore.from_records(records, MCBannerType.CHARACTER)
+        store.sort()
+        store.fix_item_ids()
+
+        assert len(store) == len(records)
+        assert len(store.names) == 2
+        assert store.to_wishes() == wishes
+        assert store[-1] == wishes[-1]
@@ -0,0 +1,75 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from kuronet.errors import BadRequest, VisitsTooFrequently
+from kuronet.utils.paginator import WishPaginator
+
+
+class FakePages:
+    """Serves `items` in pages of `page_size`, raising the queued errors first."""
+
+    def __init__(self, items: List[int], page_size: int = 5) -> None:
+        self.items = items
+        self.page_size = page_size
+        self.errors: List[BadRequest] = []
+        self.calls: List[int] = []
+
+    async def fetch_data(self, end_id: int) -> Dict[str, Any]:
+        self.calls.append(end_id)
+        if self.errors:
+            raise self.errors.pop(0)
+        start = self.items.index(end_id) + 1 if end_id else 0
+        return {"list": [{"id": item} for item in self.items[start : start + self.page_size]]}
+
+
+def make_paginator(pages: FakePages, end_id: int = 0, **kwargs: Any) -> WishPaginator:
+    paginator = WishPaginator(end_id, pages.fetch_data, max_delay=0.01, **kwargs)
+    paginator.backoff_delay = 0.001
+    return paginator
+
+
+class TestWishPaginator:
+    @staticmethod
+    async def test_every_page():
+        pages = FakePages(list(range(12, 0, -1)))
+        assert [item["id"] for item in await make_paginator(pages).get(0)] == list(range(12, 0, -1))
+        assert pages.calls == [0, 8, 3, 1]
+
+    @staticmethod
+    async def test_limit():
+        pages = FakePages(list(range(12, 0, -1)))
+        assert [item["id"] async for item in make_paginator(pages).iterate(3)] == [12, 11, 10]
+        assert pages.calls == [0]
+
+    @staticmethod
+    async def test_end_id_keeps_rest_of_page():
+        pages = FakePages(list(range(12, 0, -1)))
+        items = await make_paginator(pages, end_id=6).get(0)
+        assert [item["id"] for item in items] == [12, 11, 10, 9, 8, 7, 5, 4, 3]
+        assert pages.calls == [0, 8]
+
+    @staticmethod
+    async def test_backoff():
+        pages = FakePages(list(range(3, 0, -1)))
+        pages.errors = [VisitsTooFrequently(), BadRequest(status_code=429)]
+        paginator = make_paginator(pages)
+        assert len(await paginator.get(0)) == 3
+        assert pages.calls == [0, 0, 0, 1]
+        assert paginator.delay == 0.0
+
+    @staticmethod
+    async def test_max_retries():
+        pages = FakePages(list(range(3, 0, -1)))
+        pages.errors = [VisitsTooFrequently() for _ in range(3)]
+        with pytest.raises(VisitsTooFrequently):
+            await make_paginator(pages, max_retries=2).get(0)
+        assert len(pages.calls) == 3
+
+    @staticmethod
+    async def test_other_errors_not_retried():
+        pages = FakePages(list(range(3, 0, -1)))
+        pages.errors = [BadRequest({"code": -1, "msg": "error"})]
+        with pytest.raises(BadRequest):
+            await make_paginator(pages).get(0)
+        assert pages.calls == [0]
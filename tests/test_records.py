@@ -0,0 +1,105 @@
+import pickle
+
+import pytest
+
+from kuronet.models.lab.role import Account
+from kuronet.models.mc.character import MCRole
+from kuronet.models.mc.chronicle.calabash import MCCalabashPhantom
+from kuronet.models.mc.chronicle.explorer import MCExplorerAreaItem
+from kuronet.models.mc.wish import MCWish, MCBannerType
+from kuronet.models.records import (
+    AccountRecord,
+    MCCalabashPhantomRecord,
+    MCExplorerAreaItemRecord,
+    MCRoleRecord,
+    MCWishRecord,
+    to_records,
+)
+
+MODELS = [
+    (
+        MCWishRecord,
+        MCWish(
+            resourceType="Resonators",
+            resourceId=1102,
+            name="Sanhua",
+            qualityLevel=5,
+            count=1,
+            time="2024-05-23 12:00:00",
+            cardPoolType="Featured Resonator Convene",
+            banner_type=MCBannerType.CHARACTER,
+        ),
+    ),
+    (
+        MCRoleRecord,
+        MCRole(
+            roleId=1204,
+            level=90,
+            roleName="Verina",
+            roleIconUrl="https://example.com/icon.png",
+            rolePicUrl="https://example.com/pic.png",
+            starLevel=5,
+            attributeId=3,
+            attributeName="Spectro",
+            weaponTypeId=5,
+            weaponTypeName="Rectifier",
+            acronym="vrn",
+        ),
+    ),
+    (
+        MCCalabashPhantomRecord,
+        MCCalabashPhantom(
+            phantom={
+                "name": "Crownless",
+                "phantomId": 340000030,
+                "cost": 4,
+                "iconUrl": "https://example.com/phantom.png",
+                "acronym": "wm",
+            },
+            star=5,
+            maxStar=5,
+        ),
+    ),
+    (
+        MCExplorerAreaItemRecord,
+        MCExplorerAreaItem(type=1, name="Chest", progress=90, icon="https://example.com/chest.png"),
+    ),
+    (
+        AccountRecord,
+        Account(
+            userId=1,
+            gameId=3,
+            serverId="76402e5b20be2c39f095a152090afddc",
+            serverName="Huanglong",
+            roleId=100000001,
+            gameLevel=60,
+            roleName="Rover",
+            isDefault=True,
+            roleNum=20,
+            fashionCollectionPercent=0.5,
+            phantomPercent=0.25,
+            achievementCount=300,
+            actionRecoverSwitch=False,
+        ),
+    ),
+]
+
+
+class TestRecords:
+    @staticmethod
+    @pytest.mark.parametrize(("record_type", "model"), MODELS)
+    def test_round_trip(record_type, model):
+        record = record_type.from_model(model)
+        assert record.to_model() == model
+        assert pickle.loads(pickle.dumps(record)) == record
+        for name in record._fields:
+            if name != "phantom":
+                assert getattr(record, name) == getattr(model, name)
+
+    @staticmethod
+    def test_to_records():
+        wish = MODELS[0][1]
+        records = to_records(MCWishRecord, [wish, None])
+        assert records == [MCWishRecord.from_model(wish), None]
+        assert records[0].time.utcoffset().total_seconds() == 8 * 3600
+        assert to_records(MCWishRecord, None) is None
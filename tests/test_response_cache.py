@@ -0,0 +1,98 @@
+import json
+
+from kuronet.client.components.chronicle.mc import MCBattleChronicleClient
+from kuronet.utils.cache import ResponseCache
+from kuronet.utils.enums import ValidationMode
+from tests.conftest import FakeGameRecord, make_client
+
+ROLE = {
+    "roleId": 1204,
+    "level": 90,
+    "roleName": "Verina",
+    "roleIconUrl": "https://example.com/icon.png",
+    "rolePicUrl": "https://example.com/pic.png",
+    "starLevel": 5,
+    "attributeId": 3,
+    "attributeName": "Spectro",
+    "weaponTypeId": 5,
+    "weaponTypeName": "Rectifier",
+    "acronym": "vrn",
+}
+
+
+def make_server(show_to_guest: bool = True) -> FakeGameRecord:
+    server = FakeGameRecord()
+    server.payloads["roleData"] = json.dumps({"roleList": [ROLE], "showToGuest": show_to_guest})
+    return server
+
+
+class TestResponseCache:
+    @staticmethod
+    def test_allowlist():
+        cache = ResponseCache({"akiBox/roleData": 30.0}, maxsize=1)
+        key = ResponseCache.make_key(1, "https://example.com", None, {"roleId": 1, "list": [1, 2]})
+        assert key == ResponseCache.make_key(1, "https://example.com", None, {"list": [1, 2], "roleId": 1})
+        cache.set("akiBox/baseData", key, "notes")
+        assert cache.get("akiBox/baseData", key) is None
+        cache.set("akiBox/roleData", key, None)
+        assert cache.get("akiBox/roleData", key) is None
+        cache.set("akiBox/roleData", key, "roles")
+        assert cache.get("akiBox/roleData", key) == "roles"
+        cache.set("akiBox/roleData", ResponseCache.make_key(2, "https://example.com", None, None), {"showToGuest": True})
+        assert cache.get("akiBox/roleData", key) is None
+        assert cache.get("akiBox/roleData", ResponseCache.make_key(2, "https://example.com", None, None), 1) is not None
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 2
+        assert cache.stats.evictions == 1
+
+    @staticmethod
+    def test_expiry():
+        cache = ResponseCache({"akiBox/roleData": 0.0})
+        cache.set("akiBox/roleData", "key", "roles")
+        assert cache.get("akiBox/roleData", "key") is None
+
+    @staticmethod
+    async def test_shared_between_clients():
+        server, cache = make_server(), ResponseCache()
+        roles = await make_client(server, MCBattleChronicleClient, response_cache=cache).get_mc_roles()
+        assert await make_client(server, MCBattleChronicleClient, response_cache=cache).get_mc_roles() is roles
+        assert roles.roleList[0].roleName == "Verina"
+        assert server.calls == {"requestToken": 1, "refreshData": 1, "roleData": 1}
+
+    @staticmethod
+    async def test_not_cached_without_ttl():
+        server = make_server()
+        client = make_client(server, MCBattleChronicleClient, response_cache=ResponseCache({}))
+        await client.get_mc_roles(auto_refresh=False)
+        await client.get_mc_roles(auto_refresh=False)
+        assert server.calls["roleData"] == 2
+
+    @staticmethod
+    async def test_private_per_account():
+        server, cache = make_server(show_to_guest=False), ResponseCache()
+        roles = await make_client(server, MCBattleChronicleClient, account_id=1, response_cache=cache).get_mc_roles()
+        other = make_client(server, MCBattleChronicleClient, account_id=1, response_cache=cache)
+        assert await other.get_mc_roles() is roles
+        other = make_client(server, MCBattleChronicleClient, account_id=2, response_cache=cache)
+        assert await other.get_mc_roles() is not roles
+        assert server.calls["roleData"] == 2
+
+    @staticmethod
+    async def test_per_validation_mode():
+        server, cache = make_server(), ResponseCache()
+        trusted = make_client(
+            server, MCBattleChronicleClient, response_cache=cache, validation_mode=ValidationMode.TRUSTED
+        )
+        roles = await trusted.get_mc_roles()
+        assert await make_client(server, MCBattleChronicleClient, response_cache=cache).get_mc_roles() is not roles
+        assert server.calls["roleData"] == 2
+
+    @staticmethod
+    async def test_per_endpoint_type():
+        server = FakeGameRecord()
+        client = make_client(server, response_cache=ResponseCache({"akiBox/echo": 30.0}))
+        role_box = await client.request_game_record("akiBox/echo")
+        widget = await client.request_game_record("akiBox/echo", endpoint_type="gamer/widget")
+        assert role_box["path"] != widget["path"]
+        assert await client.request_game_record("akiBox/echo", endpoint_type="gamer/widget") is widget
+        assert server.calls["echo"] == 2
@@ -0,0 +1,48 @@
+import pytest
+
+from kuronet.client.routes import BBS_URL, GACHA_INFO_URL, BaseRoute, RouteTable
+from kuronet.errors import RegionNotSupported
+from kuronet.utils.enums import Game, Region
+
+
+class TestRouteTable:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "paths",
+        [("aki/roleBox", "akiBox/baseData"), ("aki/roleBox", "../../encourage/signIn/initSignInV2"), ("user/mine",)],
+    )
+    def test_get_url(paths):
+        routes = RouteTable()
+        expected = BBS_URL.get_url(Region.CHINESE)
+        for path in paths:
+            expected = expected / path
+        url = routes.get_url(BBS_URL, *paths, region=Region.CHINESE)
+        assert url == expected
+        assert routes.get_url(BBS_URL, *paths, region=Region.CHINESE) is url
+
+    @staticmethod
+    def test_get_url_game():
+        routes = RouteTable()
+        url = routes.get_url(GACHA_INFO_URL, "gacha/record/query", region=Region.OVERSEAS, game=Game.MC)
+        assert url == GACHA_INFO_URL.get_url(Region.OVERSEAS, Game.MC) / "gacha/record/query"
+
+    @staticmethod
+    def test_maxsize():
+        routes = RouteTable(maxsize=1)
+        routes.get_url(BBS_URL, "user/mine", region=Region.CHINESE)
+        routes.get_url(BBS_URL, "user/mineV2", region=Region.CHINESE)
+        assert len(routes) == 1
+
+    @staticmethod
+    def test_region_not_supported():
+        routes = RouteTable()
+        with pytest.raises(RegionNotSupported):
+            routes.get_url(BBS_URL, "user/mine", region=Region.OVERSEAS)
+        assert len(routes) == 0
+        with pytest.raises(RegionNotSupported):
+            routes.get_url(BBS_URL, "user/mine", region=Region.OVERSEAS)
+
+    @staticmethod
+    def test_base_route_abstract():
+        with pytest.raises(TypeError):
+            BaseRoute()
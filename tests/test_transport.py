@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from kuronet.client import transport as transport_module
+from kuronet.client.transport import SharedTransport
+
+
+class FakePool(httpx.MockTransport):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(self.handle)
+        self.kwargs = kwargs
+        self.requests = []
+        self.closed = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    created = []
+
+    def create(**kwargs):
+        pool = FakePool(**kwargs)
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(transport_module, "AsyncHTTPTransport", create)
+    return created
+
+
+class TestSharedTransport:
+    @staticmethod
+    async def test_reuse_pool_per_host(pools):
+        shared = SharedTransport(max_connections_per_host=10, http2=True)
+        async with (
+            httpx.AsyncClient(transport=shared.attach()) as first,
+            httpx.AsyncClient(transport=shared.attach()) as second,
+        ):
+            await first.get("https://api.kurobbs.com/a")
+            await second.get("https://api.kurobbs.com/b")
+            await second.get("https://pc-launcher.kurogames.com/c")
+            await first.get("http://api.kurobbs.com/d")
+
+        assert shared.hosts == 3
+        assert len(pools) == 3
+        assert [request.url.path for request in pools[0].requests] == ["/a", "/b"]
+        assert pools[0].kwargs == {"limits": shared.limits, "http2": True, "retries": 0}
+        assert shared.get_transport(httpx.Request("GET", "https://api.kurobbs.com/e")) is pools[0]
+
+    @staticmethod
+    async def test_attach_aclose_keeps_pool_open(pools):
+        shared = SharedTransport()
+        handle = shared.attach()
+        async with httpx.AsyncClient(transport=handle) as client:
+            await client.get("https://api.kurobbs.com/a")
+        await handle.aclose()
+
+        assert not shared.is_closed
+        assert shared.hosts == 1
+        assert not pools[0].closed
+        async with httpx.AsyncClient(transport=shared.attach()) as client:
+            response = await client.get("https://api.kurobbs.com/b")
+        assert response.json() == {"host": "api.kurobbs.com"}
+        assert len(pools) == 1
+
+    @staticmethod
+    async def test_aclose(pools):
+        async with SharedTransport() as shared, httpx.AsyncClient(transport=shared.attach()) as client:
+            await client.get("https://api.kurobbs.com/a")
+            await client.get("https://pc-launcher.kurogames.com/b")
+
+        assert shared.is_closed
+        assert shared.hosts == 0
+        assert [pool.closed for pool in pools] == [True, True]
+        await shared.aclose()
+
+        with pytest.raises(RuntimeError):
+            await shared.handle_async_request(httpx.Request("GET", "https://api.kurobbs.com/a"))
@@ -0,0 +1,185 @@
+import json
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from kuronet.client.base import BaseClient
+from kuronet.models.base import APIModel, prewarm_models
+from kuronet.models.mc.chronicle.explorer import MCExplorer
+from kuronet.models.mc.chronicle.role import MCRoles
+from kuronet.models.mc.chronicle.snapshot import MCSnapshot
+from kuronet.models.mc.wish import MCWish
+from kuronet.utils.enums import ValidationMode
+
+
+@pytest.fixture
+def roles():
+    role = {
+        "roleId": 1204,
+        "level": 90,
+        "roleName": "Verina",
+        "roleIconUrl": "https://example.com/icon.png",
+        "rolePicUrl": "https://example.com/pic.png",
+        "starLevel": 5,
+        "attributeId": 3,
+        "attributeName": "Spectro",
+        "weaponTypeId": 5,
+        "weaponTypeName": "Rectifier",
+        "acronym": "vrn",
+    }
+    return {"roleList": [role, {**role, "roleId": 1102}], "showToGuest": True}
+
+
+@pytest.fixture
+def wish():
+    return {
+        "cardPoolType": "Featured Resonator Convene",
+        "resourceId": 1102,
+        "qualityLevel": 5,
+        "resourceType": "Resonators",
+        "name": "Sanhua",
+        "count": 1,
+        "time": "2024-05-23 12:00:00",
+    }
+
+
+@pytest.fixture
+def explorer():
+    country = {
+        "bgColor": "#1D2B38",
+        "countryId": 1,
+        "countryName": "Huanglong",
+        "detailPageAreaMaskColor": "#0B141B",
+        "detailPageAreaPic": "https://example.com/mask.png",
+        "detailPageDarkColor": "#0F1A22",
+        "detailPageFontColor": "#FFFFFF",
+        "detailPageImage": "https://example.com/detail.png",
+        "detailPageLightColor": "#3D5467",
+        "detailPagePic": "https://example.com/pic.png",
+        "detailPageProgressColor": "#E2C479",
+        "homePageIcon": "https://example.com/icon.png",
+        "homePageImage": "https://example.com/home.png",
+    }
+    area = {
+        "areaId": 1,
+        "areaName": "Jinzhou",
+        "areaPic": "https://example.com/area.png",
+        "areaProgress": 87,
+        "itemList": [{"type": 1, "name": "Chest", "progress": 90, "icon": "https://example.com/chest.png"}],
+    }
+    return {
+        "detectionInfoList": [],
+        "exploreList": [{"areaInfoList": [area], "country": country, "countryProgress": "84.3"}],
+        "open": True,
+    }
+
+
+class TestValidationMode:
+    @staticmethod
+    def test_build_model_json(roles):
+        client = BaseClient()
+        assert client.build_model_json(MCRoles, json.dumps(roles)) == client.build_model(MCRoles, roles)
+        assert client.build_model_json(MCRoles, b"null") is None
+        assert client.build_model(MCRoles, None) is None
+
+    @staticmethod
+    def test_build_model_json_list(wish):
+        client = BaseClient()
+        wishes = client.build_model_json(List[MCWish], json.dumps([wish, wish]))
+        assert wishes == client.build_model(List[MCWish], [wish, wish])
+        assert wishes[0].time.utcoffset().total_seconds() == 8 * 3600
+
+    @staticmethod
+    def test_build_model_trusted(roles, wish):
+        client = BaseClient(validation_mode=ValidationMode.TRUSTED)
+        assert client.build_model(MCRoles, roles) == MCRoles.model_validate(roles)
+        wishes = client.build_model(List[MCWish], [wish])
+        assert wishes == [MCWish.model_validate(wish)]
+        assert wishes[0].time.utcoffset().total_seconds() == 8 * 3600
+
+        roles["roleList"][0]["roleName"] = None
+        assert client.build_model(MCRoles, roles).roleList[0].roleName is None
+
+    @staticmethod
+    def test_build_model_trusted_coerce_scalars(roles):
+        roles["roleList"][0]["roleId"] = "1204"
+        roles["roleList"][0]["roleName"] = 1204
+        trusted = MCRoles.construct_trusted(roles)
+        assert trusted.roleList[0].roleId == 1204
+        assert trusted.roleList[0].roleName == "1204"
+        assert trusted == MCRoles.model_validate(roles)
+        assert trusted.model_dump_json() == MCRoles.model_validate(roles).model_dump_json()
+
+    @staticmethod
+    def test_build_model_trusted_sampled(roles, caplog):
+        client = BaseClient(validation_mode=ValidationMode.TRUSTED, validation_sample_rate=1.0)
+        roles["roleList"][0]["roleName"] = None
+        assert client.build_model(MCRoles, roles).roleList[0].roleName is None
+        assert "Response does not match MCRoles" in caplog.text
+
+    @staticmethod
+    def test_validate_lazy(explorer):
+        lazy = MCExplorer.validate_lazy(explorer)
+        assert lazy.open is True
+        assert lazy.exploreList[0].country.countryName == "Huanglong"
+        assert lazy == MCExplorer.model_validate(explorer)
+        assert MCExplorer.validate_lazy(explorer).model_dump() == MCExplorer.model_validate(explorer).model_dump()
+
+    @staticmethod
+    def test_validate_lazy_error_on_access(explorer):
+        del explorer["exploreList"][0]["country"]["countryId"]
+        lazy = MCExplorer.validate_lazy(explorer)
+        assert lazy.exploreList[0].countryProgress == "84.3"
+        with pytest.raises(ValidationError):
+            lazy.exploreList[0].country
+
+    @staticmethod
+    def test_dump_nested_lazy(explorer):
+        snapshot = MCSnapshot(explorer=MCExplorer.validate_lazy(explorer))
+        expected = MCSnapshot(explorer=MCExplorer.model_validate(explorer))
+        assert snapshot.model_dump_json() == expected.model_dump_json()
+        trusted = MCSnapshot(explorer=MCExplorer.construct_trusted(explorer))
+        assert trusted.model_dump() == expected.model_dump()
+
+    @staticmethod
+    def test_lazy_field_class_access(explorer, wish):
+        MCExplorer.validate_lazy(explorer)
+        assert MCExplorer.exploreList is not None
+        MCWish.construct_trusted(wish)
+        assert "__lazy_fields__" not in MCWish.__dict__
+
+    @staticmethod
+    def test_lazy_repr(explorer):
+        explorer["exploreList"][0]["country"]["countryId"] = "not a number"
+        lazy = MCExplorer.validate_lazy(explorer)
+        assert "Huanglong" in repr(lazy)
+        assert "exploreList" in str(lazy)
+        with pytest.raises(ValidationError):
+            lazy.exploreList[0].country
+
+    @staticmethod
+    def test_lazy_field_missing(explorer):
+        class Outer(APIModel):
+            explorer: MCExplorer
+            name: str
+
+        trusted = Outer.construct_trusted({"name": "outer"})
+        assert trusted.name == "outer"
+        assert getattr(trusted, "explorer", None) is None
+        assert not hasattr(trusted, "explorer")
+        with pytest.raises(AttributeError):
+            trusted.explorer
+        assert Outer.construct_trusted({"name": "outer", "explorer": explorer}).explorer.open is True
+
+    @staticmethod
+    def test_prewarm_models(roles):
+        class Roles(APIModel):
+            roleList: List[dict]
+            showToGuest: bool
+
+        assert not Roles.__pydantic_complete__
+        assert prewarm_models([Roles], mode=ValidationMode.TRUSTED) == 1
+        assert Roles.__pydantic_complete__
+        assert "__trusted_plan__" in Roles.__dict__
+        assert Roles.construct_trusted(roles) == Roles.model_validate(roles)